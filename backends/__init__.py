@@ -0,0 +1,25 @@
+from .base import MarketBackend
+from .recorder import RecordingBackend, EventRecorder
+from .simulator import SimulatorBackend
+
+
+def create_backend(name: str = None) -> MarketBackend:
+    """
+    根据配置创建行情/交易后端
+
+    参数:
+        name: longport / record / simulator，默认读取 config.MARKET_BACKEND
+    """
+    from config import MARKET_BACKEND, RECORD_PATH, SIM_SOURCE, SIM_SPEED, SIM_QUOTES_PER_BAR, SIM_LOOP, SYMBOL
+
+    name = name or MARKET_BACKEND
+    if name == "simulator":
+        return SimulatorBackend(source=SIM_SOURCE, speed=SIM_SPEED, symbol=SYMBOL,
+                                quotes_per_bar=SIM_QUOTES_PER_BAR, loop=SIM_LOOP)
+
+    from .longport_backend import LongportBackend
+    if name == "record":
+        return RecordingBackend(LongportBackend(), RECORD_PATH)
+    if name == "longport":
+        return LongportBackend()
+    raise ValueError(f"未知的行情后端: {name}")
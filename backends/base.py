@@ -0,0 +1,24 @@
+class MarketBackend:
+    """
+    行情/交易后端基类
+
+    quote_ctx 与 trade_ctx 需提供与 longport QuoteContext / TradeContext 一致的接口
+    （set_on_quote、set_on_candlestick、subscribe、subscribe_candlesticks、depth、
+    set_on_order_changed、submit_order、estimate_max_purchase_quantity、stock_positions 等）
+    """
+    name = "base"
+
+    @property
+    def quote_ctx(self):
+        raise NotImplementedError
+
+    @property
+    def trade_ctx(self):
+        raise NotImplementedError
+
+    def start(self):
+        """订阅完成后调用，真实后端无需任何操作，模拟器在此开始回放"""
+        pass
+
+    def close(self):
+        pass
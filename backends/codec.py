@@ -0,0 +1,149 @@
+"""
+行情/订单推送事件的序列化与反序列化
+
+录制文件为 JSON Lines，每行一个事件:
+    {"t": 接收时间(Unix秒), "kind": "quote" | "candlestick" | "order_changed", "symbol": "TSLA.US", "data": {...}}
+
+Decimal 以字符串保存以保证精度，datetime 以 ISO 格式保存，
+longport 枚举以 str() 形式保存（如 "OrderSide.Buy"），回放时还原为对应的枚举值。
+"""
+import gzip
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Iterator
+
+from longport import openapi
+
+QUOTE_FIELDS = (
+    "last_done", "open", "high", "low", "timestamp", "volume", "turnover",
+    "trade_status", "trade_session", "current_volume", "current_turnover",
+)
+CANDLESTICK_FIELDS = ("close", "open", "low", "high", "volume", "turnover", "timestamp", "trade_session")
+ORDER_CHANGED_FIELDS = (
+    "side", "stock_name", "submitted_quantity", "symbol", "order_type", "submitted_price",
+    "executed_quantity", "executed_price", "order_id", "currency", "status", "submitted_at",
+    "updated_at", "trigger_price", "msg", "tag", "trigger_status", "trigger_at",
+    "trailing_amount", "trailing_percent", "limit_offset", "account_no", "last_share",
+    "last_price", "remark",
+)
+
+# 需要还原为 Decimal 的字段
+DECIMAL_FIELDS = {
+    "last_done", "open", "high", "low", "close", "turnover", "current_turnover",
+    "submitted_quantity", "submitted_price", "executed_quantity", "executed_price",
+    "trigger_price", "trailing_amount", "trailing_percent", "limit_offset",
+    "last_share", "last_price",
+}
+DATETIME_FIELDS = {"timestamp", "submitted_at", "updated_at", "trigger_at"}
+ENUM_FIELDS = {"trade_status", "trade_session", "period", "side", "order_type", "status", "tag", "trigger_status"}
+
+
+def _encode_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # longport 枚举
+    return str(value)
+
+
+def decode_enum(value: str):
+    cls_name, _, member = value.partition(".")
+    cls = getattr(openapi, cls_name, None)
+    return getattr(cls, member, value) if cls is not None else value
+
+
+def _decode_value(name: str, value):
+    if value is None:
+        return None
+    if name in DECIMAL_FIELDS:
+        return Decimal(value)
+    if name in DATETIME_FIELDS:
+        return datetime.fromisoformat(value)
+    if name in ENUM_FIELDS and isinstance(value, str):
+        return decode_enum(value)
+    return value
+
+
+def _encode_fields(obj, fields) -> dict:
+    return {name: _encode_value(getattr(obj, name, None)) for name in fields}
+
+
+def _decode_fields(data: dict) -> SimpleNamespace:
+    return SimpleNamespace(**{name: _decode_value(name, value) for name, value in data.items()})
+
+
+def encode_quote(event) -> dict:
+    return _encode_fields(event, QUOTE_FIELDS)
+
+
+def encode_candlestick(event) -> dict:
+    return {
+        "period": _encode_value(event.period),
+        "is_confirmed": bool(event.is_confirmed),
+        "candlestick": _encode_fields(event.candlestick, CANDLESTICK_FIELDS),
+    }
+
+
+def encode_order_changed(event) -> dict:
+    return _encode_fields(event, ORDER_CHANGED_FIELDS)
+
+
+def decode_quote(data: dict) -> SimpleNamespace:
+    return _decode_fields(data)
+
+
+def decode_candlestick(data: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        period=_decode_value("period", data["period"]),
+        is_confirmed=data["is_confirmed"],
+        candlestick=_decode_fields(data["candlestick"]),
+    )
+
+
+def decode_order_changed(data: dict) -> SimpleNamespace:
+    return _decode_fields(data)
+
+
+ENCODERS = {
+    "quote": encode_quote,
+    "candlestick": encode_candlestick,
+    "order_changed": encode_order_changed,
+}
+DECODERS = {
+    "quote": decode_quote,
+    "candlestick": decode_candlestick,
+    "order_changed": decode_order_changed,
+}
+
+
+def encode_record(t: float, kind: str, symbol, event) -> str:
+    return json.dumps({"t": t, "kind": kind, "symbol": symbol, "data": ENCODERS[kind](event)}, ensure_ascii=False)
+
+
+def open_recording(path: str, mode: str = "rt"):
+    """按扩展名打开录制文件，.gz 结尾时使用 gzip"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def read_records(path: str) -> Iterator[tuple]:
+    """
+    逐行读取录制文件
+
+    返回:
+        (接收时间, 事件类型, 股票代码, 事件对象) 的迭代器
+    """
+    with open_recording(path, "rt") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            kind = record["kind"]
+            yield record["t"], kind, record.get("symbol"), DECODERS[kind](record["data"])
@@ -0,0 +1,25 @@
+from longport.openapi import Config, QuoteContext, TradeContext
+
+from utils import lazy_property
+from .base import MarketBackend
+
+
+class LongportBackend(MarketBackend):
+    """
+    长桥证券真实行情/交易后端，凭证从环境变量读取
+
+    两个上下文各自需要建立长连接，按需创建，启动时可以并行初始化
+    """
+    name = "longport"
+
+    @lazy_property
+    def config(self):
+        return Config.from_env()
+
+    @lazy_property
+    def quote_ctx(self):
+        return QuoteContext(self.config)
+
+    @lazy_property
+    def trade_ctx(self):
+        return TradeContext(self.config)
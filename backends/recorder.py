@@ -0,0 +1,118 @@
+import logging
+import os
+import queue
+import threading
+import time
+
+from utils import lazy_property
+from .base import MarketBackend
+from .codec import encode_record, open_recording
+
+logger = logging.getLogger(__name__)
+
+
+class EventRecorder:
+    """
+    推送事件录制器
+
+    回调线程只负责把事件放入队列，序列化与写盘在后台线程完成，不阻塞行情回调
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self.recorded = 0
+        self._queue = queue.SimpleQueue()
+        self._file = open_recording(path, "at")
+        self._thread = threading.Thread(target=self._run, name="event-recorder", daemon=True)
+        self._thread.start()
+        logger.info("行情录制已开启，写入 %s", path)
+
+    def record(self, kind: str, symbol, event):
+        self._queue.put((time.time(), kind, symbol, event))
+
+    def wrap(self, kind: str, callback):
+        """包装回调：先录制，再调用原回调"""
+        if kind == "order_changed":
+            def wrapper(event):
+                self.record(kind, getattr(event, "symbol", None), event)
+                return callback(event)
+        else:
+            def wrapper(symbol, event):
+                self.record(kind, symbol, event)
+                return callback(symbol, event)
+        return wrapper
+
+    def _run(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if item is StopIteration:
+                break
+            if item is not None:
+                try:
+                    self._file.write(encode_record(*item) + "\n")
+                    self.recorded += 1
+                except Exception as e:
+                    logger.error(f"录制事件失败: {e}")
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self._file.flush()
+                last_flush = time.monotonic()
+        self._file.flush()
+        self._file.close()
+
+    def close(self):
+        self._queue.put(StopIteration)
+        self._thread.join()
+        logger.info("行情录制已结束，共录制 %d 条事件", self.recorded)
+
+
+class _RecordingContext:
+    """代理 longport 上下文，拦截回调注册，其余调用原样转发"""
+
+    def __init__(self, inner, recorder: EventRecorder, callbacks: dict):
+        self._inner = inner
+        self._recorder = recorder
+        self._callbacks = callbacks
+
+    def __getattr__(self, name):
+        kind = self._callbacks.get(name)
+        attr = getattr(self._inner, name)
+        if kind is None:
+            return attr
+        return lambda callback: attr(self._recorder.wrap(kind, callback))
+
+
+class RecordingBackend(MarketBackend):
+    """在任意后端外层录制 PushQuote / PushCandlestick / PushOrderChanged 推送"""
+    name = "record"
+
+    def __init__(self, inner: MarketBackend, path: str):
+        self.inner = inner
+        self.recorder = EventRecorder(path)
+
+    @lazy_property
+    def quote_ctx(self):
+        return _RecordingContext(self.inner.quote_ctx, self.recorder, {
+            "set_on_quote": "quote",
+            "set_on_candlestick": "candlestick",
+        })
+
+    @lazy_property
+    def trade_ctx(self):
+        return _RecordingContext(self.inner.trade_ctx, self.recorder, {
+            "set_on_order_changed": "order_changed",
+        })
+
+    def start(self):
+        self.inner.start()
+
+    def close(self):
+        self.inner.close()
+        self.recorder.close()
@@ -0,0 +1,432 @@
+"""
+本地行情/交易模拟器
+
+回放录制文件或合成行情，并模拟订单确认与成交，无需连接券商即可对整条链路进行压测。
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, Iterator, Optional
+
+from longport.openapi import OrderSide, OrderStatus, OrderTag, OrderType, TriggerStatus
+
+from metrics import SIMULATOR_EVENTS, SIMULATOR_REPLAY_LAG
+from .base import MarketBackend
+from .codec import read_records
+
+logger = logging.getLogger(__name__)
+
+MIN_SPEED = 1
+MAX_SPEED = 1000
+TICK = Decimal("0.01")
+TRIGGER_ORDER_TYPES = {str(OrderType.MIT), str(OrderType.LIT)}
+MARKET_ORDER_TYPES = {str(OrderType.MO), str(OrderType.MIT)}
+
+
+def recording_source(path: str) -> Iterator[tuple]:
+    """录制文件事件源，录制中的订单推送由模拟器自行生成，回放时跳过"""
+    for t, kind, symbol, event in read_records(path):
+        if kind == "order_changed":
+            continue
+        yield t, kind, symbol, event
+
+
+def synthetic_source(symbol: str, bars: int = 10000, quotes_per_bar: int = 60,
+                     period_seconds: int = 120, period: str = "Period.Min_2", seed: int = 42) -> Iterator[tuple]:
+    """
+    合成事件源
+
+    每笔行情之后推送一次未确认的K线更新，K线结束时推送确认K线，与实盘推送顺序一致
+    """
+    from .synthetic import generate_bars, quote_events
+    from .codec import decode_enum
+
+    period_enum = decode_enum(period)
+    data = generate_bars(bars, period_seconds=period_seconds, seed=seed)
+    bar_index = 0
+    bar_start = data.timestamp[0]
+    bar_end = bar_start + timedelta(seconds=period_seconds)
+    ohlc = None
+    volume = 0
+    turnover = Decimal(0)
+
+    def candle(is_confirmed: bool):
+        o, h, l, c = ohlc
+        return SimpleNamespace(
+            period=period_enum,
+            is_confirmed=is_confirmed,
+            candlestick=SimpleNamespace(open=o, high=h, low=l, close=c, volume=volume, turnover=turnover,
+                                        timestamp=bar_start, trade_session=None),
+        )
+
+    for quote in quote_events(data, quotes_per_bar=quotes_per_bar, period_seconds=period_seconds, seed=seed):
+        if quote.timestamp >= bar_end:
+            yield bar_end.timestamp(), "candlestick", symbol, candle(True)
+            bar_index += 1
+            bar_start = data.timestamp[bar_index]
+            bar_end = bar_start + timedelta(seconds=period_seconds)
+            ohlc, volume, turnover = None, 0, Decimal(0)
+        price = quote.last_done
+        if ohlc is None:
+            ohlc = [price, price, price, price]
+        else:
+            ohlc = [ohlc[0], max(ohlc[1], price), min(ohlc[2], price), price]
+        volume += quote.current_volume
+        turnover += quote.current_turnover
+        t = quote.timestamp.timestamp()
+        yield t, "quote", symbol, quote
+        yield t, "candlestick", symbol, candle(False)
+    if ohlc is not None:
+        yield bar_end.timestamp(), "candlestick", symbol, candle(True)
+
+
+class _Scheduler:
+    """单线程定时任务调度，用于模拟订单确认/成交延迟"""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="simulator-scheduler", daemon=True)
+        self._thread.start()
+
+    def call_later(self, delay: float, func: Callable, *args):
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), func, args))
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+                if self._stopped:
+                    return
+                _, _, func, args = heapq.heappop(self._heap)
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"模拟器任务执行失败: {e}", exc_info=True)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+
+
+class SimulatedExchange:
+    """
+    简单撮合模型
+
+    - 市价单按最新价成交
+    - 限价单在最新价优于限价时按最新价成交，否则挂单等待后续行情
+    - MIT/LIT 触发单在价格触及触发价后转为市价/限价单
+    """
+
+    def __init__(self, cash: Decimal, ack_latency: float, fill_latency: float):
+        self.cash = cash
+        self.ack_latency = ack_latency
+        self.fill_latency = fill_latency
+        self.positions = {}
+        self.last_prices = {}
+        self.orders = {}
+        self.on_order_changed: Optional[Callable] = None
+        self._order_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._scheduler = _Scheduler()
+
+    def submit(self, symbol: str, order_type, side, submitted_quantity, submitted_price=None,
+               trigger_price=None, remark=None) -> str:
+        order_id = f"SIM{next(self._order_ids):012d}"
+        now = datetime.now()
+        order = SimpleNamespace(
+            order_id=order_id, symbol=symbol, stock_name=symbol, order_type=order_type, side=side,
+            submitted_quantity=Decimal(submitted_quantity),
+            submitted_price=Decimal(submitted_price) if submitted_price is not None else None,
+            trigger_price=Decimal(trigger_price) if trigger_price is not None else None,
+            executed_quantity=Decimal(0), executed_price=None, status=OrderStatus.NotReported,
+            submitted_at=now, updated_at=now, remark=remark or "",
+            trigger_status=TriggerStatus.Deactive if str(order_type) in TRIGGER_ORDER_TYPES else None,
+            trigger_at=None, trigger_side=None,
+        )
+        with self._lock:
+            self.orders[order_id] = order
+            last = self.last_prices.get(symbol)
+            if order.trigger_price is not None and last is not None:
+                # 记录提交时价格位于触发价的哪一侧，价格触及时触发
+                order.trigger_side = (last > order.trigger_price) - (last < order.trigger_price)
+        self._scheduler.call_later(self.ack_latency, self._acknowledge, order_id)
+        return order_id
+
+    def cancel(self, order_id: str):
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None or order.status in (OrderStatus.Filled, OrderStatus.Canceled):
+                return
+            order.status = OrderStatus.Canceled
+            order.updated_at = datetime.now()
+        self._publish(order)
+
+    def _acknowledge(self, order_id: str):
+        with self._lock:
+            order = self.orders[order_id]
+            if order.status != OrderStatus.NotReported:
+                return
+            order.status = OrderStatus.New
+            order.updated_at = datetime.now()
+        self._publish(order)
+        self._match(order.symbol)
+
+    def on_price(self, symbol: str, price: Decimal):
+        with self._lock:
+            self.last_prices[symbol] = price
+        self._match(symbol)
+
+    def _match(self, symbol: str):
+        fills = []
+        with self._lock:
+            last = self.last_prices.get(symbol)
+            if last is None:
+                return
+            for order in self.orders.values():
+                if order.symbol != symbol or order.status != OrderStatus.New:
+                    continue
+                if order.trigger_status == TriggerStatus.Deactive:
+                    side = (last > order.trigger_price) - (last < order.trigger_price)
+                    if order.trigger_side is None:
+                        order.trigger_side = side
+                    if side != order.trigger_side or side == 0:
+                        order.trigger_status = TriggerStatus.Released
+                        order.trigger_at = datetime.now()
+                    else:
+                        continue
+                price = self._fill_price(order, last)
+                if price is not None:
+                    order.status = OrderStatus.PartialFilled  # 标记为成交中，避免重复撮合
+                    fills.append((order.order_id, price))
+        for order_id, price in fills:
+            self._scheduler.call_later(self.fill_latency, self._fill, order_id, price)
+
+    @staticmethod
+    def _fill_price(order, last: Decimal) -> Optional[Decimal]:
+        if str(order.order_type) in MARKET_ORDER_TYPES or order.submitted_price is None:
+            return last
+        if order.side == OrderSide.Buy and last <= order.submitted_price:
+            return last
+        if order.side == OrderSide.Sell and last >= order.submitted_price:
+            return last
+        return None
+
+    def _fill(self, order_id: str, price: Decimal):
+        with self._lock:
+            order = self.orders[order_id]
+            if order.status == OrderStatus.Canceled:
+                return
+            quantity = order.submitted_quantity
+            sign = 1 if order.side == OrderSide.Buy else -1
+            self.positions[order.symbol] = self.positions.get(order.symbol, Decimal(0)) + sign * quantity
+            self.cash -= sign * quantity * price
+            order.status = OrderStatus.Filled
+            order.executed_quantity = quantity
+            order.executed_price = price
+            order.updated_at = datetime.now()
+        self._publish(order, last_share=quantity, last_price=price)
+
+    def _publish(self, order, last_share=None, last_price=None):
+        callback = self.on_order_changed
+        if callback is None:
+            return
+        # 推送中的 submitted_price 始终为 Decimal：市价单在成交前与 SDK 一样为 0，成交后为成交价，
+        # 以便按提交价计算止损价的回调可以直接使用
+        submitted_price = order.submitted_price
+        if submitted_price is None:
+            submitted_price = order.executed_price if order.executed_price is not None else Decimal(0)
+        callback(SimpleNamespace(
+            side=order.side, stock_name=order.stock_name, submitted_quantity=order.submitted_quantity,
+            symbol=order.symbol, order_type=order.order_type, submitted_price=submitted_price,
+            executed_quantity=order.executed_quantity, executed_price=order.executed_price,
+            order_id=order.order_id, currency="USD", status=order.status, submitted_at=order.submitted_at,
+            updated_at=order.updated_at, trigger_price=order.trigger_price, msg="", tag=OrderTag.Normal,
+            trigger_status=order.trigger_status, trigger_at=order.trigger_at, trailing_amount=None,
+            trailing_percent=None, limit_offset=None, account_no="SIMULATOR",
+            last_share=last_share, last_price=last_price, remark=order.remark,
+        ))
+
+    def stop(self):
+        self._scheduler.stop()
+
+
+class SimQuoteContext:
+    """模拟 QuoteContext"""
+
+    def __init__(self, exchange: SimulatedExchange):
+        self.exchange = exchange
+        self.on_quote = None
+        self.on_candlestick = None
+        self.quote_symbols = set()
+        self.candlestick_symbols = set()
+
+    def set_on_quote(self, callback):
+        self.on_quote = callback
+
+    def set_on_candlestick(self, callback):
+        self.on_candlestick = callback
+
+    def subscribe(self, symbols, sub_types, is_first_push: bool = False):
+        self.quote_symbols.update(symbols)
+
+    def unsubscribe(self, symbols, sub_types):
+        self.quote_symbols.difference_update(symbols)
+
+    def subscribe_candlesticks(self, symbol, period, *args, **kwargs):
+        self.candlestick_symbols.add(symbol)
+        return []
+
+    def unsubscribe_candlesticks(self, symbol, period):
+        self.candlestick_symbols.discard(symbol)
+
+    def depth(self, symbol):
+        last = self.exchange.last_prices.get(symbol)
+        if last is None:
+            return SimpleNamespace(symbol=symbol, asks=[], bids=[])
+        return SimpleNamespace(
+            symbol=symbol,
+            asks=[SimpleNamespace(position=1, price=last + TICK, volume=100, order_num=1)],
+            bids=[SimpleNamespace(position=1, price=last - TICK, volume=100, order_num=1)],
+        )
+
+
+class SimTradeContext:
+    """模拟 TradeContext"""
+
+    def __init__(self, exchange: SimulatedExchange):
+        self.exchange = exchange
+
+    def set_on_order_changed(self, callback):
+        self.exchange.on_order_changed = callback
+
+    def subscribe(self, topics):
+        pass
+
+    def submit_order(self, symbol, order_type, side, submitted_quantity, time_in_force,
+                     submitted_price=None, trigger_price=None, remark=None, **kwargs):
+        order_id = self.exchange.submit(symbol, order_type, side, submitted_quantity,
+                                        submitted_price=submitted_price, trigger_price=trigger_price, remark=remark)
+        return SimpleNamespace(order_id=order_id)
+
+    def cancel_order(self, order_id):
+        self.exchange.cancel(order_id)
+
+    def estimate_max_purchase_quantity(self, symbol, order_type, side, price=None, **kwargs):
+        price = price or self.exchange.last_prices.get(symbol)
+        quantity = int(self.exchange.cash / price) if price else 0
+        return SimpleNamespace(cash_max_qty=Decimal(quantity), margin_max_qty=Decimal(quantity))
+
+    def stock_positions(self, symbols=None):
+        positions = [
+            SimpleNamespace(symbol=symbol, symbol_name=symbol, quantity=quantity, available_quantity=quantity,
+                            currency="USD", cost_price=Decimal(0), market="US")
+            for symbol, quantity in self.exchange.positions.items()
+            if symbols is None or symbol in symbols
+        ]
+        return SimpleNamespace(channels=[SimpleNamespace(account_channel="simulator", positions=positions)])
+
+
+class SimulatorBackend(MarketBackend):
+    """
+    模拟后端
+
+    参数:
+        source: 录制文件路径，或 "synthetic" 使用合成行情
+        speed: 回放倍速（1~1000），0 表示不限速
+        symbol: 合成行情使用的股票代码
+        quotes_per_bar: 合成行情每根K线的行情推送数量
+        cash: 模拟账户现金
+        ack_latency / fill_latency: 订单确认/成交延迟（秒）
+        loop: 回放结束后是否从头开始
+    """
+    name = "simulator"
+
+    def __init__(self, source: str = "synthetic", speed: float = 1, symbol: str = "TSLA.US",
+                 quotes_per_bar: int = 60, cash: Decimal = Decimal(100000),
+                 ack_latency: float = 0.005, fill_latency: float = 0.02, loop: bool = False):
+        if speed != 0 and not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValueError(f"回放倍速必须在 {MIN_SPEED}~{MAX_SPEED} 之间（0 表示不限速）")
+        self.source = source
+        self.speed = speed
+        self.symbol = symbol
+        self.quotes_per_bar = quotes_per_bar
+        self.loop = loop
+        self.exchange = SimulatedExchange(Decimal(cash), ack_latency, fill_latency)
+        self._quote_ctx = SimQuoteContext(self.exchange)
+        self._trade_ctx = SimTradeContext(self.exchange)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def quote_ctx(self):
+        return self._quote_ctx
+
+    @property
+    def trade_ctx(self):
+        return self._trade_ctx
+
+    def _events(self) -> Iterator[tuple]:
+        if self.source == "synthetic":
+            return synthetic_source(self.symbol, quotes_per_bar=self.quotes_per_bar)
+        return recording_source(self.source)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="simulator-replay", daemon=True)
+        self._thread.start()
+        logger.info("模拟器开始回放: %s，倍速 %s", self.source, self.speed or "不限速")
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            count = self._replay()
+            logger.info("模拟器回放结束，共 %d 条事件", count)
+            if not self.loop:
+                break
+
+    def _replay(self) -> int:
+        quote_ctx = self._quote_ctx
+        count = 0
+        first_t = None
+        wall_start = time.monotonic()
+        for t, kind, symbol, event in self._events():
+            if self._stop_event.is_set():
+                break
+            if first_t is None:
+                first_t = t
+            if self.speed:
+                delay = wall_start + (t - first_t) / self.speed - time.monotonic()
+                SIMULATOR_REPLAY_LAG.set(max(-delay, 0))
+                if delay > 0:
+                    self._stop_event.wait(delay)
+            if kind == "quote":
+                self.exchange.on_price(symbol, event.last_done)
+                if symbol in quote_ctx.quote_symbols and quote_ctx.on_quote is not None:
+                    quote_ctx.on_quote(symbol, event)
+            elif kind == "candlestick":
+                if symbol in quote_ctx.candlestick_symbols and quote_ctx.on_candlestick is not None:
+                    quote_ctx.on_candlestick(symbol, event)
+            SIMULATOR_EVENTS.inc()
+            count += 1
+        SIMULATOR_REPLAY_LAG.set(0)
+        return count
+
+    def close(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.exchange.stop()
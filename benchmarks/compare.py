@@ -0,0 +1,74 @@
+"""
+对比两次基准测试结果
+
+用法:
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.1]
+
+吞吐类指标（*_per_sec）下降、延迟类指标（*_ms）上升超过阈值时视为回退，存在回退时以非零状态码退出。
+"""
+import argparse
+import json
+import sys
+
+
+def flatten(data, prefix=""):
+    items = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            items.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            items[path] = float(value)
+    return items
+
+
+def direction(path: str) -> int:
+    """返回 1 表示越大越好，-1 表示越小越好，0 表示不参与比较"""
+    name = path.rsplit(".", 1)[-1]
+    if name.endswith("_per_sec"):
+        return 1
+    if name.endswith("_ms") or name.endswith("_mb"):
+        return -1
+    return 0
+
+
+def compare(baseline: dict, current: dict, threshold: float):
+    base = flatten(baseline.get("results", {}))
+    curr = flatten(current.get("results", {}))
+    rows, regressions = [], []
+    for path in sorted(base.keys() & curr.keys()):
+        sign = direction(path)
+        if sign == 0 or base[path] == 0:
+            continue
+        change = (curr[path] - base[path]) / base[path]
+        regressed = change * sign < -threshold
+        rows.append((path, base[path], curr[path], change, regressed))
+        if regressed:
+            regressions.append(path)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="对比两次基准测试结果")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1, help="判定回退的相对变化阈值，默认 10%%")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    rows, regressions = compare(baseline, current, args.threshold)
+    width = max((len(r[0]) for r in rows), default=10)
+    for path, before, after, change, regressed in rows:
+        flag = "  <-- 回退" if regressed else ""
+        print(f"{path:<{width}}  {before:>14.3f}  {after:>14.3f}  {change:>+8.1%}{flag}")
+    if regressions:
+        print(f"\n共 {len(regressions)} 项指标回退超过 {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+基准测试入口
+
+用法:
+    python -m benchmarks.run                           # SQLite 替身，默认规模
+    python -m benchmarks.run --backend mysql           # 使用 DB_CONFIG 指向的本地 MySQL（请使用独立的测试库）
+    python -m benchmarks.run --sizes 10000,1000000,10000000 --output bench.json
+
+结果以 JSON 输出，可用 python -m benchmarks.compare 对比两次运行的差异。
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from config import PERIOD
+from db import CandlestickDataManager
+from backends.synthetic import generate_bars, candlestick_events, quote_events
+from benchmarks.synthetic import candlestick_rows
+from benchmarks.sqlite_db import SQLiteDBManager
+
+logger = logging.getLogger(__name__)
+
+BENCH_SYMBOL = "BENCH.US"
+
+INSERT_CANDLESTICK_SQL = """
+    INSERT INTO t_candlesticks (
+        stock_code, period, is_confirmed, open, high, low, close, volume, turnover, timestamp
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+
+
+def latency_stats(samples) -> dict:
+    """将耗时样本（秒）汇总为毫秒统计"""
+    arr = np.asarray(samples, dtype=float) * 1000
+    return {
+        "count": int(arr.size),
+        "mean_ms": float(arr.mean()),
+        "p50_ms": float(np.percentile(arr, 50)),
+        "p99_ms": float(np.percentile(arr, 99)),
+        "max_ms": float(arr.max()),
+    }
+
+
+def current_rss_mb():
+    """
+    进程当前常驻内存（MB），读取 /proc/self/statm，不支持的平台返回 None
+
+    不使用 ru_maxrss：它是整个进程的峰值，会被之前的基准（如写入大量数据）抬高
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return ""
+
+
+class Backend:
+    """为每个规模创建干净的数据库"""
+
+    def __init__(self, kind: str, workdir: str):
+        self.kind = kind
+        self.workdir = workdir
+
+    def fresh(self, name: str):
+        if self.kind == "sqlite":
+            path = os.path.join(self.workdir, f"{name}.sqlite")
+            if os.path.exists(path):
+                os.remove(path)
+            return SQLiteDBManager(path)
+        from db.db_manager import DBManager
+        db = DBManager()
+        # 只清理基准测试使用的股票代码，避免误删真实数据
+        db.save("DELETE FROM t_candlesticks WHERE stock_code LIKE %s", ("BENCH%",))
+        db.save("DELETE FROM t_quotes WHERE stock_code LIKE %s", ("BENCH%",))
+        return db
+
+    def release(self, db):
+        if hasattr(db, "close"):
+            db.close()
+
+
+def seed_candlesticks(db, rows: int, symbols: int, updates_per_bar: int, chunk: int = 50000) -> dict:
+    """
+    批量写入 rows 行K线数据，分布在 symbols 个股票代码上，返回时间范围
+    """
+    bars_per_symbol = max(rows // (symbols * updates_per_bar), 1)
+    bars = generate_bars(bars_per_symbol)
+    for s in range(symbols):
+        symbol = BENCH_SYMBOL if s == 0 else f"BENCH{s}.US"
+        batch = []
+        for row in candlestick_rows(symbol, PERIOD, bars, updates_per_bar):
+            batch.append(row)
+            if len(batch) >= chunk:
+                db.save_many(INSERT_CANDLESTICK_SQL, batch)
+                batch = []
+        if batch:
+            db.save_many(INSERT_CANDLESTICK_SQL, batch)
+    return {"bars": bars_per_symbol, "timestamps": bars.timestamp}
+
+
+def bench_ingest(backend: Backend, events: int) -> dict:
+    """CandlestickDataManager 逐条写入吞吐（与实时回调路径一致）"""
+    db = backend.fresh("ingest")
+    manager = CandlestickDataManager(db_manager=db, spool_dir=os.path.join(backend.workdir, "spool"))
+    bars = generate_bars(max(events // 20, 1))
+    result = {}
+
+    candles = list(candlestick_events(bars, PERIOD, updates_per_bar=20))[:events]
+    start = time.perf_counter()
+    for event in candles:
+        manager.save_candlestick_data(BENCH_SYMBOL, event)
+    elapsed = time.perf_counter() - start
+    result["candlestick_rows_per_sec"] = len(candles) / elapsed
+
+    quotes = list(quote_events(bars, quotes_per_bar=20))[:events]
+    start = time.perf_counter()
+    for event in quotes:
+        manager.save_quote_data(BENCH_SYMBOL, event)
+    elapsed = time.perf_counter() - start
+    result["quote_rows_per_sec"] = len(quotes) / elapsed
+    result["events"] = events
+
+    manager.close()
+    backend.release(db)
+    return result
+
+
+def bench_query(backend: Backend, size: int, iterations: int, window_bars: int, full_scan_max_rows: int) -> dict:
+    """get_candlestick_data 在不同数据量下的延迟分布"""
+    db = backend.fresh(f"query_{size}")
+    seed_start = time.perf_counter()
+    span = seed_candlesticks(db, size, symbols=4, updates_per_bar=5)
+    seed_elapsed = time.perf_counter() - seed_start
+    manager = CandlestickDataManager(db_manager=db)
+
+    rng = random.Random(size)
+    timestamps = span["timestamps"]
+
+    def random_window():
+        # 窗口从某根K线开始，覆盖 window_bars 根K线，模拟图表按时间范围取数
+        i = rng.randrange(max(len(timestamps) - window_bars, 1))
+        end = timestamps[min(i + window_bars, len(timestamps)) - 1]
+        return timestamps[i].strftime("%Y-%m-%d %H:%M:%S"), end.strftime("%Y-%m-%d %H:%M:%S")
+
+    result = {"rows": size, "seed_rows_per_sec": size / seed_elapsed}
+    for realtime in (False, True):
+        samples, returned = [], 0
+        for _ in range(iterations):
+            start_time, end_time = random_window()
+            t = time.perf_counter()
+            rows = manager.get_candlestick_data(BENCH_SYMBOL, realtime=realtime, startTime=start_time, endTime=end_time)
+            samples.append(time.perf_counter() - t)
+            returned += len(rows)
+        stats = latency_stats(samples)
+        stats["avg_rows_returned"] = returned / iterations
+        result["window_realtime" if realtime else "window_confirmed"] = stats
+
+    # 不带时间范围的全量查询在大表上可能非常慢，只在小规模下测量
+    if size <= full_scan_max_rows:
+        samples = []
+        for _ in range(max(iterations // 10, 1)):
+            t = time.perf_counter()
+            manager.get_candlestick_data(BENCH_SYMBOL)
+            samples.append(time.perf_counter() - t)
+        result["full_history_confirmed"] = latency_stats(samples)
+
+    backend.release(db)
+    return result
+
+
+def bench_detectors(bars_count: int) -> dict:
+    """各形态检测器的吞吐（根/秒）"""
+    import patterns
+    from patterns import CandleData
+
+    bars = generate_bars(bars_count)
+    candles = [
+        CandleData(open=float(o), high=float(h), low=float(l), close=float(c))
+        for o, h, l, c in zip(bars.open, bars.high, bars.low, bars.close)
+    ]
+    result = {}
+    for name in ("HammerPatternDetector", "DojiPatternDetector", "InvertedHammerPatternDetector"):
+        detector = getattr(patterns, name)()
+        try:
+            detected = 0
+            start = time.perf_counter()
+            for candle in candles:
+                if detector.detect(candle).is_detected:
+                    detected += 1
+            elapsed = time.perf_counter() - start
+            result[name] = {"bars_per_sec": len(candles) / elapsed, "detected": detected}
+        except Exception as e:
+            result[name] = {"error": f"{type(e).__name__}: {e}"}
+
+    # 全部内置规则一起求值：批量扫描共享派生列，实时求值共享环形缓冲区
+    from patterns import builtin_rules
+    rules = builtin_rules()
+    data = {"open": bars.open, "high": bars.high, "low": bars.low, "close": bars.close, "volume": bars.volume}
+    start = time.perf_counter()
+    matched = rules.scan(data)
+    scan_elapsed = time.perf_counter() - start
+    stream = rules.stream()
+    start = time.perf_counter()
+    for candle in candles:
+        stream.update(candle)
+    stream_elapsed = time.perf_counter() - start
+    result["rules"] = {
+        "count": len(rules),
+        "scan_bars_per_sec": len(candles) / scan_elapsed,
+        "stream_bars_per_sec": len(candles) / stream_elapsed,
+        "detected": {name: int(hits.sum()) for name, hits in matched.items()},
+    }
+    return result
+
+
+def bench_indicators(bars_count: int) -> dict:
+    """指标增量更新与批量计算的吞吐（根/秒）"""
+    from indicators import SMA, EMA, ATR, RSI, VWAP, RollingHigh, RollingLow
+    from patterns import CandleData
+
+    bars = generate_bars(bars_count)
+    data = {"open": bars.open, "high": bars.high, "low": bars.low, "close": bars.close, "volume": bars.volume}
+    candles = [
+        CandleData(open=float(o), high=float(h), low=float(l), close=float(c), volume=float(v))
+        for o, h, l, c, v in zip(bars.open, bars.high, bars.low, bars.close, bars.volume)
+    ]
+    result = {}
+    for indicator in (SMA(20), EMA(20), ATR(14), RSI(14), VWAP(), RollingHigh(20), RollingLow(20)):
+        start = time.perf_counter()
+        indicator.batch({k: v.copy() for k, v in data.items()})
+        batch_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        for candle in candles:
+            indicator.update(candle)
+        stream_elapsed = time.perf_counter() - start
+        result[indicator.key] = {
+            "batch_bars_per_sec": len(candles) / batch_elapsed,
+            "stream_bars_per_sec": len(candles) / stream_elapsed,
+        }
+    return result
+
+
+def bench_api(backend: Backend, size: int, iterations: int) -> dict:
+    """/api/candlestick 响应时间与单次请求的内存峰值"""
+    from runtime import Runtime
+    from web import create_app
+
+    db = backend.fresh(f"api_{size}")
+    seed_candlesticks(db, size, symbols=1, updates_per_bar=5)
+    app, _ = create_app(Runtime(symbol=BENCH_SYMBOL, candlestick_data_manager=CandlestickDataManager(db_manager=db)))
+
+    client = app.test_client()
+    rss_before = current_rss_mb()
+    result = {"rows": size}
+    for name, time_value in (("history", ""), ("realtime", "realtime")):
+        body = {"time": time_value, "startTime": "", "endTime": ""}
+        samples, payload = [], 0
+        for _ in range(iterations):
+            t = time.perf_counter()
+            resp = client.post('/api/candlestick', json=body)
+            samples.append(time.perf_counter() - t)
+            payload = len(resp.data)
+        stats = latency_stats(samples)
+        stats["response_bytes"] = payload
+        # 单独再请求一次统计 Python 分配的峰值，避免 tracemalloc 的开销影响上面的耗时
+        tracemalloc.start()
+        client.post('/api/candlestick', json=body)
+        stats["peak_alloc_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+        result[name] = stats
+    rss_after = current_rss_mb()
+    result["rss_mb"] = rss_after
+    result["rss_growth_mb"] = rss_after - rss_before if rss_before is not None else None
+
+    backend.release(db)
+    return result
+
+
+def bench_scanner(backend: Backend, symbols: int, bars_count: int, workers: int) -> dict:
+    """股票列表扫描：首次加载、每根新K线的增量扫描耗时，与一个K线周期对比"""
+    from scanner import Scanner, period_seconds
+
+    db = backend.fresh(f"scanner_{symbols}")
+    watchlist = [f"BENCH{s}.US" for s in range(symbols)]
+    latest_rows = []
+    for s, symbol in enumerate(watchlist):
+        # 每个股票使用不同的随机种子；最后一根K线留到增量扫描前写入
+        rows = list(candlestick_rows(symbol, PERIOD, generate_bars(bars_count + 1, seed=s)))
+        db.save_many(INSERT_CANDLESTICK_SQL, rows[:-1])
+        latest_rows.append(rows[-1])
+    now = latest_rows[0][-1] + timedelta(minutes=1)
+
+    def summary(scan: dict) -> dict:
+        return {
+            "load_seconds": scan["load_seconds"],
+            "evaluate_seconds": scan["evaluate_seconds"],
+            "duration_seconds": scan["duration_seconds"],
+            "loaded": scan["loaded"],
+            "matched": len(scan["rows"]),
+        }
+
+    result = {"symbols": symbols, "bars_per_symbol": bars_count, "period_seconds": period_seconds(PERIOD)}
+    for name, pool_size in (("inline", 1), ("pool", workers or os.cpu_count() or 1)):
+        scanner = Scanner(CandlestickDataManager(db_manager=db), watchlist, workers=pool_size)
+        start = time.perf_counter()
+        scanner.warm_up()
+        warm_up = time.perf_counter() - start
+        cold = scanner.scan(now=now)
+        db.save_many(INSERT_CANDLESTICK_SQL, latest_rows)
+        incremental = scanner.scan(now=now)
+        db.save("DELETE FROM t_candlesticks WHERE timestamp = %s AND stock_code LIKE %s",
+                (latest_rows[0][-1], "BENCH%"))
+        scanner.close()
+        result[name] = {
+            "workers": pool_size,
+            "warm_up_seconds": warm_up,
+            "cold": summary(cold),
+            "incremental": summary(incremental),
+            "within_period": incremental["duration_seconds"] < result["period_seconds"],
+        }
+
+    backend.release(db)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TradingCandlestick 基准测试")
+    parser.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--sizes", default="10000,1000000,10000000", help="查询基准的表行数，逗号分隔")
+    parser.add_argument("--iterations", type=int, default=200, help="每项延迟测量的请求次数")
+    parser.add_argument("--ingest-events", type=int, default=20000)
+    parser.add_argument("--detector-bars", type=int, default=200000)
+    parser.add_argument("--window-bars", type=int, default=195, help="窗口查询的K线根数，默认一个交易日的2分钟K线")
+    parser.add_argument("--full-scan-max-rows", type=int, default=100000)
+    parser.add_argument("--api-rows", type=int, default=50000)
+    parser.add_argument("--scan-symbols", type=int, default=500, help="扫描基准的股票数量")
+    parser.add_argument("--scan-bars", type=int, default=300, help="扫描基准每个股票的K线根数")
+    parser.add_argument("--scan-workers", type=int, default=0, help="扫描基准的进程池大小，默认与 CPU 核数相同")
+    parser.add_argument("--only", default="ingest,query,detect,api,scan", help="只运行指定的基准，逗号分隔")
+    parser.add_argument("--workdir", default=None, help="SQLite 数据文件目录，默认使用临时目录")
+    parser.add_argument("--output", default=None, help="结果 JSON 输出路径，默认输出到标准输出")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    only = set(args.only.split(","))
+    workdir = args.workdir or tempfile.mkdtemp(prefix="tc-bench-")
+    backend = Backend(args.backend, workdir)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "args": vars(args),
+        },
+        "results": {},
+    }
+    results = report["results"]
+
+    if "ingest" in only:
+        logger.info("运行写入基准...")
+        results["ingest"] = bench_ingest(backend, args.ingest_events)
+    if "query" in only:
+        results["query"] = {}
+        for size in (int(s) for s in args.sizes.split(",") if s):
+            logger.info("运行查询基准，数据量 %d ...", size)
+            results["query"][str(size)] = bench_query(backend, size, args.iterations, args.window_bars, args.full_scan_max_rows)
+    if "detect" in only:
+        logger.info("运行形态检测基准...")
+        results["detect"] = bench_detectors(args.detector_bars)
+        results["indicators"] = bench_indicators(args.detector_bars)
+    if "api" in only:
+        logger.info("运行接口基准...")
+        results["api"] = bench_api(backend, args.api_rows, max(args.iterations // 10, 5))
+    if "scan" in only:
+        logger.info("运行扫描器基准...")
+        results["scan"] = bench_scanner(backend, args.scan_symbols, args.scan_bars, args.scan_workers)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        logger.info("结果已写入 %s", args.output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
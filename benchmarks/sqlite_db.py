@@ -0,0 +1,98 @@
+"""
+SQLite 替身数据库
+
+与 DBManager 接口一致（save / save_many / query），用于在没有 MySQL 的环境下运行基准测试。
+表结构与 scripts/init.sql 保持一致（SQLite 不支持分区，只保留索引），SQL 中的 %s 占位符会被转换为 ?。
+"""
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from decimal import Decimal
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS t_quotes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stock_code VARCHAR(10) NOT NULL,
+    last_done REAL NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    turnover REAL NOT NULL,
+    trade_status VARCHAR(20) NOT NULL,
+    current_volume INTEGER NOT NULL,
+    current_turnover REAL NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    row_key BIGINT,
+    create_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_code_ts ON t_quotes (stock_code, timestamp);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_quotes_row_key ON t_quotes (row_key, timestamp);
+
+CREATE TABLE IF NOT EXISTS t_candlesticks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stock_code VARCHAR(10) NOT NULL,
+    period VARCHAR(32) NOT NULL,
+    is_confirmed BOOLEAN NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    turnover REAL NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    row_key BIGINT
+);
+CREATE INDEX IF NOT EXISTS idx_code_period_ts ON t_candlesticks (stock_code, period, timestamp);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_candlesticks_row_key ON t_candlesticks (row_key, timestamp);
+"""
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_ON_DUPLICATE = re.compile(r"ON DUPLICATE KEY UPDATE\s+`?id`?\s*=\s*`?id`?", re.IGNORECASE)
+
+sqlite3.register_adapter(Decimal, float)
+sqlite3.register_adapter(datetime, lambda d: d.strftime(TIME_FORMAT))
+sqlite3.register_converter("TIMESTAMP", lambda b: datetime.strptime(b.decode()[:19], TIME_FORMAT))
+
+
+class SQLiteDBManager:
+    """基于 SQLite 的 DBManager 替身，单连接、线程间加锁共享"""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    @staticmethod
+    def _translate(sql: str) -> str:
+        sql = sql.replace("%s", "?")
+        # MySQL 的幂等写入语法对应 SQLite 的 ON CONFLICT DO NOTHING
+        return _ON_DUPLICATE.sub("ON CONFLICT DO NOTHING", sql)
+
+    def save(self, sql, params, raise_errors=False):
+        with self._lock:
+            self.conn.execute(self._translate(sql), params)
+            self.conn.commit()
+
+    def save_many(self, sql, params_list):
+        with self._lock:
+            self.conn.executemany(self._translate(sql), params_list)
+            self.conn.commit()
+
+    def query(self, sql, params):
+        with self._lock:
+            return self.conn.execute(self._translate(sql), params).fetchall()
+
+    def execute(self, sql, params=()):
+        with self._lock:
+            self.conn.execute(self._translate(sql), params)
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,23 @@
+"""
+基准测试使用的合成数据
+
+行情生成器位于 backends/synthetic.py（模拟器也使用），这里只保留写库相关的辅助函数
+"""
+from typing import Iterator
+
+from backends.synthetic import SyntheticBars
+
+
+def candlestick_rows(symbol: str, period: str, bars: SyntheticBars, updates_per_bar: int = 1) -> Iterator[tuple]:
+    """
+    按 t_candlesticks 的列顺序生成插入参数
+
+    实时推送中同一根K线会先推送若干次未确认的数据，最后推送一次确认数据，
+    updates_per_bar > 1 时模拟这一行为
+    """
+    for i in range(len(bars)):
+        o, h, l, c = float(bars.open[i]), float(bars.high[i]), float(bars.low[i]), float(bars.close[i])
+        v, t, ts = int(bars.volume[i]), float(bars.turnover[i]), bars.timestamp[i]
+        for update in range(updates_per_bar):
+            is_confirmed = update == updates_per_bar - 1
+            yield (symbol, period, is_confirmed, o, h, l, c, v, t, ts)
@@ -1,6 +1,8 @@
 import os
-from longport.openapi import Period
+from utils.dotenv import setup_dotenv
 
+# 下面的配置在导入时读取环境变量，必须先加载 .env
+setup_dotenv()
 
 
 # ==================股票配置=====================
@@ -8,7 +10,8 @@ SYMBOL = "TSLA.US"
 
 
 # ==================K线配置=====================
-PERIOD = str(Period.Min_2)
+# 与 str(longport.openapi.Period.Min_2) 一致，避免导入配置时加载 longport 原生扩展
+PERIOD = "Period.Min_2"
 
 
 
@@ -38,4 +41,105 @@ DB_CONFIG = {
     'read_timeout': 10,     # 读取超时时间（秒）
     'write_timeout': 10,    # 写入超时时间（秒）
     'autocommit': True      # 自动提交事务
-}
\ No newline at end of file
+}
+
+
+# ==================监控配置=====================
+# 是否在启动时开启采样分析器（也可通过 /api/profiler 接口随时开关）
+PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', '0') == '1'
+# 采样间隔（秒）
+PROFILER_INTERVAL = float(os.getenv('PROFILER_INTERVAL', 0.005))
+# /api/profiler 的访问令牌（请求头 X-Profiler-Token）；为空时只允许本机直接访问（不经反向代理）
+PROFILER_TOKEN = os.getenv('PROFILER_TOKEN', '')
+
+
+
+# ==================行情/交易后端配置=====================
+# longport: 真实券商连接；record: 连接券商并录制推送；simulator: 本地模拟器
+MARKET_BACKEND = os.getenv('MARKET_BACKEND', 'longport')
+# 录制文件路径，以 .gz 结尾时自动压缩
+RECORD_PATH = os.getenv('RECORD_PATH', 'records/market.jsonl.gz')
+# 模拟器数据源：录制文件路径，或 synthetic 使用合成行情
+SIM_SOURCE = os.getenv('SIM_SOURCE', 'synthetic')
+# 模拟器回放倍速（1~1000），0 表示不限速
+SIM_SPEED = float(os.getenv('SIM_SPEED', 1))
+# 合成行情每根K线的行情推送数量
+SIM_QUOTES_PER_BAR = int(os.getenv('SIM_QUOTES_PER_BAR', 60))
+# 回放结束后是否循环
+SIM_LOOP = os.getenv('SIM_LOOP', '0') == '1'
+
+
+
+# ==================服务配置=====================
+# dev: 单进程 Werkzeug 开发服务器；prod: 接入进程与多个 Web 进程分离
+SERVER_MODE = os.getenv('SERVER_MODE', 'dev')
+WEB_HOST = os.getenv('WEB_HOST', '0.0.0.0')
+# Web 端口，prod 模式下第 i 个 Web 进程监听 WEB_PORT + i（与 scripts/nginx.conf 的 upstream 对应，nginx 对外监听 80）
+WEB_PORT = int(os.getenv('WEB_PORT', 8000))
+# prod 模式下的 Web 进程数量，0 表示与 CPU 核数相同
+WEB_WORKERS = int(os.getenv('WEB_WORKERS', 0))
+# prod 模式下 Web 进程的异步模型：gevent / eventlet
+ASYNC_MODE = os.getenv('ASYNC_MODE', 'gevent')
+# Socket.IO 消息队列（如 redis://localhost:6379/0），多个进程通过它共享推送
+MESSAGE_QUEUE_URL = os.getenv('MESSAGE_QUEUE_URL', '')
+# 接入进程的 /metrics 监听端口，0 表示不开启
+INGEST_METRICS_PORT = int(os.getenv('INGEST_METRICS_PORT', 9100))
+
+
+
+# ==================存储与保留策略=====================
+# 分区粒度：day 按天，month 按月
+PARTITION_GRANULARITY = {
+    't_quotes': 'day',
+    't_candlesticks': 'month',
+}
+# 提前创建的未来分区数量
+PARTITIONS_AHEAD = int(os.getenv('PARTITIONS_AHEAD', 3))
+# 数据保留天数，0 表示永久保留
+RETENTION_DAYS = {
+    't_quotes': int(os.getenv('QUOTES_RETENTION_DAYS', 0)),
+    't_candlesticks': int(os.getenv('CANDLESTICKS_RETENTION_DAYS', 0)),
+}
+# 过期分区处理方式：drop 直接删除；archive 交换到独立的归档表后删除分区
+RETENTION_MODE = os.getenv('RETENTION_MODE', 'drop')
+# 不指定时间范围查询K线时默认回看的天数，0 表示不限制（会扫描所有分区）
+CANDLESTICK_DEFAULT_LOOKBACK_DAYS = int(os.getenv('CANDLESTICK_DEFAULT_LOOKBACK_DAYS', 0))
+
+
+# ==================本地缓冲配置=====================
+# 数据库不可用时写入的本地缓冲目录，为空时关闭（写入失败的行只记录日志并丢弃）
+SPOOL_DIR = os.getenv('SPOOL_DIR', 'records/spool')
+# 单个缓冲分段文件的大小上限（字节）
+SPOOL_SEGMENT_BYTES = int(os.getenv('SPOOL_SEGMENT_BYTES', 64 * 1024 * 1024))
+# fsync 的最长间隔（秒）与最大未同步记录数
+SPOOL_FSYNC_INTERVAL = float(os.getenv('SPOOL_FSYNC_INTERVAL', 0.05))
+SPOOL_FSYNC_BATCH = int(os.getenv('SPOOL_FSYNC_BATCH', 256))
+# 每次回放的最大记录数
+SPOOL_REPLAY_BATCH = int(os.getenv('SPOOL_REPLAY_BATCH', 1000))
+# 连续失败多少次后熔断（之后的写入直接进入缓冲，不再等待连接超时）
+DB_FAILURE_THRESHOLD = int(os.getenv('DB_FAILURE_THRESHOLD', 1))
+# 熔断后多少秒再尝试连接数据库
+DB_RETRY_INTERVAL = float(os.getenv('DB_RETRY_INTERVAL', 5))
+
+
+# ==================扫描器配置=====================
+# 扫描的股票列表，逗号分隔，为空时只扫描 SYMBOL
+WATCHLIST = [s.strip() for s in os.getenv('WATCHLIST', '').split(',') if s.strip()] or [SYMBOL]
+# 股票列表文件（每行一个代码，# 开头为注释），设置后代替 WATCHLIST
+WATCHLIST_FILE = os.getenv('WATCHLIST_FILE', '')
+# 是否启动扫描器（dev 模式在主进程内运行，prod 模式由 serve 额外守护一个 scan 进程）
+SCANNER_ENABLED = os.getenv('SCANNER_ENABLED', '0') == '1'
+# 扫描进程池大小，0 表示与 CPU 核数相同，1 表示在当前进程内计算
+SCANNER_WORKERS = int(os.getenv('SCANNER_WORKERS', 0))
+# 每个股票保留用于计算的K线根数
+SCANNER_LOOKBACK_BARS = int(os.getenv('SCANNER_LOOKBACK_BARS', 300))
+# 首次加载时回看的天数（覆盖非交易时段后应至少包含 SCANNER_LOOKBACK_BARS 根K线）
+SCANNER_LOOKBACK_DAYS = int(os.getenv('SCANNER_LOOKBACK_DAYS', 7))
+# 没有K线的股票（新上市、代码错误等）重新查询的最短间隔（秒），避免每次扫描都查询整个回看窗口
+SCANNER_EMPTY_RETRY = float(os.getenv('SCANNER_EMPTY_RETRY', 1800))
+# K线收盘后延迟多少秒开始扫描，等待确认K线入库
+SCANNER_DELAY = float(os.getenv('SCANNER_DELAY', 3))
+# 指标过滤条件，分号分隔，例如 "rsi(14,close)<30;volume_ratio>=1.5"
+SCANNER_FILTERS = os.getenv('SCANNER_FILTERS', '')
+# 最近一次扫描结果的保存路径，扫描进程写入，Web 进程读取
+SCANNER_RESULT_PATH = os.getenv('SCANNER_RESULT_PATH', 'records/scanner.json')
@@ -1 +1,4 @@
-from .candlestick_data_manager import CandlestickDataManager
\ No newline at end of file
+from .candlestick_data_manager import CandlestickDataManager
+from .circuit_breaker import CircuitBreaker
+from .spool import Spool, SpoolLockedError
+from .spooled_writer import SpooledWriter
@@ -1,102 +1,149 @@
-from datetime import datetime
-from config import PERIOD
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from config import PERIOD, CANDLESTICK_DEFAULT_LOOKBACK_DAYS, SPOOL_DIR, DB_FAILURE_THRESHOLD, DB_RETRY_INTERVAL
 from db.db_manager import DBManager
 from longport.openapi import PushCandlestick, PushQuote
-from utils import is_not_empty
+from utils import is_not_empty, lazy_property
+
+logger = logging.getLogger(__name__)
+
+# 写入语句通过 row_key 幂等：同一行重复写入（如本地缓冲回放中断后重新回放）只保留一条
+INSERT_QUOTE_SQL = """
+    INSERT INTO t_quotes (
+        stock_code, last_done, open, high, low, volume, turnover, trade_status, current_volume, current_turnover, timestamp,
+        row_key
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE id = id
+    """
+
+INSERT_CANDLESTICK_SQL = """
+    INSERT INTO t_candlesticks (
+        stock_code, period, is_confirmed, open, high, low, close, volume, turnover,
+        timestamp, row_key
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE id = id
+    """
+
+STATEMENTS = {
+    "quote": INSERT_QUOTE_SQL,
+    "candlestick": INSERT_CANDLESTICK_SQL,
+}
+
+
+def new_row_key() -> int:
+    """随机 63 位写入标识，写入前生成，直接写入与缓冲回放使用同一个值"""
+    return uuid.uuid4().int >> 65
+
 
 class CandlestickDataManager:
     
-    def __init__(self):
-        self.db_manager = DBManager()
+    def __init__(self, db_manager: DBManager = None, spool_dir: str = SPOOL_DIR):
+        """
+        参数:
+            db_manager: 允许注入其他实现（如基准测试中的 SQLite 替身）
+            spool_dir: 本地缓冲目录，数据库不可用时写入这里，为空时不使用缓冲
+        """
+        self.db_manager = db_manager if db_manager is not None else DBManager()
+        self.spool_dir = spool_dir
+
+    @lazy_property
+    def writer(self):
+        """带本地缓冲的写入器，第一次写入时创建（只读的 Web 进程不会创建）"""
+        if not self.spool_dir:
+            return None
+        from db.circuit_breaker import CircuitBreaker
+        from db.spool import Spool, SpoolLockedError
+        from db.spooled_writer import SpooledWriter
+        try:
+            spool = Spool(self.spool_dir)
+        except SpoolLockedError as e:
+            logger.warning(f"{e}，本进程直接写入数据库，不使用本地缓冲")
+            return None
+        breaker = CircuitBreaker(DB_FAILURE_THRESHOLD, DB_RETRY_INTERVAL)
+        return SpooledWriter(self.db_manager, STATEMENTS, spool, breaker).start()
+
+    def close(self):
+        if self.__dict__.get('writer') is not None:
+            self.writer.close()
+
+    def _save(self, statement: str, params: tuple):
+        writer = self.writer
+        if writer is not None:
+            writer.save(statement, params)
+        else:
+            self.db_manager.save(STATEMENTS[statement], params)
 
     def save_quote_data(self, symbol:str, event: PushQuote):
-        sql = """
-                INSERT INTO t_quotes (
-                    stock_code, last_done, open, high, low, volume, turnover, trade_status, current_volume, current_turnover, timestamp
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
         params = (
-                        symbol, event.last_done, event.open, event.high, event.low, event.volume, event.turnover, event.trade_status, event.current_volume, event.current_turnover, event.timestamp
+                        symbol, event.last_done, event.open, event.high, event.low, event.volume, event.turnover, event.trade_status, event.current_volume, event.current_turnover, event.timestamp,
+                        new_row_key()
                     )
-        self.db_manager.save(sql, params)
+        self._save("quote", params)
 
     # 保存K线数据
     def save_candlestick_data(self, symbol: str, event: PushCandlestick):
-        sql = """
-                INSERT INTO t_candlesticks (
-                    stock_code, period, is_confirmed, open, high, low, close, volume, turnover,
-                    timestamp
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-        
         params = (
                         symbol, PERIOD, event.is_confirmed, event.candlestick.open, 
                         event.candlestick.high, event.candlestick.low, event.candlestick.close, 
                         event.candlestick.volume, event.candlestick.turnover, 
-                        event.candlestick.timestamp
+                        event.candlestick.timestamp, new_row_key()
                     )
-        self.db_manager.save(sql, params)
+        self._save("candlestick", params)
     
-    def get_candlestick_data(self, symbol: str, period: str = PERIOD, realtime: bool=False, startTime:str=None, endTime:str=None):
-        sql = ""
-        params = None
+    @staticmethod
+    def time_range(startTime: str = None, endTime: str = None, lookback_days: int = CANDLESTICK_DEFAULT_LOOKBACK_DAYS):
+        """
+        生成 timestamp 范围条件
+
+        条件直接作用在分区键 timestamp 上，MySQL 可以据此做分区裁剪，只扫描命中的分区；
+        未指定范围且配置了 lookback_days 时，默认只查询最近 lookback_days 天
+
+        返回:
+            (SQL 条件片段, 参数元组)，无范围时片段为空字符串
+        """
         if is_not_empty(startTime) and is_not_empty(endTime):
-            sql = """
-                    SELECT open, high, low, close, volume, turnover, timestamp
-                    FROM t_candlesticks t1
-                    WHERE t1.stock_code = %s
-                    AND t1.period = %s
-                    AND t1.is_confirmed = 1
-                    AND t1.timestamp >= %s
-                    AND t1.timestamp <= %s
-                    AND t1.id = (
-                        SELECT MAX(id)
-                        FROM t_candlesticks t2
-                        WHERE t2.stock_code = t1.stock_code
-                            AND t2.period = t1.period
-                            AND t2.timestamp = t1.timestamp
-                    )
-                    ORDER BY t1.timestamp ASC
-                    """
-            params = (symbol, period, startTime, endTime)
-        else:
-            sql = """
-                    SELECT open, high, low, close, volume, turnover, timestamp
-                    FROM t_candlesticks t1
-                    WHERE t1.stock_code = %s
-                    AND t1.period = %s
-                    AND t1.is_confirmed = 1
-                    AND t1.id = (
-                        SELECT MAX(id)
-                        FROM t_candlesticks t2
-                        WHERE t2.stock_code = t1.stock_code
-                            AND t2.period = t1.period
-                            AND t2.timestamp = t1.timestamp
-                    )
-                    ORDER BY t1.timestamp ASC
-                    """
-            params = (symbol, period)
+            return "AND timestamp >= %s AND timestamp <= %s", (startTime, endTime)
+        if lookback_days > 0:
+            since = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d %H:%M:%S')
+            return "AND timestamp >= %s", (since,)
+        return "", ()
+
+    def get_candlestick_data(self, symbol: str, period: str = PERIOD, realtime: bool=False, startTime:str=None, endTime:str=None):
+        range_sql, range_params = self.time_range(startTime, endTime)
         if realtime:
-            if is_not_empty(startTime) and is_not_empty(endTime):
-                sql = """
-                    SELECT open, high, low, close, volume, turnover, timestamp 
-                    FROM t_candlesticks 
-                    WHERE stock_code = %s 
-                    AND period = %s
-                    AND timestamp >= %s
-                    AND timestamp <= %s
-                    ORDER BY timestamp ASC
-                    """
-                params = (symbol, period, startTime, endTime)
-            else:
-                sql = """
-                    SELECT open, high, low, close, volume, turnover, timestamp 
-                    FROM t_candlesticks 
-                    WHERE stock_code = %s 
+            # 所有推送（含未确认的K线），用于回放
+            sql = f"""
+                SELECT open, high, low, close, volume, turnover, timestamp
+                FROM t_candlesticks
+                WHERE stock_code = %s
+                AND period = %s
+                {range_sql}
+                ORDER BY timestamp ASC
+                """
+            params = (symbol, period) + range_params
+        else:
+            # 每个时间点取最后一次推送，且只保留已确认的K线；
+            # 子查询在 (stock_code, period, timestamp) 索引上按同样的时间范围分组，再按主键 (id, timestamp) 回表
+            sql = f"""
+                SELECT t1.open, t1.high, t1.low, t1.close, t1.volume, t1.turnover, t1.timestamp
+                FROM t_candlesticks t1
+                JOIN (
+                    SELECT MAX(id) AS id, timestamp
+                    FROM t_candlesticks
+                    WHERE stock_code = %s
                     AND period = %s
-                    ORDER BY timestamp ASC
-                    """
-                params = (symbol, period)
+                    {range_sql}
+                    GROUP BY timestamp
+                ) t2 ON t1.id = t2.id AND t1.timestamp = t2.timestamp
+                WHERE t1.is_confirmed = 1
+                ORDER BY t1.timestamp ASC
+                """
+            params = (symbol, period) + range_params
 
         results = self.db_manager.query(sql, params)
         
@@ -114,4 +161,49 @@ class CandlestickDataManager:
             formatted_results.append(row_dict)
 
         return formatted_results
-    
\ No newline at end of file
+
+    def get_candlestick_bars(self, symbols: list, period: str = PERIOD, since: datetime = None):
+        """
+        一次查询批量获取多个股票已确认的K线，用于扫描器等批量计算
+
+        参数:
+            symbols: 股票代码列表
+            since: 只返回 timestamp 晚于该时间的K线
+
+        返回:
+            {股票代码: {"open"/"high"/"low"/"close"/"volume": float64 数组, "timestamp": 秒级时间戳数组}}，
+            没有数据的股票不出现在结果中
+        """
+        if not symbols:
+            return {}
+        placeholders = ", ".join(["%s"] * len(symbols))
+        since_sql = "AND timestamp > %s" if since is not None else ""
+        sql = f"""
+            SELECT t1.stock_code, t1.open, t1.high, t1.low, t1.close, t1.volume, t1.timestamp
+            FROM t_candlesticks t1
+            JOIN (
+                SELECT MAX(id) AS id, timestamp
+                FROM t_candlesticks
+                WHERE stock_code IN ({placeholders})
+                AND period = %s
+                {since_sql}
+                GROUP BY stock_code, timestamp
+            ) t2 ON t1.id = t2.id AND t1.timestamp = t2.timestamp
+            WHERE t1.is_confirmed = 1
+            ORDER BY t1.stock_code, t1.timestamp ASC
+            """
+        params = tuple(symbols) + (period,) + ((since,) if since is not None else ())
+
+        grouped = defaultdict(list)
+        for row in self.db_manager.query(sql, params):
+            row = dict(row)
+            grouped[row['stock_code']].append((
+                float(row['open']), float(row['high']), float(row['low']), float(row['close']),
+                float(row['volume']), row['timestamp'].timestamp(),
+            ))
+
+        bars = {}
+        for symbol, rows in grouped.items():
+            columns = np.array(rows, dtype=np.float64).T
+            bars[symbol] = dict(zip(("open", "high", "low", "close", "volume", "timestamp"), columns))
+        return bars
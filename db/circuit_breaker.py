@@ -0,0 +1,65 @@
+import threading
+import time
+
+from metrics import DB_CIRCUIT_STATE
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, OPEN: 1, HALF_OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    数据库熔断器
+
+    连续失败 failure_threshold 次后断开（open），期间写入直接进入本地缓冲，不再尝试连接数据库；
+    断开 reset_timeout 秒后进入半开（half_open），由回放线程试探，成功则恢复（closed）
+    """
+
+    def __init__(self, failure_threshold: int = 1, reset_timeout: float = 5.0, name: str = "db"):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self._gauge = DB_CIRCUIT_STATE.labels(name)
+        self._gauge.set(0)
+
+    def _set_state(self, state: str):
+        self._state = state
+        self._gauge.set(_STATE_VALUES[state])
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._set_state(HALF_OPEN)
+            return self._state
+
+    @property
+    def closed(self) -> bool:
+        return self.state == CLOSED
+
+    def wait_time(self) -> float:
+        """距离可以再次试探的秒数，闭合或半开时为 0"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._set_state(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(OPEN)
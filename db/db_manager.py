@@ -2,6 +2,7 @@ import logging
 import pymysql
 from pymysql.cursors import DictCursor
 from config import DB_CONFIG
+from metrics import DB_SAVE_DURATION, DB_QUERY_DURATION, DB_ERRORS
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +21,63 @@ class DBManager:
             logger.error("错误详情:", exc_info=True)
             raise
     
-    # 保存数据
-    def save(self, sql, params):
+    # 保存数据，默认出错时只记录日志；raise_errors=True 时抛出异常，由调用方决定如何处理（如写入本地缓冲）
+    @DB_SAVE_DURATION.time()
+    def save(self, sql, params, raise_errors=False):
+        conn = None
         try:
             conn = self.get_db_connection()
             with conn.cursor() as cursor:
                 cursor.execute(sql, params)
             conn.commit()
         except Exception as e:
+            DB_ERRORS.labels("save").inc()
+            if raise_errors:
+                raise
             logger.error(f"保存数据时出错: {e}")
             logger.error("错误详情:", exc_info=True)
         finally:
             try:
-                conn.close()
+                if conn is not None:
+                    conn.close()
             except:
                 logger.warning("关闭数据库连接时发生错误")
     
+    # 批量保存数据，一次连接、一次提交
+    @DB_SAVE_DURATION.time()
+    def save_many(self, sql, params_list):
+        conn = None
+        try:
+            conn = self.get_db_connection()
+            with conn.cursor() as cursor:
+                cursor.executemany(sql, params_list)
+            conn.commit()
+        except Exception as e:
+            DB_ERRORS.labels("save").inc()
+            logger.error(f"批量保存数据时出错: {e}")
+            logger.error("错误详情:", exc_info=True)
+            raise
+        finally:
+            try:
+                if conn is not None:
+                    conn.close()
+            except:
+                logger.warning("关闭数据库连接时发生错误")
+
+    # 执行DDL等语句，出错时抛出异常（用于迁移、分区维护等不能静默失败的场景）
+    def execute(self, sql, params=None):
+        conn = None
+        try:
+            conn = self.get_db_connection()
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+            conn.commit()
+        finally:
+            if conn is not None:
+                conn.close()
+
     # 查询数据
+    @DB_QUERY_DURATION.time()
     def query(self, sql, params):
         try:
             conn = self.get_db_connection()
@@ -44,6 +85,7 @@ class DBManager:
                 cursor.execute(sql, params)
                 return cursor.fetchall()
         except Exception as e:
+            DB_ERRORS.labels("query").inc()
             logger.error(f"查询数据时出错: {e}")
             logger.error("错误详情:", exc_info=True)
             raise
\ No newline at end of file
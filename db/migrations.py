@@ -0,0 +1,183 @@
+"""
+数据库结构迁移
+
+每个迁移有唯一的版本号，执行后记录到 t_schema_migrations，已执行的迁移不会重复执行。
+迁移函数本身也会先检查当前结构，对已经由 scripts/init.sql 创建为新结构的表不做修改。
+
+用法:
+    python -m db.migrations            # 执行所有未执行的迁移，并预建当前及未来的分区
+    python -m db.migrations --status   # 查看迁移状态
+"""
+import argparse
+import logging
+from datetime import datetime
+from typing import Callable, List, NamedTuple
+
+from config import PARTITION_GRANULARITY, PARTITIONS_AHEAD
+from db.db_manager import DBManager
+from db.partitions import PartitionManager
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[DBManager], None]
+
+
+def _index_names(db: DBManager, table: str) -> set:
+    rows = db.query("""
+        SELECT DISTINCT INDEX_NAME AS name FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table,))
+    return {row["name"] for row in rows}
+
+
+def _primary_key_columns(db: DBManager, table: str) -> List[str]:
+    rows = db.query("""
+        SELECT COLUMN_NAME AS name FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = 'PRIMARY'
+        ORDER BY SEQ_IN_INDEX
+        """, (table,))
+    return [row["name"] for row in rows]
+
+
+def add_composite_indexes(db: DBManager):
+    """
+    新增 (stock_code, period, timestamp) / (stock_code, timestamp) 复合索引，
+    删除被复合索引覆盖的单列索引
+    """
+    composite = {
+        "t_candlesticks": ("idx_code_period_ts", "`stock_code`, `period`, `timestamp`"),
+        "t_quotes": ("idx_code_ts", "`stock_code`, `timestamp`"),
+    }
+    for table, (name, columns) in composite.items():
+        indexes = _index_names(db, table)
+        clauses = []
+        if name not in indexes:
+            clauses.append(f"ADD KEY `{name}` ({columns})")
+        for old in ("idx_stock_code", "idx_timestamp"):
+            if old in indexes:
+                clauses.append(f"DROP KEY `{old}`")
+        if clauses:
+            db.execute(f"ALTER TABLE `{table}` " + ", ".join(clauses))
+            logger.info("表 %s 索引调整: %s", table, ", ".join(clauses))
+
+
+def partition_by_timestamp(db: DBManager):
+    """
+    将主键改为 (id, timestamp)（MySQL 要求分区键包含在每个唯一键中），
+    再按 timestamp 做 RANGE COLUMNS 分区，分区覆盖已有数据直到未来 PARTITIONS_AHEAD 个周期
+    """
+    for table, granularity in PARTITION_GRANULARITY.items():
+        manager = PartitionManager(table, granularity, db)
+        if manager.is_partitioned():
+            logger.info("表 %s 已分区，跳过", table)
+            continue
+        if _primary_key_columns(db, table) != ["id", "timestamp"]:
+            db.execute(f"ALTER TABLE `{table}` DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `timestamp`)")
+        row = db.query(f"SELECT MIN(`timestamp`) AS first FROM `{table}`", None)[0]
+        now = datetime.now()
+        manager.partition_table(row["first"] or now, now)
+        manager.ensure_future_partitions(PARTITIONS_AHEAD, now)
+
+
+def _column_names(db: DBManager, table: str) -> set:
+    rows = db.query("""
+        SELECT COLUMN_NAME AS name FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table,))
+    return {row["name"] for row in rows}
+
+
+def add_row_key(db: DBManager):
+    """
+    新增写入标识 row_key 及唯一键 (row_key, timestamp)，使本地缓冲回放可以重复执行；
+    已有数据的 row_key 为 NULL，不受唯一键约束
+    """
+    for table in ("t_quotes", "t_candlesticks"):
+        clauses = []
+        if "row_key" not in _column_names(db, table):
+            clauses.append("ADD COLUMN `row_key` BIGINT NULL COMMENT '写入标识，用于幂等写入'")
+        if "uk_row_key" not in _index_names(db, table):
+            clauses.append("ADD UNIQUE KEY `uk_row_key` (`row_key`, `timestamp`)")
+        if clauses:
+            db.execute(f"ALTER TABLE `{table}` " + ", ".join(clauses))
+            logger.info("表 %s 新增: %s", table, ", ".join(clauses))
+
+
+MIGRATIONS = [
+    Migration(1, "复合索引 (stock_code, period, timestamp)", add_composite_indexes),
+    Migration(2, "按 timestamp 范围分区", partition_by_timestamp),
+    Migration(3, "幂等写入标识 row_key", add_row_key),
+]
+
+
+def _ensure_migration_table(db: DBManager):
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS `t_schema_migrations` (
+            `version` INT NOT NULL COMMENT '迁移版本',
+            `description` VARCHAR(255) NOT NULL COMMENT '迁移说明',
+            `applied_at` DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '执行时间',
+            PRIMARY KEY (`version`)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='数据库迁移记录表'
+        """)
+
+
+def applied_versions(db: DBManager) -> set:
+    _ensure_migration_table(db)
+    return {row["version"] for row in db.query("SELECT version FROM t_schema_migrations", None)}
+
+
+def ensure_partitions(db: DBManager, now: datetime = None):
+    """
+    为已分区的表预建当前及未来 PARTITIONS_AHEAD 个周期的分区
+
+    scripts/init.sql 新建的表只有 pmax，在写入数据之前拆分只修改元数据
+    """
+    for table, granularity in PARTITION_GRANULARITY.items():
+        manager = PartitionManager(table, granularity, db)
+        if manager.is_partitioned():
+            manager.ensure_future_partitions(PARTITIONS_AHEAD, now)
+
+
+def migrate(db: DBManager = None) -> List[int]:
+    """
+    执行所有未执行的迁移并预建分区，返回本次执行的版本号
+    """
+    db = db if db is not None else DBManager()
+    done = applied_versions(db)
+    applied = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in done:
+            continue
+        logger.info("执行迁移 %d: %s", migration.version, migration.description)
+        migration.apply(db)
+        db.execute("INSERT INTO t_schema_migrations (version, description) VALUES (%s, %s)",
+                   (migration.version, migration.description))
+        applied.append(migration.version)
+    ensure_partitions(db)
+    logger.info("迁移完成，本次执行 %d 个", len(applied))
+    return applied
+
+
+def main(argv=None):
+    from utils import setup_logging
+
+    parser = argparse.ArgumentParser(description="数据库结构迁移")
+    parser.add_argument("--status", action="store_true", help="只查看迁移状态")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    db = DBManager()
+    if args.status:
+        done = applied_versions(db)
+        for migration in MIGRATIONS:
+            print(f"{migration.version:>4}  {'已执行' if migration.version in done else '未执行'}  {migration.description}")
+        return
+    migrate(db)
+
+
+if __name__ == "__main__":
+    main()
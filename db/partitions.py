@@ -0,0 +1,151 @@
+"""
+按时间范围分区（RANGE COLUMNS(timestamp)）的维护工具
+
+分区命名：按天 pYYYYMMDD，按月 pYYYYMM，最后一个分区 pmax 存放超出范围的数据。
+分区的上界为下一个周期的起点，即分区 p202501 存放 timestamp < '2025-02-01 00:00:00' 的数据。
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from db.db_manager import DBManager
+
+logger = logging.getLogger(__name__)
+
+MAX_PARTITION = "pmax"
+
+
+@dataclass
+class Partition:
+    """分区信息"""
+    name: str
+    upper_bound: Optional[datetime]  # None 表示 MAXVALUE
+    rows: int = 0
+
+
+def period_start(t: datetime, granularity: str) -> datetime:
+    if granularity == "day":
+        return datetime(t.year, t.month, t.day)
+    if granularity == "month":
+        return datetime(t.year, t.month, 1)
+    raise ValueError(f"不支持的分区粒度: {granularity}")
+
+
+def next_period(t: datetime, granularity: str) -> datetime:
+    start = period_start(t, granularity)
+    if granularity == "day":
+        return start + timedelta(days=1)
+    return datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def partition_name(start: datetime, granularity: str) -> str:
+    return start.strftime("p%Y%m%d" if granularity == "day" else "p%Y%m")
+
+
+def partition_definitions(first: datetime, last: datetime, granularity: str) -> List[str]:
+    """
+    生成覆盖 [first 所在周期, last 所在周期] 的分区定义
+    """
+    definitions = []
+    start = period_start(first, granularity)
+    while start <= last:
+        upper = next_period(start, granularity)
+        definitions.append(
+            f"PARTITION {partition_name(start, granularity)} VALUES LESS THAN ('{upper:%Y-%m-%d %H:%M:%S}')")
+        start = upper
+    return definitions
+
+
+class PartitionManager:
+    """单张分区表的维护：查看、预建、删除与归档分区"""
+
+    def __init__(self, table: str, granularity: str, db_manager: DBManager = None):
+        self.table = table
+        self.granularity = granularity
+        self.db_manager = db_manager if db_manager is not None else DBManager()
+
+    def partitions(self) -> List[Partition]:
+        rows = self.db_manager.query("""
+            SELECT PARTITION_NAME AS name, PARTITION_DESCRIPTION AS description, TABLE_ROWS AS table_rows
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
+            """, (self.table,))
+        result = []
+        for row in rows:
+            description = (row["description"] or "").strip("'")
+            upper = None if description.upper() == "MAXVALUE" else datetime.strptime(description[:19], "%Y-%m-%d %H:%M:%S")
+            result.append(Partition(row["name"], upper, int(row["table_rows"] or 0)))
+        return result
+
+    def is_partitioned(self) -> bool:
+        return len(self.partitions()) > 0
+
+    def partition_table(self, first: datetime, last: datetime):
+        """
+        将未分区的表改为按时间范围分区，分区覆盖 first ~ last 所在的周期
+        """
+        definitions = partition_definitions(first, last, self.granularity)
+        definitions.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+        sql = f"ALTER TABLE `{self.table}` PARTITION BY RANGE COLUMNS(`timestamp`) (\n    " + ",\n    ".join(definitions) + "\n)"
+        logger.info("表 %s 分区: %d 个", self.table, len(definitions))
+        self.db_manager.execute(sql)
+
+    def ensure_future_partitions(self, ahead: int, now: datetime = None) -> int:
+        """
+        从 pmax 中拆分出直到当前周期之后 ahead 个周期的分区，返回新建的分区数量
+
+        pmax 通常为空，拆分只修改元数据
+        """
+        now = now or datetime.now()
+        partitions = self.partitions()
+        bounded = [p for p in partitions if p.upper_bound is not None]
+        target = period_start(now, self.granularity)
+        for _ in range(ahead):
+            target = next_period(target, self.granularity)
+        start = bounded[-1].upper_bound if bounded else period_start(now, self.granularity)
+        if start > target:
+            return 0
+        definitions = partition_definitions(start, target, self.granularity)
+        definitions.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+        sql = f"ALTER TABLE `{self.table}` REORGANIZE PARTITION {MAX_PARTITION} INTO (\n    " + ",\n    ".join(definitions) + "\n)"
+        self.db_manager.execute(sql)
+        logger.info("表 %s 新建分区 %d 个", self.table, len(definitions) - 1)
+        return len(definitions) - 1
+
+    def expired_partitions(self, cutoff: datetime) -> List[Partition]:
+        """上界不晚于 cutoff 的分区，其中所有数据都早于 cutoff"""
+        return [p for p in self.partitions() if p.upper_bound is not None and p.upper_bound <= cutoff]
+
+    def drop_partitions(self, partitions: List[Partition]):
+        if not partitions:
+            return
+        names = ", ".join(p.name for p in partitions)
+        self.db_manager.execute(f"ALTER TABLE `{self.table}` DROP PARTITION {names}")
+        logger.info("表 %s 已删除分区: %s", self.table, names)
+
+    def _has_rows(self, source: str) -> bool:
+        return len(self.db_manager.query(f"SELECT 1 FROM {source} LIMIT 1", None)) > 0
+
+    def archive_partition(self, partition: Partition) -> str:
+        """
+        将分区数据交换到独立的归档表（{table}_{partition}）后删除该分区，返回归档表名
+
+        EXCHANGE PARTITION 只交换表空间，不逐行复制数据。
+        上次归档在交换之后、删除分区之前中断时，归档表已有数据而分区为空，此时只删除分区；
+        归档表与分区都有数据时无法判断哪份是归档结果，抛出异常，由人工处理
+        """
+        archive = f"{self.table}_{partition.name}"
+        self.db_manager.execute(f"CREATE TABLE IF NOT EXISTS `{archive}` LIKE `{self.table}`")
+        if PartitionManager(archive, self.granularity, self.db_manager).is_partitioned():
+            self.db_manager.execute(f"ALTER TABLE `{archive}` REMOVE PARTITIONING")
+        if not self._has_rows(f"`{archive}`"):
+            self.db_manager.execute(f"ALTER TABLE `{self.table}` EXCHANGE PARTITION {partition.name} WITH TABLE `{archive}`")
+        elif self._has_rows(f"`{self.table}` PARTITION ({partition.name})"):
+            raise RuntimeError(f"归档表 {archive} 与表 {self.table} 的分区 {partition.name} 都有数据，请人工确认后再归档")
+        else:
+            logger.warning("归档表 %s 已有数据且分区 %s 为空（上次归档未完成），只删除分区", archive, partition.name)
+        self.drop_partitions([partition])
+        logger.info("表 %s 分区 %s 已归档到 %s", self.table, partition.name, archive)
+        return archive
@@ -0,0 +1,71 @@
+"""
+分区保留策略
+
+按 RETENTION_DAYS 删除或归档过期分区，并预建未来分区。删除/归档整个分区只修改元数据，
+耗时与数据量无关，不会像 DELETE 那样扫描并逐行删除。建议每天由 cron 执行一次:
+
+    python -m db.retention
+"""
+import argparse
+import logging
+from datetime import datetime, timedelta
+
+from config import PARTITION_GRANULARITY, PARTITIONS_AHEAD, RETENTION_DAYS, RETENTION_MODE
+from db.db_manager import DBManager
+from db.partitions import PartitionManager
+
+logger = logging.getLogger(__name__)
+
+
+def run_retention(db: DBManager = None, now: datetime = None, mode: str = RETENTION_MODE, dry_run: bool = False) -> dict:
+    """
+    执行一次保留策略
+
+    参数:
+        mode: drop 直接删除过期分区；archive 先交换到归档表再删除
+        dry_run: 只返回将要处理的分区，不做修改
+
+    返回:
+        {表名: [处理的分区名]}
+    """
+    db = db if db is not None else DBManager()
+    now = now or datetime.now()
+    result = {}
+    for table, granularity in PARTITION_GRANULARITY.items():
+        manager = PartitionManager(table, granularity, db)
+        if not manager.is_partitioned():
+            logger.warning("表 %s 尚未分区，请先执行 python -m db.migrations", table)
+            continue
+        if not dry_run:
+            manager.ensure_future_partitions(PARTITIONS_AHEAD, now)
+        days = RETENTION_DAYS.get(table, 0)
+        if days <= 0:
+            continue
+        expired = manager.expired_partitions(now - timedelta(days=days))
+        result[table] = [p.name for p in expired]
+        if dry_run or not expired:
+            continue
+        if mode == "archive":
+            for partition in expired:
+                manager.archive_partition(partition)
+        else:
+            manager.drop_partitions(expired)
+    return result
+
+
+def main(argv=None):
+    from utils import setup_logging
+
+    parser = argparse.ArgumentParser(description="删除或归档过期分区，预建未来分区")
+    parser.add_argument("--mode", choices=["drop", "archive"], default=RETENTION_MODE)
+    parser.add_argument("--dry-run", action="store_true", help="只列出过期分区")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    result = run_retention(mode=args.mode, dry_run=args.dry_run)
+    for table, names in result.items():
+        logger.info("表 %s 过期分区: %s", table, ", ".join(names) or "无")
+
+
+if __name__ == "__main__":
+    main()
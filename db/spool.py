@@ -0,0 +1,347 @@
+"""
+本地追加写缓冲（spool）
+
+数据库不可用时，待写入的行按顺序追加到本地分段文件，数据库恢复后由 SpooledWriter 批量回放。
+
+文件格式：每行一条记录 "<crc32 十六进制> <JSON>\\n"，JSON 为 [写入时间, 语句名, 参数列表]。
+- 每次追加后立即 flush 到操作系统，进程崩溃不会丢失已追加的记录
+- fsync 按批进行（累计 fsync_batch 条或间隔 fsync_interval 秒），断电时最多丢失最近一个批次
+- 回放进度记录在 checkpoint 文件中；启动时从 checkpoint 开始校验，截断末尾写了一半的记录
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 下不做进程间互斥
+    fcntl = None
+
+from config import SPOOL_SEGMENT_BYTES, SPOOL_FSYNC_INTERVAL, SPOOL_FSYNC_BATCH
+from metrics import SPOOL_BYTES, SPOOL_RECORDS, SPOOL_WRITES, SPOOL_FSYNC_DURATION
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT = re.compile(r"^spool-(\d{8})\.log$")
+CHECKPOINT_FILE = "checkpoint"
+LOCK_FILE = "lock"
+
+
+class SpoolLockedError(RuntimeError):
+    """缓冲目录已被其他进程占用"""
+
+
+def encode_param(value):
+    """
+    将 SQL 参数转换为 JSON 可表示的值
+
+    与 pymysql 的转义方式一致：Decimal 与未知类型（如枚举）按字符串写入，datetime 按 MySQL 字面量格式写入
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def encode_record(written_at: float, statement: str, params) -> bytes:
+    payload = json.dumps([written_at, statement, [encode_param(p) for p in params]],
+                         ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"%08x " % zlib.crc32(payload) + payload + b"\n"
+
+
+def decode_record(line: bytes) -> Optional[Tuple[float, str, list]]:
+    """解析一行记录，行不完整或校验失败时返回 None"""
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        written_at, statement, params = json.loads(payload)
+    except ValueError:
+        return None
+    return written_at, statement, params
+
+
+class Position(NamedTuple):
+    segment: int
+    offset: int
+
+
+class Batch(NamedTuple):
+    records: List[Tuple[float, str, list]]
+    end: Position
+    nbytes: int
+
+
+class Spool:
+    """
+    本地追加写缓冲
+
+    参数:
+        directory: 缓冲目录，一个目录只能由一个进程使用
+        segment_bytes: 单个分段文件的大小上限，超过后切换到新分段，已回放的分段直接删除
+        fsync_interval / fsync_batch: fsync 的最长间隔与最大未同步记录数
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = SPOOL_SEGMENT_BYTES,
+                 fsync_interval: float = SPOOL_FSYNC_INTERVAL, fsync_batch: int = SPOOL_FSYNC_BATCH):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = self._acquire_directory()
+
+        self._lock = threading.Lock()
+        self._synced = threading.Condition(self._lock)
+        self._unsynced = 0
+        self._closed = False
+
+        self._checkpoint = self._load_checkpoint()
+        self.pending, self.pending_bytes, self._segment = self._recover()
+        self._file = open(self._path(self._segment), "ab")
+        self._segment_size = self._file.tell()
+        self._update_gauges()
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="spool-fsync", daemon=True)
+        self._flusher.start()
+
+    # ------------------------------------------------------------------ 文件与恢复
+
+    def _acquire_directory(self):
+        """独占缓冲目录，避免多个进程同时追加同一个文件"""
+        lock_file = open(os.path.join(self.directory, LOCK_FILE), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                raise SpoolLockedError(f"缓冲目录 {self.directory} 已被其他进程使用") from None
+        return lock_file
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"spool-{segment:08d}.log")
+
+    def _segments(self) -> List[int]:
+        return sorted(int(m.group(1)) for m in map(_SEGMENT.match, os.listdir(self.directory)) if m)
+
+    def _load_checkpoint(self) -> Position:
+        try:
+            with open(os.path.join(self.directory, CHECKPOINT_FILE), encoding="utf-8") as f:
+                data = json.load(f)
+            return Position(data["segment"], data["offset"])
+        except FileNotFoundError:
+            segments = self._segments()
+            return Position(segments[0] if segments else 0, 0)
+
+    def _save_checkpoint(self, position: Position):
+        path = os.path.join(self.directory, CHECKPOINT_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"segment": position.segment, "offset": position.offset}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self._checkpoint = position
+
+    def _recover(self) -> Tuple[int, int, int]:
+        """
+        从 checkpoint 开始校验所有分段，统计待回放的记录，截断损坏或写了一半的尾部
+
+        返回:
+            (待回放记录数, 待回放字节数, 当前写入的分段号)
+        """
+        checkpoint = self._checkpoint
+        pending = pending_bytes = 0
+        segments = self._segments()
+        for segment in segments:
+            if segment < checkpoint.segment:
+                os.remove(self._path(segment))
+                continue
+            path = self._path(segment)
+            offset = checkpoint.offset if segment == checkpoint.segment else 0
+            corrupted = 0
+            with open(path, "rb") as f:
+                f.seek(offset)
+                good = offset
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # 只有末尾写了一半的行没有换行符
+                    if decode_record(line) is None:
+                        # 完整但校验失败的行与 read_batch 一样跳过，不影响其后的记录
+                        corrupted += 1
+                    else:
+                        pending += 1
+                    good += len(line)
+                size = f.seek(0, os.SEEK_END)
+            if corrupted:
+                logger.error("缓冲文件 %s 中有 %d 条记录校验失败，回放时跳过", path, corrupted)
+            if good < size:
+                logger.warning("缓冲文件 %s 在 %d 字节处有不完整的记录，截断 %d 字节", path, good, size - good)
+                with open(path, "r+b") as f:
+                    f.truncate(good)
+            pending_bytes += good - offset
+        current = max(segments[-1] if segments else checkpoint.segment, checkpoint.segment)
+        if pending:
+            logger.warning("缓冲中有 %d 条待回放记录（%.1f KB）", pending, pending_bytes / 1024)
+        return pending, pending_bytes, current
+
+    def _update_gauges(self):
+        SPOOL_RECORDS.set(self.pending)
+        SPOOL_BYTES.set(self.pending_bytes)
+
+    # ------------------------------------------------------------------ 写入
+
+    def append(self, statement: str, params):
+        """追加一条记录；写入操作系统后返回，fsync 由后台线程按批完成"""
+        line = encode_record(time.time(), statement, params)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("缓冲已关闭")
+            if self._segment_size + len(line) > self.segment_bytes and self._segment_size > 0:
+                self._rotate()
+            self._file.write(line)
+            self._file.flush()
+            self._segment_size += len(line)
+            self.pending += 1
+            self.pending_bytes += len(line)
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_batch:
+                self._synced.notify()
+        SPOOL_WRITES.inc()
+        self._update_gauges()
+
+    def _fsync(self):
+        """调用方持有锁，仅用于切换分段与关闭"""
+        if self._unsynced:
+            with SPOOL_FSYNC_DURATION.time():
+                os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def _take_unsynced(self) -> Optional[int]:
+        """
+        调用方持有锁：取出当前分段文件描述符的副本并清零未同步计数，没有未同步记录时返回 None
+
+        fsync 在释放锁之后对副本执行，期间分段被切换或关闭也不影响副本
+        """
+        if not self._unsynced:
+            return None
+        self._unsynced = 0
+        return os.dup(self._file.fileno())
+
+    @staticmethod
+    def _fsync_fd(fd: Optional[int]):
+        """在锁外同步并关闭 _take_unsynced 返回的文件描述符，同步期间 append 不会被阻塞"""
+        if fd is None:
+            return
+        try:
+            with SPOOL_FSYNC_DURATION.time():
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _rotate(self):
+        """切换到新分段，调用方持有锁"""
+        self._fsync()
+        self._file.close()
+        self._segment += 1
+        self._file = open(self._path(self._segment), "ab")
+        self._segment_size = 0
+
+    def _flush_loop(self):
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                self._synced.wait(self.fsync_interval)
+                if self._closed:
+                    return
+                fd = self._take_unsynced()
+            try:
+                self._fsync_fd(fd)
+            except OSError as e:
+                logger.error(f"缓冲文件 fsync 失败: {e}")
+
+    def sync(self):
+        with self._lock:
+            fd = self._take_unsynced()
+        self._fsync_fd(fd)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._fsync()
+            self._file.close()
+            self._closed = True
+            self._synced.notify_all()
+        self._flusher.join(timeout=1)
+        self._lock_file.close()
+
+    # ------------------------------------------------------------------ 回放
+
+    def read_batch(self, max_records: int) -> Batch:
+        """
+        从 checkpoint 开始按顺序读取最多 max_records 条记录，不移动 checkpoint
+        """
+        records = []
+        segment, offset = self._checkpoint
+        nbytes = 0
+        while len(records) < max_records:
+            # 先确认是否已有更新的分段：有则当前分段已写完，读到末尾后可以切换
+            has_next = segment < self._segment
+            try:
+                with open(self._path(segment), "rb") as f:
+                    f.seek(offset)
+                    for line in f:
+                        record = decode_record(line)
+                        if record is None:
+                            if line.endswith(b"\n"):
+                                # 完整但校验失败的行只可能来自文件损坏，跳过以免阻塞回放
+                                logger.error("缓冲文件 %s 偏移 %d 处的记录校验失败，已跳过", self._path(segment), offset)
+                                offset += len(line)
+                                nbytes += len(line)
+                                continue
+                            break  # 正在写入的行，下次再读
+                        records.append(record)
+                        offset += len(line)
+                        nbytes += len(line)
+                        if len(records) >= max_records:
+                            break
+            except FileNotFoundError:
+                pass
+            if len(records) >= max_records or not has_next:
+                break
+            segment, offset = segment + 1, 0
+        return Batch(records, Position(segment, offset), nbytes)
+
+    def commit(self, batch: Batch):
+        """
+        标记 batch 已回放：保存 checkpoint，删除已回放完的分段；缓冲清空时从新分段重新开始
+        """
+        with self._lock:
+            self.pending -= len(batch.records)
+            self.pending_bytes -= batch.nbytes
+            position = batch.end
+            if self.pending == 0 and position.segment == self._segment and position.offset == self._segment_size:
+                # 全部回放完成，切换到新分段以便删除旧文件、回收空间
+                self._rotate()
+                position = Position(self._segment, 0)
+            self._save_checkpoint(position)
+            for segment in self._segments():
+                if segment < position.segment:
+                    os.remove(self._path(segment))
+        self._update_gauges()
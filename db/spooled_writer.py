@@ -0,0 +1,156 @@
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict
+
+import pymysql
+
+from config import SPOOL_REPLAY_BATCH
+from metrics import SPOOL_REPLAYED, SPOOL_REJECTED, SPOOL_REPLAY_LAG
+from .circuit_breaker import CircuitBreaker
+from .spool import Spool
+
+logger = logging.getLogger(__name__)
+
+# 数据库不可用（连接失败、超时、锁等待、表结构未迁移等）时的异常，这类写入进入缓冲等待回放；
+# 其他异常（数据错误、主键冲突等）说明这一行本身有问题，重试也不会成功
+TRANSIENT_ERRORS = (
+    pymysql.err.OperationalError, pymysql.err.InterfaceError,
+    sqlite3.OperationalError, ConnectionError, TimeoutError,
+)
+
+
+class SpooledWriter:
+    """
+    带本地缓冲的写入器
+
+    - 数据库正常且缓冲为空时直接写入
+    - 写入失败或熔断器断开时追加到本地缓冲；缓冲非空期间所有写入都进入缓冲，保证写入顺序
+    - 后台线程在熔断器允许时按批回放缓冲，语句需要按 row_key 幂等（重复回放不会产生重复行）
+
+    参数:
+        db_manager: 提供 save(sql, params, raise_errors) / save_many 的数据库管理器
+        statements: 语句名到 INSERT 语句的映射，缓冲中只记录语句名
+    """
+
+    def __init__(self, db_manager, statements: Dict[str, str], spool: Spool, breaker: CircuitBreaker = None,
+                 replay_batch: int = SPOOL_REPLAY_BATCH):
+        self.db_manager = db_manager
+        self.statements = statements
+        self.spool = spool
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.replay_batch = replay_batch
+        self._lock = threading.Lock()
+        self._spooling = spool.pending > 0
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "SpooledWriter":
+        self._thread = threading.Thread(target=self._replay_loop, name="spool-replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            if self._thread.is_alive():
+                # 回放线程仍在读取缓冲或写入 checkpoint，此时关闭会让它访问已关闭的文件；
+                # 保留缓冲文件打开，已追加的记录都已写入操作系统，下次启动时继续回放
+                logger.warning("缓冲回放线程未在 5 秒内退出，不关闭本地缓冲")
+                return
+        self.spool.close()
+
+    def _to_spool(self, statement: str, params):
+        """调用方持有锁"""
+        self.spool.append(statement, params)
+        self._spooling = True
+        self._wakeup.set()
+
+    def save(self, statement: str, params):
+        # 直接写入也在锁内完成：其他线程写入失败转入缓冲后，之后的行不会越过缓冲中的行先到达数据库
+        # （同一根K线未确认与已确认的行按 MAX(id) 取最新，顺序不能乱）
+        with self._lock:
+            if self._spooling or not self.breaker.closed:
+                self._to_spool(statement, params)
+                return
+            try:
+                self.db_manager.save(self.statements[statement], params, raise_errors=True)
+            except TRANSIENT_ERRORS as e:
+                self.breaker.record_failure()
+                logger.warning(f"数据库写入失败，写入本地缓冲: {e}")
+                self._to_spool(statement, params)
+            except Exception as e:
+                # 数据本身有问题的行重试也不会成功，记录后丢弃
+                SPOOL_REJECTED.labels("write").inc()
+                logger.error(f"写入被数据库拒绝，已丢弃: {statement} {params}: {e}")
+            else:
+                self.breaker.record_success()
+
+    # ------------------------------------------------------------------ 回放
+
+    def _insert(self, statement: str, rows: list):
+        sql = self.statements[statement]
+        try:
+            self.db_manager.save_many(sql, rows)
+        except TRANSIENT_ERRORS:
+            raise
+        except Exception:
+            # 批量写入因个别行的数据错误失败时逐行写入，跳过有问题的行
+            for params in rows:
+                try:
+                    self.db_manager.save(sql, params, raise_errors=True)
+                except TRANSIENT_ERRORS:
+                    raise
+                except Exception as e:
+                    SPOOL_REJECTED.labels("replay").inc()
+                    logger.error(f"回放记录被数据库拒绝，已丢弃: {statement} {params}: {e}")
+
+    def replay_once(self) -> int:
+        """
+        回放一批缓冲记录，返回回放的记录数；数据库不可用时抛出异常
+        """
+        batch = self.spool.read_batch(self.replay_batch)
+        if not batch.records:
+            return 0
+        SPOOL_REPLAY_LAG.set(max(time.time() - batch.records[0][0], 0.0))
+
+        # 按语句分组批量写入，同一语句内保持原有顺序
+        grouped: Dict[str, list] = {}
+        for _, statement, params in batch.records:
+            grouped.setdefault(statement, []).append(params)
+        for statement, rows in grouped.items():
+            self._insert(statement, rows)
+
+        # 写入成功后才移动 checkpoint；若在此之前崩溃，重启后重复回放由 row_key 去重
+        self.spool.commit(batch)
+        self.breaker.record_success()
+        SPOOL_REPLAYED.inc(len(batch.records))
+        with self._lock:
+            if self.spool.pending == 0:
+                self._spooling = False
+                SPOOL_REPLAY_LAG.set(0)
+                logger.info("本地缓冲回放完成，恢复直接写入数据库")
+        return len(batch.records)
+
+    def _replay_loop(self):
+        while not self._stop.is_set():
+            if self.spool.pending == 0:
+                self._wakeup.wait(1.0)
+                self._wakeup.clear()
+                continue
+            wait = self.breaker.wait_time()
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+            try:
+                self.replay_once()
+            except TRANSIENT_ERRORS as e:
+                self.breaker.record_failure()
+                logger.warning(f"回放本地缓冲失败，{self.breaker.reset_timeout:g} 秒后重试: {e}")
+            except Exception as e:
+                logger.error(f"回放本地缓冲出错: {e}", exc_info=True)
+                self._stop.wait(self.breaker.reset_timeout)
@@ -0,0 +1,350 @@
+function App() {
+  const chartContainerRef = React.useRef(null);
+  const resizeObserver = React.useRef();
+  const chart = React.useRef(null);
+  const candleSeries = React.useRef(null);
+
+  // K线回放
+  const [isPlaying, setIsPlaying] = React.useState(false);
+  const [playbackIndex, setPlaybackIndex] = React.useState(0);
+  const [autoPlay, setAutoPlay] = React.useState(false);
+  const [startPlaybackTime, setStartPlaybackTime] = React.useState("");
+  const [endPlaybackTime, setEndPlaybackTime] = React.useState("");
+  // K线回放数据
+  const [playbackCandlestickData, setPlaybackCandlestickData] =
+    React.useState([]);
+
+  function getCandlestickData(t) {
+    return axios.post(
+      "/api/candlestick",
+      {
+        time: t ? "realtime" : "",
+        startTime: startPlaybackTime,
+        endTime: endPlaybackTime,
+      },
+      {
+        timeout: 0,
+      }
+    );
+  }
+
+  function getPattern(data) {
+    return axios.post("/api/pattern", data);
+  }
+
+  function initData(success) {
+    getCandlestickData().then((res) => {
+      const data = res.data.map((item) => {
+        return {
+          ...item,
+          time: new Date(item.time).getTime(),
+        };
+      });
+      candleSeries.current.setData(data);
+      if (success && typeof success === "function") {
+        success();
+      }
+    });
+  }
+
+  function resetPlayback() {
+    setAutoPlay(false);
+    setIsPlaying(false);
+    setPlaybackIndex(0);
+  }
+
+  const handlePlaybackNext = () => {
+    if (isPlaying && playbackIndex < playbackCandlestickData.length) {
+      const nextIndex = playbackIndex + 1;
+      const nextCandlestick = playbackCandlestickData[nextIndex];
+      candleSeries.current.update(nextCandlestick);
+      setPlaybackIndex(nextIndex);
+
+      getPattern(nextCandlestick).then((res) => {
+        console.log(res);
+      });
+    } else {
+      setIsPlaying(false);
+    }
+  };
+
+  const handlePlaybackPrev = () => {
+    if (isPlaying && playbackIndex > 0) {
+      const prevIndex = playbackIndex - 1;
+      candleSeries.current.setData(
+        playbackCandlestickData.slice(0, prevIndex)
+      );
+      setPlaybackIndex(prevIndex);
+    }
+  };
+
+  React.useEffect(() => {
+    const socket = io(window.origin);
+    socket.on("candlestick", (data) => {
+      if (!isPlaying && candleSeries.current) {
+        candleSeries.current.update({
+          ...data,
+          time: new Date(data.time).getTime(),
+        });
+      }
+    });
+
+    const chartOptions = {
+      width: chartContainerRef.current.clientWidth,
+      height: chartContainerRef.current.clientHeight,
+      layout: {
+        background: { type: "solid", color: "#181B23" }, // 深色背景
+        textColor: "#D1D4DC", // 深色主题下的文字颜色
+        fontFamily: "Arial",
+      },
+      grid: {
+        vertLines: {
+          color: "#2c3b54",
+        },
+        horzLines: {
+          color: "#2c3b54",
+        },
+      },
+      crosshair: {
+        mode: LightweightCharts.CrosshairMode.Normal,
+      },
+      localization: {
+        locale: "zh-CN",
+        timeFormatter: (timestamp) => {
+          const date = new Date(timestamp);
+          const year = date.getFullYear().toString();
+          const month = (date.getMonth() + 1).toString().padStart(2, "0");
+          const day = date.getDate().toString().padStart(2, "0");
+          const hours = date.getHours().toString().padStart(2, "0");
+          const minutes = date.getMinutes().toString().padStart(2, "0");
+          return `${year}-${month}-${day} ${hours}:${minutes}`;
+        },
+      },
+    };
+
+    // 创建图表实例
+    chart.current = LightweightCharts.createChart(
+      chartContainerRef.current,
+      chartOptions
+    );
+
+    candleSeries.current = chart.current.addSeries(
+      LightweightCharts.CandlestickSeries,
+      {
+        upColor: "#ef5350",
+        downColor: "#26a69a",
+        borderVisible: false,
+        wickUpColor: "#ef5350",
+        wickDownColor: "#26a69a",
+      }
+    );
+
+    // 示例K线数据
+    initData();
+
+    // 清理函数
+    return () => {
+      socket.disconnect();
+      chart.current.remove();
+    };
+  }, []);
+
+  React.useEffect(() => {
+    resizeObserver.current = new ResizeObserver((entries) => {
+      const { width, height } = entries[0].contentRect;
+      chart.current.applyOptions({ width, height });
+      setTimeout(() => {
+        chart.current.timeScale().fitContent();
+      }, 0);
+    });
+
+    resizeObserver.current.observe(chartContainerRef.current);
+
+    return () => resizeObserver.current.disconnect();
+  }, []);
+
+  let interval = null;
+
+  const handlePlayback = (auto) => {
+    if (isPlaying || autoPlay) {
+      initData();
+      resetPlayback();
+      if (interval) {
+        clearInterval(interval);
+      }
+      return;
+    }
+    // 清空K线
+    candleSeries.current.setData([]);
+    // 设置K线回放状态
+    setIsPlaying(true);
+    // 设置K线回放索引
+    setPlaybackIndex(0);
+
+    if (auto) {
+      setAutoPlay(true);
+      getCandlestickData(true).then((res) => {
+        const data = res.data.map((item) => {
+          return {
+            ...item,
+            time: new Date(item.time).getTime(),
+          };
+        });
+        setPlaybackCandlestickData(data);
+
+        let i = 0;
+        candleSeries.current.update(data[i]);
+        interval = setInterval(() => {
+          i++;
+          if (i <= data.length - 1) {
+            const nextCandlestick = data[i];
+            candleSeries.current.update(nextCandlestick);
+          }
+        }, 10);
+      });
+    } else {
+      getCandlestickData().then((res) => {
+        const data = res.data.map((item) => {
+          return {
+            ...item,
+            time: new Date(item.time).getTime(),
+          };
+        });
+        // 设置K线回放数据
+        setPlaybackCandlestickData(data);
+      });
+    }
+  };
+
+  const handleBuy = () => {
+    console.log("做多");
+  };
+  const handleSell = () => {
+    console.log("做空");
+  };
+  const handleClose = () => {
+    console.log("平仓");
+  };
+
+  return (
+    <div
+      style={{
+        width: "100%",
+        height: "100%",
+        display: "flex",
+        padding: "12px",
+      }}
+    >
+      <div
+        ref={chartContainerRef}
+        style={{ width: "0", flex: 1, height: "100%" }}
+      />
+      <div
+        style={{
+          width: "400px",
+          height: "100%",
+          marginLeft: "12px",
+          display: "flex",
+          flexDirection: "column",
+          gap: "12px",
+        }}
+      >
+        <div className="card">
+          <h3>TSLL</h3>
+          <p style={{ fontSize: "12px", color: "rgba(255,255,255,0.5)" }}>
+            {new Date().toLocaleString()}
+          </p>
+        </div>
+        <div className="card">
+          <h3>{isPlaying ? "K线回放" : "正常模式"}</h3>
+          <input
+            type="datetime-local"
+            value={startPlaybackTime}
+            onChange={(e) =>
+              setStartPlaybackTime(e.target.value.replace("T", " "))
+            }
+          />
+          <input
+            type="datetime-local"
+            style={{ marginLeft: "4px" }}
+            value={endPlaybackTime}
+            onChange={(e) =>
+              setEndPlaybackTime(e.target.value.replace("T", " "))
+            }
+          />
+
+          {!isPlaying ? (
+            <>
+              <div
+                className="button"
+                onClick={() => handlePlayback(false)}
+              >
+                手动回放
+              </div>
+              <div
+                className="button"
+                onClick={() => handlePlayback(true)}
+                style={{ marginLeft: "4px" }}
+              >
+                自动回放
+              </div>
+            </>
+          ) : (
+            <div className="button" onClick={handlePlayback}>
+              正常模式
+            </div>
+          )}
+          {isPlaying && !autoPlay ? (
+            <>
+              <div
+                className="button"
+                style={{ marginLeft: "4px" }}
+                onClick={handlePlaybackPrev}
+              >
+                上一根
+              </div>
+              <div
+                className="button"
+                style={{ marginLeft: "4px" }}
+                onClick={handlePlaybackNext}
+              >
+                下一根
+              </div>
+            </>
+          ) : (
+            <></>
+          )}
+        </div>
+        {!isPlaying && (
+          <div className="card">
+            <h3>快捷操作</h3>
+            <div
+              className="button buy"
+              style={{ marginLeft: "4px" }}
+              onClick={handleBuy}
+            >
+              做多
+            </div>
+            <div
+              className="button sell"
+              style={{ marginLeft: "4px" }}
+              onClick={handleSell}
+            >
+              做空
+            </div>
+            <div
+              className="button close"
+              style={{ marginLeft: "4px" }}
+              onClick={handleClose}
+            >
+              平仓
+            </div>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+}
+
+const root = ReactDOM.createRoot(document.getElementById("root"));
+root.render(<App />);
@@ -0,0 +1,7 @@
+from .base import Indicator, as_arrays
+from .moving_average import SMA, EMA
+from .volatility import ATR
+from .momentum import RSI
+from .volume import VWAP
+from .rolling import RollingHigh, RollingLow
+from .indicator_set import IndicatorSet
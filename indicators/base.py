@@ -0,0 +1,122 @@
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+NAN = float("nan")
+
+
+class Indicator:
+    """
+    技术指标基类
+
+    每个指标提供两种等价的计算方式：
+    - update(): 实时路径，每根K线 O(1) 增量更新
+    - batch(): 历史数据，基于 NumPy 数组一次性计算整段序列
+
+    两者对同一序列给出相同的结果，尚未满足计算条件（预热期）的位置为 NaN
+    """
+    name = "indicator"
+
+    def __init__(self, **params):
+        self.params = params
+        self.value: float = NAN
+
+    @property
+    def key(self) -> str:
+        """指标唯一标识，参数相同的指标共享同一个实例"""
+        if not self.params:
+            return self.name
+        return f"{self.name}(" + ",".join(f"{v}" for v in self.params.values()) + ")"
+
+    @property
+    def ready(self) -> bool:
+        return not math.isnan(self.value)
+
+    def reset(self):
+        self.value = NAN
+
+    def update(self, candle) -> float:
+        """
+        用一根新K线更新指标
+
+        参数:
+            candle: 具有 open/high/low/close/volume 属性的K线（如 patterns.CandleData）
+
+        返回:
+            更新后的指标值，预热期为 NaN
+        """
+        raise NotImplementedError
+
+    def batch(self, data: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        对整段历史计算指标
+
+        参数:
+            data: 包含 open/high/low/close/volume 等键的 NumPy 数组字典
+
+        返回:
+            与输入等长的 float64 数组
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return self.key
+
+
+def as_arrays(candles) -> Dict[str, np.ndarray]:
+    """将K线对象列表转换为 batch() 所需的数组字典"""
+    fields = ("open", "high", "low", "close", "volume")
+    return {
+        field: np.fromiter((float(getattr(c, field, 0.0) or 0.0) for c in candles), dtype=np.float64, count=len(candles))
+        for field in fields
+    }
+
+
+def wilder_smooth(values: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+    """
+    Wilder 平滑（alpha = 1/period），以前 period 个值的简单平均作为初值
+
+    递推依赖上一期结果无法向量化，此处在 Python 浮点数上逐个计算，运算顺序与增量版本完全一致
+
+    参数:
+        start: 第一个有效值的下标，之前的位置视为无效
+    """
+    out = np.full(len(values), np.nan)
+    seed_end = start + period
+    if len(values) < seed_end:
+        return out
+    items = values.tolist()
+    total = 0.0
+    for i in range(start, seed_end):
+        total += items[i]
+    avg = total / period
+    out[seed_end - 1] = avg
+    for i in range(seed_end, len(items)):
+        avg = (avg * (period - 1) + items[i]) / period
+        out[i] = avg
+    return out
+
+
+class _Seeded:
+    """先累计 period 个值求简单平均，再按递推公式平滑的增量状态"""
+
+    def __init__(self, period: int, alpha: Optional[float] = None):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.total = 0.0
+        self.value = NAN
+
+    def push(self, x: float) -> float:
+        if self.count < self.period:
+            self.count += 1
+            self.total += x
+            if self.count == self.period:
+                self.value = self.total / self.period
+            return self.value
+        if self.alpha is None:
+            self.value = (self.value * (self.period - 1) + x) / self.period
+        else:
+            self.value = self.value + self.alpha * (x - self.value)
+        return self.value
@@ -0,0 +1,61 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .base import Indicator
+
+
+class IndicatorSet:
+    """
+    指标集合
+
+    多个检测器声明的相同指标（key 相同）只保留一个实例，每根K线只计算一次
+    """
+
+    def __init__(self, indicators: Iterable[Indicator] = ()):
+        self._indicators: Dict[str, Indicator] = {}
+        self.register(indicators)
+
+    @classmethod
+    def for_detectors(cls, detectors) -> "IndicatorSet":
+        """收集所有检测器通过 required_indicators() 声明的指标"""
+        indicator_set = cls()
+        for detector in detectors:
+            required = getattr(detector, "required_indicators", None)
+            if required is not None:
+                indicator_set.register(required())
+        return indicator_set
+
+    def register(self, indicators: Iterable[Indicator]) -> List[Indicator]:
+        """
+        注册指标，已存在相同 key 的指标时返回已有实例
+        """
+        result = []
+        for indicator in indicators:
+            result.append(self._indicators.setdefault(indicator.key, indicator))
+        return result
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._indicators
+
+    def __len__(self) -> int:
+        return len(self._indicators)
+
+    def __iter__(self):
+        return iter(self._indicators.values())
+
+    def reset(self):
+        for indicator in self._indicators.values():
+            indicator.reset()
+
+    def update(self, candle) -> Dict[str, float]:
+        """用一根新K线更新所有指标，返回 {key: 当前值}"""
+        return {key: indicator.update(candle) for key, indicator in self._indicators.items()}
+
+    @property
+    def values(self) -> Dict[str, float]:
+        return {key: indicator.value for key, indicator in self._indicators.items()}
+
+    def batch(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """对整段历史计算所有指标，返回 {key: 数组}"""
+        return {key: indicator.batch(data) for key, indicator in self._indicators.items()}
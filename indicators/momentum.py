@@ -0,0 +1,61 @@
+import numpy as np
+
+from .base import Indicator, NAN, _Seeded
+
+
+class RSI(Indicator):
+    """
+    相对强弱指标（Wilder 平滑）
+
+    RSI = 100 - 100 / (1 + 平均涨幅 / 平均跌幅)，需要 period + 1 根K线预热
+    """
+    name = "rsi"
+
+    def __init__(self, period: int = 14, source: str = "close"):
+        super().__init__(period=period, source=source)
+        self.period = period
+        self.source = source
+        self._prev = NAN
+        self._gain = _Seeded(period)
+        self._loss = _Seeded(period)
+
+    def reset(self):
+        super().reset()
+        self._prev = NAN
+        self._gain = _Seeded(self.period)
+        self._loss = _Seeded(self.period)
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_gain != avg_gain:
+            return NAN
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def _push(self, x: float) -> float:
+        if self._prev != self._prev:
+            self._prev = x
+            return NAN
+        change = x - self._prev
+        self._prev = x
+        gain = self._gain.push(change if change > 0 else 0.0)
+        loss = self._loss.push(-change if change < 0 else 0.0)
+        return self._rsi(gain, loss)
+
+    def update(self, candle) -> float:
+        self.value = self._push(float(getattr(candle, self.source)))
+        return self.value
+
+    def batch(self, data) -> np.ndarray:
+        values = data[self.source]
+        out = np.full(len(values), np.nan)
+        if len(values) < 2:
+            return out
+        change = np.diff(values)
+        gains = np.where(change > 0, change, 0.0).tolist()
+        losses = np.where(change < 0, -change, 0.0).tolist()
+        gain_state, loss_state = _Seeded(self.period), _Seeded(self.period)
+        for i in range(len(gains)):
+            out[i + 1] = self._rsi(gain_state.push(gains[i]), loss_state.push(losses[i]))
+        return out
@@ -0,0 +1,75 @@
+from collections import deque
+
+import numpy as np
+
+from .base import Indicator, _Seeded
+
+
+class SMA(Indicator):
+    """
+    简单移动平均
+
+    用累计和之差 (C[i] - C[i-period]) / period 计算，增量版本与 np.cumsum 的累加顺序相同，结果一致
+    """
+    name = "sma"
+
+    def __init__(self, period: int = 20, source: str = "close"):
+        super().__init__(period=period, source=source)
+        self.period = period
+        self.source = source
+        self._total = 0.0
+        # 最近 period + 1 个累计和，最早的一个用于相减
+        self._sums = deque([0.0], maxlen=period + 1)
+
+    def reset(self):
+        super().reset()
+        self._total = 0.0
+        self._sums = deque([0.0], maxlen=self.period + 1)
+
+    def update(self, candle) -> float:
+        self._total += float(getattr(candle, self.source))
+        self._sums.append(self._total)
+        if len(self._sums) == self.period + 1:
+            self.value = (self._sums[-1] - self._sums[0]) / self.period
+        return self.value
+
+    def batch(self, data) -> np.ndarray:
+        values = data[self.source]
+        out = np.full(len(values), np.nan)
+        if len(values) >= self.period:
+            sums = np.concatenate(([0.0], np.cumsum(values)))
+            out[self.period - 1:] = (sums[self.period:] - sums[:-self.period]) / self.period
+        return out
+
+
+class EMA(Indicator):
+    """
+    指数移动平均，alpha = 2 / (period + 1)，以前 period 根的简单平均作为初值
+    """
+    name = "ema"
+
+    def __init__(self, period: int = 20, source: str = "close"):
+        super().__init__(period=period, source=source)
+        self.period = period
+        self.source = source
+        self.alpha = 2.0 / (period + 1)
+        self._state = _Seeded(period, self.alpha)
+
+    def reset(self):
+        super().reset()
+        self._state = _Seeded(self.period, self.alpha)
+
+    def update(self, candle) -> float:
+        self.value = self._state.push(float(getattr(candle, self.source)))
+        return self.value
+
+    def batch(self, data) -> np.ndarray:
+        values = data[self.source]
+        out = np.full(len(values), np.nan)
+        if len(values) < self.period:
+            return out
+        # 递推依赖上一期结果，逐个计算以保证与 update() 的运算顺序一致
+        state = _Seeded(self.period, self.alpha)
+        for i, x in enumerate(values.tolist()):
+            out[i] = state.push(x)
+        return out
@@ -0,0 +1,76 @@
+from collections import deque
+
+import numpy as np
+
+from .base import Indicator
+
+
+class _RollingExtreme(Indicator):
+    """
+    滚动窗口极值，使用单调队列，每根K线摊还 O(1)
+    """
+    source = "high"
+
+    def __init__(self, period: int = 20):
+        super().__init__(period=period)
+        self.period = period
+        self._index = 0
+        self._queue = deque()  # (下标, 值)，值单调
+
+    def reset(self):
+        super().reset()
+        self._index = 0
+        self._queue.clear()
+
+    @staticmethod
+    def _dominates(new: float, old: float) -> bool:
+        raise NotImplementedError
+
+    def update(self, candle) -> float:
+        x = float(getattr(candle, self.source))
+        queue = self._queue
+        while queue and self._dominates(x, queue[-1][1]):
+            queue.pop()
+        queue.append((self._index, x))
+        if queue[0][0] <= self._index - self.period:
+            queue.popleft()
+        self._index += 1
+        if self._index >= self.period:
+            self.value = queue[0][1]
+        return self.value
+
+    def _reduce(self, windows: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def batch(self, data) -> np.ndarray:
+        values = data[self.source]
+        out = np.full(len(values), np.nan)
+        if len(values) >= self.period:
+            out[self.period - 1:] = self._reduce(np.lib.stride_tricks.sliding_window_view(values, self.period))
+        return out
+
+
+class RollingHigh(_RollingExtreme):
+    """最近 period 根K线的最高价"""
+    name = "rolling_high"
+    source = "high"
+
+    @staticmethod
+    def _dominates(new: float, old: float) -> bool:
+        return new >= old
+
+    def _reduce(self, windows):
+        return windows.max(axis=1)
+
+
+class RollingLow(_RollingExtreme):
+    """最近 period 根K线的最低价"""
+    name = "rolling_low"
+    source = "low"
+
+    @staticmethod
+    def _dominates(new: float, old: float) -> bool:
+        return new <= old
+
+    def _reduce(self, windows):
+        return windows.min(axis=1)
@@ -0,0 +1,48 @@
+import numpy as np
+
+from .base import Indicator, NAN, _Seeded
+
+
+class ATR(Indicator):
+    """
+    平均真实波幅（Wilder 平滑）
+
+    真实波幅 TR = max(high - low, |high - 前收|, |low - 前收|)，第一根K线取 high - low
+    """
+    name = "atr"
+
+    def __init__(self, period: int = 14):
+        super().__init__(period=period)
+        self.period = period
+        self._prev_close = NAN
+        self._state = _Seeded(period)
+
+    def reset(self):
+        super().reset()
+        self._prev_close = NAN
+        self._state = _Seeded(self.period)
+
+    @staticmethod
+    def true_range(high: float, low: float, prev_close: float) -> float:
+        if prev_close != prev_close:  # NaN
+            return high - low
+        return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+    def update(self, candle) -> float:
+        high, low = float(candle.high), float(candle.low)
+        tr = self.true_range(high, low, self._prev_close)
+        self._prev_close = float(candle.close)
+        self.value = self._state.push(tr)
+        return self.value
+
+    def batch(self, data) -> np.ndarray:
+        high, low, close = data["high"], data["low"], data["close"]
+        tr = high - low
+        if len(tr) > 1:
+            prev_close = close[:-1]
+            tr[1:] = np.maximum(np.maximum(tr[1:], np.abs(high[1:] - prev_close)), np.abs(low[1:] - prev_close))
+        out = np.full(len(tr), np.nan)
+        state = _Seeded(self.period)
+        for i, x in enumerate(tr.tolist()):
+            out[i] = state.push(x)
+        return out
@@ -0,0 +1,55 @@
+import numpy as np
+
+from .base import Indicator
+
+
+class VWAP(Indicator):
+    """
+    成交量加权平均价，典型价格 (high + low + close) / 3 按成交量加权
+
+    session_bars > 0 时每 session_bars 根K线重新累计（如一个交易日的K线数量），0 表示从头累计
+    """
+    name = "vwap"
+
+    def __init__(self, session_bars: int = 0):
+        super().__init__(session_bars=session_bars)
+        self.session_bars = session_bars
+        self._pv = 0.0
+        self._volume = 0.0
+        self._count = 0
+
+    def reset(self):
+        super().reset()
+        self._pv = 0.0
+        self._volume = 0.0
+        self._count = 0
+
+    def update(self, candle) -> float:
+        if self.session_bars and self._count == self.session_bars:
+            self._pv, self._volume, self._count = 0.0, 0.0, 0
+        volume = float(candle.volume)
+        typical = (float(candle.high) + float(candle.low) + float(candle.close)) / 3
+        self._pv += typical * volume
+        self._volume += volume
+        self._count += 1
+        self.value = self._pv / self._volume if self._volume > 0 else float("nan")
+        return self.value
+
+    def batch(self, data) -> np.ndarray:
+        volume = data["volume"]
+        typical = (data["high"] + data["low"] + data["close"]) / 3
+        pv = typical * volume
+        n = len(volume)
+        if self.session_bars and n > self.session_bars:
+            # 按会话分段累计：每段内 cumsum 与增量版本的累加顺序一致
+            pv_sum = np.empty(n)
+            volume_sum = np.empty(n)
+            for start in range(0, n, self.session_bars):
+                end = start + self.session_bars
+                pv_sum[start:end] = np.cumsum(pv[start:end])
+                volume_sum[start:end] = np.cumsum(volume[start:end])
+        else:
+            pv_sum = np.cumsum(pv)
+            volume_sum = np.cumsum(volume)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(volume_sum > 0, pv_sum / volume_sum, np.nan)
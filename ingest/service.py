@@ -0,0 +1,120 @@
+import logging
+import time
+from decimal import ROUND_DOWN, Decimal
+from typing import Callable
+
+from longport.openapi import OrderSide, OrderType, Period, PushCandlestick, PushOrderChanged, PushQuote
+from longport.openapi import SubType, TimeInForceType, TopicType
+
+from metrics import QUOTES_RECEIVED, CANDLESTICKS_RECEIVED, QUOTE_EXCHANGE_DELAY, LAST_QUOTE_TIMESTAMP
+from metrics import CALLBACK_DURATION, CALLBACK_TO_PERSIST, CALLBACK_TO_EMIT, SOCKETIO_EMIT_DURATION
+
+logger = logging.getLogger(__name__)
+
+# 热路径上提前取得带标签的子指标，避免每次回调查找
+QUOTE_CALLBACK_DURATION = CALLBACK_DURATION.labels("quote")
+CANDLESTICK_CALLBACK_DURATION = CALLBACK_DURATION.labels("candlestick")
+QUOTE_TO_PERSIST = CALLBACK_TO_PERSIST.labels("quote")
+CANDLESTICK_TO_PERSIST = CALLBACK_TO_PERSIST.labels("candlestick")
+CANDLESTICK_EMIT_DURATION = SOCKETIO_EMIT_DURATION.labels("candlestick")
+
+
+class IngestService:
+    """
+    行情接入服务
+
+    负责订阅行情/订单推送，将数据写入数据库并通过 Socket.IO 推送给前端
+    """
+
+    def __init__(self, runtime, emit: Callable):
+        """
+        参数:
+            runtime: 提供 backend、candlestick_data_manager 的运行时对象
+            emit: Socket.IO 推送函数，签名与 socketio.emit 一致
+        """
+        self.runtime = runtime
+        self.emit = emit
+
+    @property
+    def quote_ctx(self):
+        return self.runtime.backend.quote_ctx
+
+    @property
+    def trade_ctx(self):
+        return self.runtime.backend.trade_ctx
+
+    def on_order_changed(self, event: PushOrderChanged):
+        if str(event.side) == "OrderSide.Buy" and  str(event.status) == "OrderStatus.Filled":
+            print("======================有新的买入订单======================")
+            # 当新订单提交完成之后，手动为用户设置止损
+            self.trade_ctx.submit_order(
+                event.symbol,
+                OrderType.MIT,
+                OrderSide.Sell,
+                event.executed_quantity,
+                TimeInForceType.GoodTilCanceled,
+                trigger_price=event.submitted_price * Decimal('0.9').quantize(Decimal('0.01'), rounding=ROUND_DOWN),
+                remark="程序止损",
+            )
+
+    @QUOTE_CALLBACK_DURATION.time()
+    def on_quote(self, symbol: str, event: PushQuote):
+        start = time.perf_counter()
+        QUOTES_RECEIVED.inc()
+        # 交易所时间戳到回调的延迟
+        exchange_ts = event.timestamp.timestamp()
+        QUOTE_EXCHANGE_DELAY.observe(max(time.time() - exchange_ts, 0.0))
+        LAST_QUOTE_TIMESTAMP.set(exchange_ts)
+        if event.current_volume == 0:
+           return
+        self.runtime.candlestick_data_manager.save_quote_data(symbol, event)
+        QUOTE_TO_PERSIST.observe(time.perf_counter() - start)
+
+    @CANDLESTICK_CALLBACK_DURATION.time()
+    def on_candlestick(self, symbol: str, event: PushCandlestick):
+        start = time.perf_counter()
+        CANDLESTICKS_RECEIVED.inc()
+        if event.candlestick.volume == 0:
+           return
+        # 保存K线数据到数据库
+        self.runtime.candlestick_data_manager.save_candlestick_data(symbol, event)
+        CANDLESTICK_TO_PERSIST.observe(time.perf_counter() - start)
+        if symbol != self.runtime.symbol:
+            # 股票列表中的其他股票只入库，图表只展示 SYMBOL
+            return
+        emit_start = time.perf_counter()
+        self.emit('candlestick', {'symbol': symbol, 'data': {
+            'open': float(event.candlestick.open),
+            'high': float(event.candlestick.high),
+            'low': float(event.candlestick.low),
+            'close': float(event.candlestick.close),
+            'volume': float(event.candlestick.volume),
+            'turnover': float(event.candlestick.turnover),
+            'time': event.candlestick.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        }})
+        end = time.perf_counter()
+        CANDLESTICK_EMIT_DURATION.observe(end - emit_start)
+        CALLBACK_TO_EMIT.observe(end - start)
+
+    def start(self):
+        """注册回调并订阅行情/订单推送"""
+        quote_ctx = self.quote_ctx
+        trade_ctx = self.trade_ctx
+
+        quote_ctx.set_on_candlestick(self.on_candlestick)
+        quote_ctx.set_on_quote(self.on_quote)
+
+        trade_ctx.set_on_order_changed(self.on_order_changed)
+
+        symbol = self.runtime.symbol
+        quote_ctx.subscribe([symbol], [SubType.Quote], is_first_push=True)
+        quote_ctx.subscribe_candlesticks(symbol, Period.Min_2)
+        # 扫描器股票列表只订阅K线入库，供扫描器批量读取
+        watchlist = [s for s in self.runtime.watchlist if s != symbol]
+        for other in watchlist:
+            quote_ctx.subscribe_candlesticks(other, Period.Min_2)
+
+        trade_ctx.subscribe([TopicType.Private])
+
+        self.runtime.backend.start()
+        logger.info("行情订阅完成: %s，股票列表K线: %d 个", symbol, len(watchlist))
@@ -1,115 +1,214 @@
-from decimal import ROUND_DOWN, ROUND_UP, Decimal
-import logging
-from datetime import datetime
-from longport.openapi import Config, QuoteContext, TradeContext, PushOrderChanged, OrderStatus, OrderType
-from longport.openapi import Period, PushCandlestick, PushQuote, SubType, TopicType, OrderSide, TimeInForceType
-from flask import Flask, jsonify, request
-from flask_socketio import SocketIO
-
-from config import SYMBOL
-from db import CandlestickDataManager
-from utils import setup_logging, setup_dotenv
-from patterns import CandleData
-from patterns import HammerPatternDetector
-from patterns import DojiPatternDetector
-from patterns import InvertedHammerPatternDetector
-from notifications import EmailNotifier
-
-setup_logging()
-setup_dotenv()
+import time
+
+# 记录进程启动时刻，用于统计导入耗时
+_process_start = time.perf_counter()
+
+import os
+import sys
+
+
+def _patch_web_process():
+    """
+    web 进程的协程补丁必须在导入其他模块（threading、logging、config 等）之前完成，
+    否则之前创建的锁不会被替换。此时还不能读取 config，异步模型取自 --async-mode 参数
+    （serve 启动 Web 进程时传入）或 ASYNC_MODE 环境变量
+
+    返回:
+        已应用的异步模型，非 web 进程或未打补丁时返回 None
+    """
+    args = sys.argv[1:]
+    if __name__ != "__main__" or not args or args[0] != "web":
+        return None
+    mode = os.getenv("ASYNC_MODE", "gevent")
+    if "--async-mode" in args[:-1]:
+        mode = args[args.index("--async-mode") + 1]
+    if mode == "gevent":
+        from gevent import monkey
+        monkey.patch_all()
+    elif mode == "eventlet":
+        import eventlet
+        eventlet.monkey_patch()
+    else:
+        return None
+    return mode
 
-logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
-socketio = SocketIO(app)
-
-patterns = [
-    HammerPatternDetector(),
-    # DojiPatternDetector(),
-    # InvertedHammerPatternDetector()
-]
-candlestick_data_manager = CandlestickDataManager()
-email_notifier = EmailNotifier()
-
-config = Config.from_env()
-quote_ctx = QuoteContext(config)
-trade_ctx = TradeContext(config)
-
-def on_order_changed(event: PushOrderChanged):
-    if str(event.side) == "OrderSide.Buy" and  str(event.status) == "OrderStatus.Filled":
-        print("======================有新的买入订单======================")
-        # 当新订单提交完成之后，手动为用户设置止损
-        trade_ctx.submit_order(
-            event.symbol,
-            OrderType.MIT,
-            OrderSide.Sell,
-            event.executed_quantity,
-            TimeInForceType.GoodTilCanceled,
-            trigger_price=event.submitted_price * Decimal('0.9').quantize(Decimal('0.01'), rounding=ROUND_DOWN),
-            remark="程序止损",
-        )
-
-def on_quote(symbol: str, event: PushQuote):
-    if event.current_volume == 0:
-       return
-    candlestick_data_manager.save_quote_data(symbol, event)
-
-def on_candlestick(symbol: str, event: PushCandlestick):
-    if event.candlestick.volume == 0:
-       return
-    # 保存K线数据到数据库
-    candlestick_data_manager.save_candlestick_data(symbol, event)
-    socketio.emit('candlestick', {'symbol': symbol, 'data': {
-        'open': float(event.candlestick.open),
-        'high': float(event.candlestick.high),
-        'low': float(event.candlestick.low),
-        'close': float(event.candlestick.close),
-        'volume': float(event.candlestick.volume),
-        'turnover': float(event.candlestick.turnover),
-        'time': event.candlestick.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-    }})
-
-@app.route('/')
-def index():
-    return app.send_static_file('index.html')
-
-@app.route('/api/candlestick', methods=["POST"])
-def candlestick():
-    parmas = request.json
-    time = parmas['time']
-    startTime = parmas['startTime']
-    endTime = parmas['endTime']
-    if time == "realtime":
-        return jsonify(candlestick_data_manager.get_candlestick_data(SYMBOL, realtime=True, startTime=startTime, endTime=endTime))
-    else:
-        return jsonify(candlestick_data_manager.get_candlestick_data(SYMBOL, realtime=False, startTime=startTime, endTime=endTime))
-
-@app.route('/api/pattern', methods=["POST"])
-def pattern():
-    parmas = request.json
-    for pattern in patterns:
-        pattern_res = pattern.detect(CandleData(open=parmas['open'], high=parmas['high'], low=parmas['low'], close=parmas['close']))
-        if pattern_res.is_detected:
-            return jsonify({
-               "pattern_name":pattern_res.pattern_name,
-               "pattern_desc":pattern_res.pattern_desc,
-               "is_detected":pattern_res.is_detected
-            })
-    return jsonify({
-        "is_detected": False
-    })
+_patched_async_mode = _patch_web_process()
 
-quote_ctx.set_on_candlestick(on_candlestick)
-quote_ctx.set_on_quote(on_quote)
+import argparse
+import logging
+import threading
+from datetime import datetime
 
-trade_ctx.set_on_order_changed(on_order_changed)
+from config import SERVER_MODE, WEB_HOST, WEB_PORT, WEB_WORKERS, ASYNC_MODE, MESSAGE_QUEUE_URL, INGEST_METRICS_PORT
+from config import SCANNER_ENABLED
+from utils import setup_logging
 
+logger = logging.getLogger(__name__)
 
-quote_ctx.subscribe([SYMBOL], [SubType.Quote], is_first_push=True)
-quote_ctx.subscribe_candlesticks(SYMBOL, Period.Min_2)
 
-trade_ctx.subscribe([TopicType.Private])
+def run_all():
+    """
+    开发模式：单进程内同时运行行情接入与 Werkzeug 开发服务器
+    """
+    from runtime import Runtime
+    from web import create_app
+    from ingest import IngestService
+
+    runtime = Runtime()
+    runtime.record_phase("imports", time.perf_counter() - _process_start)
+
+    app, socketio = create_app(runtime)
+    # 并行建立行情/交易连接、登录SMTP、预热缓存
+    runtime.start()
+
+    IngestService(runtime, socketio.emit).start()
+    if SCANNER_ENABLED:
+        from scanner import ScannerService
+        ScannerService(runtime.scanner, runtime.scan_results, socketio.emit).start()
+
+    logger.info("启动成功，当前北京时间：%s" % datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    socketio.run(app, host=WEB_HOST, port=WEB_PORT, debug=True, allow_unsafe_werkzeug=True)
+
+
+def run_ingest():
+    """
+    行情接入进程：订阅推送、入库，并通过消息队列把推送交给 Web 进程分发
+
+    longport SDK 在原生线程中回调，接入进程不做协程补丁，保持普通线程模型
+    """
+    from flask_socketio import SocketIO
+    from runtime import Runtime
+    from ingest import IngestService
+    from metrics import start_http_server
+
+    if not MESSAGE_QUEUE_URL:
+        raise SystemExit("ingest 进程需要配置 MESSAGE_QUEUE_URL")
+    runtime = Runtime()
+    runtime.record_phase("imports", time.perf_counter() - _process_start)
+    runtime.start(phases={
+        "quote_ctx": lambda: runtime.backend.quote_ctx,
+        "trade_ctx": lambda: runtime.backend.trade_ctx,
+        "smtp": lambda: runtime.email_notifier.connect(),
+        "spool": lambda: runtime.candlestick_data_manager.writer,
+        "profiler": lambda: runtime.profiler,
+    })
+    # 只写不读的 Socket.IO 客户端，emit 的消息经消息队列由 Web 进程推送给浏览器
+    emitter = SocketIO(message_queue=MESSAGE_QUEUE_URL, async_mode="threading")
+    IngestService(runtime, emitter.emit).start()
+    if INGEST_METRICS_PORT:
+        start_http_server(INGEST_METRICS_PORT)
+
+    logger.info("行情接入进程启动成功，当前北京时间：%s" % datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runtime.backend.close()
+        runtime.candlestick_data_manager.close()
+
+
+def run_scan():
+    """
+    扫描进程：每个K线周期收盘后扫描股票列表，结果写入文件供 Web 进程读取，并经消息队列推送 scanner 事件
+    """
+    from flask_socketio import SocketIO
+    from runtime import Runtime
+    from scanner import ScannerService
+
+    runtime = Runtime()
+    runtime.record_phase("imports", time.perf_counter() - _process_start)
+    emit = SocketIO(message_queue=MESSAGE_QUEUE_URL, async_mode="threading").emit if MESSAGE_QUEUE_URL else None
+    service = ScannerService(runtime.scanner, runtime.scan_results, emit)
+    logger.info("扫描进程启动成功，股票数量：%d", len(runtime.watchlist))
+    try:
+        service.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+
+
+def run_web(port: int, async_mode: str = ASYNC_MODE):
+    """
+    Web 进程：使用协程服务器处理 HTTP 与 Socket.IO 长连接，不连接券商
+
+    协程补丁在模块开头由 _patch_web_process 完成
+    """
+    if _patched_async_mode is None and async_mode in ("gevent", "eventlet"):
+        raise SystemExit(f"Web 进程需要通过 python main.py web 启动，以便在导入其他模块之前应用 {async_mode} 协程补丁")
+    if async_mode != _patched_async_mode:
+        logger.warning("--async-mode/ASYNC_MODE 为 %s，但启动时已应用 %s 协程补丁，按 %s 运行",
+                       async_mode, _patched_async_mode, _patched_async_mode)
+        async_mode = _patched_async_mode
+
+    from runtime import Runtime
+    from web import create_app
+
+    runtime = Runtime()
+    runtime.record_phase("imports", time.perf_counter() - _process_start)
+    app, socketio = create_app(runtime, async_mode=async_mode, message_queue=MESSAGE_QUEUE_URL)
+    runtime.start(phases={
+        "cache_warmup": runtime.warm_up_cache,
+        "profiler": lambda: runtime.profiler,
+    }, required=())
+
+    logger.info("Web 进程启动成功，监听 %s:%d", WEB_HOST, port)
+    socketio.run(app, host=WEB_HOST, port=port, debug=False, log_output=False)
+
+
+def run_serve(workers: int):
+    """
+    生产模式：守护 1 个行情接入进程与 workers 个 Web 进程
+
+    Web 进程分别监听 WEB_PORT ~ WEB_PORT + workers - 1，前端需通过按客户端 IP 粘滞的
+    负载均衡（见 scripts/nginx.conf）对外提供服务，Socket.IO 长连接必须始终落在同一进程
+    """
+    from runtime.supervisor import Supervisor, python_command
+
+    if not MESSAGE_QUEUE_URL:
+        raise SystemExit("prod 模式需要配置 MESSAGE_QUEUE_URL，例如 redis://localhost:6379/0")
+    workers = workers or os.cpu_count() or 1
+    entry = os.path.abspath(__file__)
+    commands = {"ingest": python_command(entry, "ingest")}
+    if SCANNER_ENABLED:
+        commands["scanner"] = python_command(entry, "scan")
+    for i in range(workers):
+        commands[f"web-{i}"] = python_command(entry, "web", "--port", str(WEB_PORT + i), "--async-mode", ASYNC_MODE)
+    logger.info("Web 进程监听端口 %d ~ %d，nginx upstream 配置:\n%s",
+                WEB_PORT, WEB_PORT + workers - 1, nginx_upstream(workers))
+    Supervisor(commands).run()
+
+
+def nginx_upstream(workers: int, port: int = WEB_PORT) -> str:
+    """生成与 serve 启动的 Web 进程对应的 nginx upstream 配置（见 scripts/nginx.conf）"""
+    servers = "".join(f"    server 127.0.0.1:{port + i};\n" for i in range(workers))
+    return "upstream trading_web {\n    ip_hash;\n" + servers + "}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TradingCandlestick")
+    parser.add_argument("role", nargs="?", choices=["all", "ingest", "web", "scan", "serve"],
+                        help="默认：dev 模式为 all，prod 模式为 serve")
+    parser.add_argument("--port", type=int, default=WEB_PORT, help="web 进程监听端口")
+    parser.add_argument("--workers", type=int, default=WEB_WORKERS, help="serve 模式下的 Web 进程数量，默认与 CPU 核数相同")
+    parser.add_argument("--async-mode", default=ASYNC_MODE, choices=["gevent", "eventlet"], help="web 进程的异步模型")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    role = args.role or ("serve" if SERVER_MODE == "prod" else "all")
+    if role == "all":
+        run_all()
+    elif role == "ingest":
+        run_ingest()
+    elif role == "web":
+        run_web(args.port, args.async_mode)
+    elif role == "scan":
+        run_scan()
+    else:
+        run_serve(args.workers)
 
 
-logger.info("启动成功，当前北京时间：%s" % datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-socketio.run(app, host='0.0.0.0', port=80, debug=True, allow_unsafe_werkzeug=True)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from .registry import REGISTRY, Registry, Counter, Gauge, Histogram
+from .profiler import SamplingProfiler
+from .server import start_http_server
+from .instruments import (
+    QUOTES_RECEIVED, CANDLESTICKS_RECEIVED, QUOTE_EXCHANGE_DELAY, CALLBACK_DURATION,
+    CALLBACK_TO_PERSIST, CALLBACK_TO_EMIT, SOCKETIO_EMIT_DURATION, LAST_QUOTE_TIMESTAMP,
+    DB_SAVE_DURATION, DB_QUERY_DURATION, DB_ERRORS,
+    HTTP_REQUEST_DURATION, HTTP_REQUESTS,
+    SIMULATOR_EVENTS, SIMULATOR_REPLAY_LAG,
+    STARTUP_PHASE_SECONDS,
+    SCANNER_DURATION, SCANNER_SYMBOLS, SCANNER_OVERRUNS,
+    DB_CIRCUIT_STATE, SPOOL_RECORDS, SPOOL_BYTES, SPOOL_WRITES, SPOOL_REPLAYED, SPOOL_REJECTED,
+    SPOOL_REPLAY_LAG, SPOOL_FSYNC_DURATION,
+)
@@ -0,0 +1,74 @@
+from .registry import REGISTRY
+
+# 交易所行情推送的延迟可能达到秒级，使用更宽的桶
+EXCHANGE_DELAY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# ==================行情回调=====================
+QUOTES_RECEIVED = REGISTRY.counter(
+    "quotes_received_total", "收到的实时行情推送数量")
+CANDLESTICKS_RECEIVED = REGISTRY.counter(
+    "candlesticks_received_total", "收到的K线推送数量")
+QUOTE_EXCHANGE_DELAY = REGISTRY.histogram(
+    "quote_exchange_delay_seconds", "交易所时间戳到进入行情回调的延迟",
+    buckets=EXCHANGE_DELAY_BUCKETS)
+CALLBACK_DURATION = REGISTRY.histogram(
+    "callback_duration_seconds", "行情回调总耗时", ["callback"])
+CALLBACK_TO_PERSIST = REGISTRY.histogram(
+    "callback_to_persist_seconds", "进入回调到数据写入数据库完成的耗时", ["kind"])
+CALLBACK_TO_EMIT = REGISTRY.histogram(
+    "callback_to_emit_seconds", "进入K线回调到 Socket.IO 推送完成的耗时")
+SOCKETIO_EMIT_DURATION = REGISTRY.histogram(
+    "socketio_emit_duration_seconds", "socketio.emit 调用耗时", ["event"])
+LAST_QUOTE_TIMESTAMP = REGISTRY.gauge(
+    "last_quote_timestamp_seconds", "最近一次行情推送的交易所时间戳（Unix秒）")
+
+# ==================数据库=====================
+DB_SAVE_DURATION = REGISTRY.histogram(
+    "db_save_duration_seconds", "DBManager.save 耗时（含建立连接）")
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds", "DBManager.query 耗时（含建立连接）")
+DB_ERRORS = REGISTRY.counter(
+    "db_errors_total", "数据库操作失败次数", ["operation"])
+
+# ==================HTTP=====================
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP 接口处理耗时", ["endpoint"])
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP 接口请求数量", ["endpoint", "status"])
+
+# ==================模拟器=====================
+SIMULATOR_EVENTS = REGISTRY.counter(
+    "simulator_events_total", "模拟器回放的事件数量")
+SIMULATOR_REPLAY_LAG = REGISTRY.gauge(
+    "simulator_replay_lag_seconds", "模拟器回放落后于目标倍速的时间")
+
+# ==================启动=====================
+STARTUP_PHASE_SECONDS = REGISTRY.gauge(
+    "startup_phase_seconds", "启动各阶段耗时", ["phase"])
+
+# ==================扫描器=====================
+SCANNER_DURATION = REGISTRY.histogram(
+    "scanner_duration_seconds", "一次全量扫描各阶段耗时", ["phase"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300))
+SCANNER_SYMBOLS = REGISTRY.gauge(
+    "scanner_symbols", "最近一次扫描的股票数量", ["status"])
+SCANNER_OVERRUNS = REGISTRY.counter(
+    "scanner_overruns_total", "扫描耗时超过一个K线周期的次数")
+
+# ==================本地缓冲=====================
+DB_CIRCUIT_STATE = REGISTRY.gauge(
+    "db_circuit_state", "数据库熔断器状态（0 闭合，1 断开，2 半开）", ["name"])
+SPOOL_RECORDS = REGISTRY.gauge(
+    "spool_records", "本地缓冲中待回放的记录数")
+SPOOL_BYTES = REGISTRY.gauge(
+    "spool_bytes", "本地缓冲中待回放的字节数")
+SPOOL_WRITES = REGISTRY.counter(
+    "spool_writes_total", "写入本地缓冲的记录数")
+SPOOL_REPLAYED = REGISTRY.counter(
+    "spool_replayed_total", "从本地缓冲回放到数据库的记录数")
+SPOOL_REJECTED = REGISTRY.counter(
+    "spool_rejected_total", "被数据库拒绝（数据错误）而丢弃的记录数（stage=write 直接写入，replay 回放）", ["stage"])
+SPOOL_REPLAY_LAG = REGISTRY.gauge(
+    "spool_replay_lag_seconds", "最早一条待回放记录写入缓冲至今的时间")
+SPOOL_FSYNC_DURATION = REGISTRY.histogram(
+    "spool_fsync_duration_seconds", "本地缓冲 fsync 耗时")
@@ -0,0 +1,98 @@
+import logging
+import sys
+import threading
+import time
+from collections import Counter as _StackCounter
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SamplingProfiler:
+    """
+    采样分析器
+
+    后台线程按固定间隔抓取所有线程的调用栈并累计次数，
+    输出为 flamegraph.pl / speedscope 可直接读取的折叠栈（collapsed stack）格式。
+    只在需要排查热点时开启，关闭后不产生任何开销。
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        """
+        参数:
+            interval: 采样间隔（秒）
+            max_depth: 每个调用栈最多记录的帧数
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self._stacks = _StackCounter()
+        self._samples = 0
+        self._started_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if self.running:
+                return
+            self._stop_event.clear()
+            self._started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        logger.info("采样分析器已启动，间隔 %.1fms", self.interval * 1000)
+
+    def stop(self):
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join()
+        logger.info("采样分析器已停止，共采样 %d 次", self._samples)
+
+    def reset(self):
+        with self._lock:
+            self._stacks.clear()
+            self._samples = 0
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, frame in frames.items():
+                    if ident == own_ident:
+                        continue
+                    self._stacks[self._fold(frame)] += 1
+                self._samples += 1
+
+    def _fold(self, frame) -> str:
+        parts = []
+        depth = 0
+        while frame is not None and depth < self.max_depth:
+            code = frame.f_code
+            parts.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+            frame = frame.f_back
+            depth += 1
+        parts.reverse()
+        return ";".join(parts)
+
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "samples": self._samples,
+            "started_at": self._started_at,
+        }
+
+    def collapsed(self) -> str:
+        """以折叠栈格式导出采样结果，按次数降序"""
+        with self._lock:
+            items = self._stacks.most_common()
+        return "\n".join(f"{stack} {count}" for stack, count in items) + "\n"
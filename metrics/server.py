@@ -0,0 +1,33 @@
+import logging
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from .registry import REGISTRY, Registry
+
+logger = logging.getLogger(__name__)
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port: int, host: str = "0.0.0.0", registry: Registry = REGISTRY) -> WSGIServer:
+    """
+    在后台线程中启动独立的指标 HTTP 服务
+
+    用于没有 Flask 应用的进程（如行情接入进程），任意路径均返回 Prometheus 文本格式指标
+    """
+    def app(environ, start_response):
+        body = registry.render().encode("utf-8")
+        start_response("200 OK", [
+            ("Content-Type", "text/plain; version=0.0.4; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+        ])
+        return [body]
+
+    server = make_server(host, port, app, handler_class=_QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info("指标服务已启动: http://%s:%d/metrics", host, port)
+    return server
@@ -1,6 +1,7 @@
 import yagmail
 import logging
-from datetime import datetime, timedelta
+import threading
+from datetime import timedelta
 from config import QQ_SMTP_SERVER, QQ_SMTP_PORT, QQ_SENDER_EMAIL, QQ_SENDER_PASSWORD, QQ_RECEIVER_EMAIL
 
 class EmailNotifier:
@@ -9,20 +10,39 @@ class EmailNotifier:
         self.last_email_time = None
         self.email_cooldown = timedelta(minutes=5)  # 邮件发送冷却时间
         
-        # 初始化yagmail SMTP客户端
-        try:
-            self.yag = yagmail.SMTP(
-                user=QQ_SENDER_EMAIL,
-                password=QQ_SENDER_PASSWORD,
-                host=QQ_SMTP_SERVER,
-                port=QQ_SMTP_PORT,
-                smtp_ssl=True,
-                smtp_starttls=False
-            )
-            self.logger.info("邮件客户端初始化成功")
-        except Exception as e:
-            self.logger.error(f"邮件客户端初始化失败: {e}")
-            self.yag = None
+        self.yag = None
+        self._lock = threading.Lock()
+
+    def connect(self) -> bool:
+        """
+        登录SMTP服务器
+
+        登录需要一次网络往返，不在构造函数中执行；启动时可在后台并行调用，
+        未调用时首次发送邮件会自动登录
+
+        Returns:
+            bool: 登录是否成功
+        """
+        with self._lock:
+            if self.yag:
+                return True
+            # 初始化yagmail SMTP客户端
+            try:
+                self.yag = yagmail.SMTP(
+                    user=QQ_SENDER_EMAIL,
+                    password=QQ_SENDER_PASSWORD,
+                    host=QQ_SMTP_SERVER,
+                    port=QQ_SMTP_PORT,
+                    smtp_ssl=True,
+                    smtp_starttls=False
+                )
+                # 提前完成登录握手，避免首封通知邮件承担登录延迟
+                self.yag.login()
+                self.logger.info("邮件客户端初始化成功")
+            except Exception as e:
+                self.logger.error(f"邮件客户端初始化失败: {e}")
+                self.yag = None
+            return self.yag is not None
 
     def send_email(self, subject: str, content: str) -> bool:
         """
@@ -36,7 +56,7 @@ class EmailNotifier:
             bool: 发送是否成功
         """
         try:
-            if self.yag:
+            if self.yag or self.connect():
                 self.yag.send(to=QQ_RECEIVER_EMAIL,
                             subject=subject, 
                             contents=content)
@@ -2,4 +2,8 @@ from .base_pattern import BasePatternDetector
 from .hammer_pattern import HammerPatternDetector
 from .doji_pattern import DojiPatternDetector
 from .inverted_hammer_pattern import InvertedHammerPatternDetector
-from .candle_data import CandleData
\ No newline at end of file
+from .candle_data import CandleData
+from .pattern_result import PatternResult
+from .pipeline import PatternPipeline
+from .rules import Rule, RuleSet, RuleStream, RuleSyntaxError
+from .candlestick_rules import builtin_rules, hammer_rule, doji_rule, inverted_hammer_rule
@@ -38,6 +38,15 @@ class BasePatternDetector:
         self.min_consecutive_lower_lows = min_consecutive_lower_lows
         self.previous_candles: List[CandleData] = []
 
+    def required_indicators(self) -> list:
+        """
+        声明检测所需的技术指标（indicators.Indicator 实例）
+
+        PatternPipeline 会合并所有检测器声明的指标，每根K线只计算一次，
+        并以 {indicator.key: 值} 的形式传给 detect() 的 indicators 参数
+        """
+        return []
+
     def is_downtrend(self) -> bool:
         """
         检查是否处于下跌趋势，且至少有一根K线下跌幅度超过0.5%
@@ -7,4 +7,5 @@ class CandleData:
     high: float      # 最高价
     low: float       # 最低价
     close: float     # 收盘价
+    volume: float = 0.0  # 成交量（VWAP 等指标需要）
 
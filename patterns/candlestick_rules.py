@@ -0,0 +1,111 @@
+"""
+内置K线形态规则
+
+单根形态（锤子线、十字星、倒垂线）的阈值可通过参数调整，与对应检测器的默认值一致；
+多根形态的表达式参考常见的技术分析定义
+"""
+from .rules import Rule, RuleSet
+
+
+def hammer_rule(min_lower_shadow: float = 0.6, max_upper_shadow: float = 1.5) -> Rule:
+    """锤子线：下影线足够长，上影线不过长"""
+    return Rule(
+        "Hammer",
+        "lower_shadow >= body * min_lower_shadow and upper_shadow <= body * max_upper_shadow",
+        desc="锤子形态",
+        params={"min_lower_shadow": min_lower_shadow, "max_upper_shadow": max_upper_shadow},
+    )
+
+
+def inverted_hammer_rule(min_upper_shadow: float = 0.6, max_lower_shadow: float = 1.5) -> Rule:
+    """倒垂线：阳线，上影线足够长，下影线不过长"""
+    return Rule(
+        "Inverted Hammer",
+        "upper_shadow >= body * min_upper_shadow and lower_shadow <= body * max_lower_shadow and close > open",
+        desc="倒垂线",
+        params={"min_upper_shadow": min_upper_shadow, "max_lower_shadow": max_lower_shadow},
+    )
+
+
+def doji_rule(body_ratio_threshold: float = 0.1) -> Rule:
+    """十字星：实体占总高度的比例不超过阈值（总高度为0时视为十字星）"""
+    return Rule(
+        "Doji",
+        "range <= 0 or body / range <= body_ratio_threshold",
+        desc="十字星",
+        params={"body_ratio_threshold": body_ratio_threshold},
+    )
+
+
+BULLISH_ENGULFING = Rule(
+    "Bullish Engulfing",
+    "close[-1] < open[-1] and close > open and open <= close[-1] and close >= open[-1] and body > body[-1]",
+    desc="看涨吞没",
+)
+
+BEARISH_ENGULFING = Rule(
+    "Bearish Engulfing",
+    "close[-1] > open[-1] and close < open and open >= close[-1] and close <= open[-1] and body > body[-1]",
+    desc="看跌吞没",
+)
+
+BULLISH_HARAMI = Rule(
+    "Bullish Harami",
+    "close[-1] < open[-1] and close > open and open > close[-1] and close < open[-1]",
+    desc="看涨孕线",
+)
+
+BEARISH_HARAMI = Rule(
+    "Bearish Harami",
+    "close[-1] > open[-1] and close < open and open < close[-1] and close > open[-1]",
+    desc="看跌孕线",
+)
+
+MORNING_STAR = Rule(
+    "Morning Star",
+    "close[-2] < open[-2] and body[-2] >= range[-2] * 0.5"
+    " and body[-1] <= body[-2] * 0.3 and max(open[-1], close[-1]) < close[-2]"
+    " and close > open and close > (open[-2] + close[-2]) / 2",
+    desc="早晨之星",
+)
+
+EVENING_STAR = Rule(
+    "Evening Star",
+    "close[-2] > open[-2] and body[-2] >= range[-2] * 0.5"
+    " and body[-1] <= body[-2] * 0.3 and min(open[-1], close[-1]) > close[-2]"
+    " and close < open and close < (open[-2] + close[-2]) / 2",
+    desc="黄昏之星",
+)
+
+THREE_WHITE_SOLDIERS = Rule(
+    "Three White Soldiers",
+    "close[-2] > open[-2] and close[-1] > open[-1] and close > open"
+    " and close[-2] < close[-1] < close"
+    " and open[-2] < open[-1] <= close[-2] and open[-1] < open <= close[-1]",
+    desc="红三兵",
+)
+
+THREE_BLACK_CROWS = Rule(
+    "Three Black Crows",
+    "close[-2] < open[-2] and close[-1] < open[-1] and close < open"
+    " and close[-2] > close[-1] > close"
+    " and open[-2] > open[-1] >= close[-2] and open[-1] > open >= close[-1]",
+    desc="三只乌鸦",
+)
+
+
+def builtin_rules() -> RuleSet:
+    """全部内置规则（单根形态使用默认阈值）"""
+    return RuleSet([
+        hammer_rule(),
+        inverted_hammer_rule(),
+        doji_rule(),
+        BULLISH_ENGULFING,
+        BEARISH_ENGULFING,
+        BULLISH_HARAMI,
+        BEARISH_HARAMI,
+        MORNING_STAR,
+        EVENING_STAR,
+        THREE_WHITE_SOLDIERS,
+        THREE_BLACK_CROWS,
+    ])
@@ -1,28 +1,10 @@
-from dataclasses import dataclass
-from typing import Optional, List
-from datetime import datetime
+from .candle_data import CandleData
+from .pattern_result import PatternResult
+from .candlestick_rules import doji_rule
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class CandleData:
-    """K线数据结构"""
-    open: float      # 开盘价
-    high: float      # 最高价
-    low: float       # 最低价
-    close: float     # 收盘价
-    volume: float    # 成交量
-    datetime: datetime  # 时间戳
-
-@dataclass
-class PatternResult:
-    """形态识别结果数据结构"""
-    pattern_name: str    # 形态名称
-    is_detected: bool    # 是否检测到形态
-    datetime: datetime   # 时间戳
-    additional_info: Optional[dict] = None  # 额外信息（可选）
-
 class DojiPatternDetector:
     """十字星形态检测器"""
     def __init__(self, body_ratio_threshold: float = 0.1):
@@ -33,8 +15,12 @@ class DojiPatternDetector:
             body_ratio_threshold: 实体与总高度的最大比例（默认：0.1）
         """
         self.body_ratio_threshold = body_ratio_threshold
+        self.rule = doji_rule(body_ratio_threshold)
+
+    def required_indicators(self) -> list:
+        return []
  
-    def detect(self, data: CandleData) -> PatternResult:
+    def detect(self, data: CandleData, indicators: dict = None) -> PatternResult:
         """
         检测当前K线是否形成十字星形态
         
@@ -44,26 +30,9 @@ class DojiPatternDetector:
         返回:
             PatternResult对象，包含检测结果
         """
-        # 计算K线各组成部分
-        body = abs(data.close - data.open)  # 实体长度
-        total_height = data.high - data.low  # 总高度
-        
-        # 计算实体比例
-        body_ratio = body / total_height if total_height > 0 else 0
-        
-        # 十字星形态判断条件
-        is_doji = (
-            body_ratio <= self.body_ratio_threshold
-        )
-        
-        # 返回检测结果
+        # 实体 / 总高度 <= body_ratio_threshold（总高度为0时视为十字星）
         return PatternResult(
-            pattern_name="Doji",  # 形态名称：十字星
-            is_detected=is_doji,  # 是否检测到十字星
-            datetime=data.datetime,  # 时间戳
-            additional_info={       # 额外信息
-                "body_ratio": body_ratio,    # 实体比例
-                "body": body,                # 实体长度
-                "total_height": total_height  # 总高度
-            }
-        ) 
\ No newline at end of file
+            pattern_name=self.rule.name,  # 形态名称：十字星
+            pattern_desc=self.rule.desc,
+            is_detected=self.rule.evaluate_bar(data)  # 是否检测到十字星
+        )
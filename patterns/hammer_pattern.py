@@ -1,5 +1,7 @@
 from .candle_data import CandleData
 from .pattern_result import PatternResult
+from .candlestick_rules import hammer_rule
+from indicators import EMA
 import logging
 
 logger = logging.getLogger(__name__)
@@ -7,28 +9,39 @@ logger = logging.getLogger(__name__)
 class HammerPatternDetector:
 
     """锤子线形态检测器"""
-    def __init__(self):
+    def __init__(self, trend_period: int = 0):
+        """
+        参数:
+            trend_period: 大于0时要求收盘价低于该周期的EMA（处于下跌趋势），0 表示不做趋势过滤
+        """
         self.min_lower_shadow = 0.6
         self.max_upper_shadow = 1.5
+        self.trend_period = trend_period
+        self.trend_ema = EMA(trend_period) if trend_period > 0 else None
+        self.rule = hammer_rule(self.min_lower_shadow, self.max_upper_shadow)
 
-    def detect(self, data: CandleData) -> PatternResult:
+    def required_indicators(self) -> list:
+        return [self.trend_ema] if self.trend_ema is not None else []
+
+    def detect(self, data: CandleData, indicators: dict = None) -> PatternResult:
         """
         检测当前K线是否形成锤子线形态
+
+        参数:
+            data: K线数据
+            indicators: 指标当前值 {key: 值}，开启趋势过滤时需要包含 trend_ema
         """
-        # 计算K线各组成部分
-        body = abs(data.close - data.open)                     # 实体长度
-        upper_shadow = data.high - max(data.open, data.close)  # 上影线长度
-        lower_shadow = min(data.open, data.close) - data.low   # 下影线长度
-        
-        # 锤子线形态判断条件
-        is_hammer = (
-            lower_shadow >= body * self.min_lower_shadow and  # 下影线长度要求
-            upper_shadow <= body * self.max_upper_shadow  # 上影线长度要求
-        )
+        # 下影线长度 >= 实体 * min_lower_shadow 且 上影线长度 <= 实体 * max_upper_shadow
+        is_hammer = self.rule.evaluate_bar(data)
+
+        # 趋势过滤：EMA 尚未预热（NaN）时比较结果为 False，不判定为锤子线
+        if is_hammer and self.trend_ema is not None:
+            ema = (indicators or {}).get(self.trend_ema.key, float("nan"))
+            is_hammer = data.close < ema
         
         # 返回检测结果
         return PatternResult(
-            pattern_name="Hammer",  # 形态名称：锤子线
-            pattern_desc="锤子形态",
+            pattern_name=self.rule.name,  # 形态名称：锤子线
+            pattern_desc=self.rule.desc,
             is_detected=is_hammer  # 是否检测到锤子线
-        )
\ No newline at end of file
+        )
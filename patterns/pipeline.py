@@ -0,0 +1,39 @@
+from typing import List
+
+from indicators import IndicatorSet
+from .candle_data import CandleData
+from .pattern_result import PatternResult
+from .rules import RuleSet
+
+
+class PatternPipeline:
+    """
+    实时形态检测流水线
+
+    汇总所有检测器声明的指标，每根K线先统一更新一次指标，再依次调用各检测器；
+    传入 rules 时，多根K线形态规则共享同一个环形缓冲区一起求值
+    """
+
+    def __init__(self, detectors: list, rules: RuleSet = None):
+        self.detectors = detectors
+        self.indicators = IndicatorSet.for_detectors(detectors)
+        self.rules = rules
+        self.rule_stream = rules.stream() if rules is not None else None
+
+    def on_bar(self, candle: CandleData) -> List[PatternResult]:
+        """
+        输入一根已确认的K线，返回所有检测器与规则的结果
+        """
+        values = self.indicators.update(candle)
+        results = [detector.detect(candle, values) for detector in self.detectors]
+        if self.rule_stream is not None:
+            matched = self.rule_stream.update(candle)
+            results.extend(
+                PatternResult(pattern_name=rule.name, pattern_desc=rule.desc, is_detected=matched[rule.name])
+                for rule in self.rules
+            )
+        return results
+
+    def detected(self, candle: CandleData) -> List[PatternResult]:
+        """只返回检测到的形态"""
+        return [result for result in self.on_bar(candle) if result.is_detected]
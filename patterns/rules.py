@@ -0,0 +1,323 @@
+"""
+声明式K线形态规则
+
+规则是一个基于相对K线偏移的布尔表达式，例如:
+
+    close[-1] < open[-1] and close > open and body[0] > 2 * body[-1]
+
+- 可用序列: open high low close volume body upper_shadow lower_shadow range
+- [0] 表示当前K线（可省略），[-1] 表示上一根，依此类推
+- 支持 and / or / not、比较运算（含链式比较）、+ - * /、abs / min / max，以及通过 params 传入的具名常量
+
+同一条规则会被编译为两种等价的形式:
+- 向量化表达式: 对整段历史的 NumPy 数组一次性求值（RuleSet.scan）
+- 标量表达式: 在环形缓冲区上逐根求值（RuleStream.update / Rule.evaluate_bar）
+"""
+import ast
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+# 基础行情列与派生列
+BASE_SERIES = ("open", "high", "low", "close", "volume")
+DERIVED_SERIES = ("body", "upper_shadow", "lower_shadow", "range")
+SERIES = BASE_SERIES + DERIVED_SERIES
+
+_COMPARE_OPS = {
+    ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=", ast.Eq: "==", ast.NotEq: "!=",
+}
+_BIN_OPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/"}
+
+
+class RuleSyntaxError(ValueError):
+    """规则表达式不合法"""
+
+
+def ref_key(field: str, offset: int) -> str:
+    return f"{field}@{offset}"
+
+
+class _Compiler:
+    """将规则 AST 转换为向量化或标量的 Python 表达式源码"""
+
+    def __init__(self, expression: str, params: Mapping[str, float]):
+        self.expression = expression
+        self.params = params
+        self.refs: Set[Tuple[str, int]] = set()
+        try:
+            self.tree = ast.parse(expression, mode="eval")
+        except SyntaxError as e:
+            raise RuleSyntaxError(f"规则语法错误: {expression}: {e.msg}") from None
+
+    def compile(self, vector: bool) -> str:
+        self.vector = vector
+        return self._visit(self.tree.body)
+
+    def _error(self, node, message: str):
+        raise RuleSyntaxError(f"{message}: {ast.unparse(node) if hasattr(ast, 'unparse') else node} （规则: {self.expression}）")
+
+    def _offset(self, node) -> int:
+        if isinstance(node, getattr(ast, "Index", ())):  # Python 3.8
+            node = node.value
+        if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+            value = node.value
+        elif (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)
+              and isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, int)):
+            value = -node.operand.value
+        else:
+            self._error(node, "下标必须是 0 或负整数")
+        if value > 0:
+            self._error(node, "不能引用未来的K线")
+        return -value
+
+    def _ref(self, field: str, offset: int) -> str:
+        self.refs.add((field, offset))
+        return f'v["{ref_key(field, offset)}"]'
+
+    def _visit(self, node) -> str:
+        if isinstance(node, ast.BoolOp):
+            joiner = (" & " if isinstance(node.op, ast.And) else " | ") if self.vector else \
+                     (" and " if isinstance(node.op, ast.And) else " or ")
+            return "(" + joiner.join(self._visit(v) for v in node.values) + ")"
+        if isinstance(node, ast.UnaryOp):
+            operand = self._visit(node.operand)
+            if isinstance(node.op, ast.Not):
+                return f"(~{operand})" if self.vector else f"(not {operand})"
+            if isinstance(node.op, ast.USub):
+                return f"(-{operand})"
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            self._error(node, "不支持的一元运算")
+        if isinstance(node, ast.BinOp):
+            op = _BIN_OPS.get(type(node.op))
+            if op is None:
+                self._error(node, "不支持的运算符")
+            return f"({self._visit(node.left)} {op} {self._visit(node.right)})"
+        if isinstance(node, ast.Compare):
+            operands = [self._visit(node.left)] + [self._visit(c) for c in node.comparators]
+            parts = []
+            for i, op in enumerate(node.ops):
+                symbol = _COMPARE_OPS.get(type(op))
+                if symbol is None:
+                    self._error(node, "不支持的比较运算")
+                parts.append(f"({operands[i]} {symbol} {operands[i + 1]})")
+            if len(parts) == 1:
+                return parts[0]
+            return "(" + (" & " if self.vector else " and ").join(parts) + ")"
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in ("abs", "min", "max") or node.keywords:
+                self._error(node, "只支持 abs / min / max 函数")
+            args = [self._visit(a) for a in node.args]
+            name = node.func.id
+            if name == "abs":
+                if len(args) != 1:
+                    self._error(node, "abs 只接受一个参数")
+                return f"np.abs({args[0]})" if self.vector else f"abs({args[0]})"
+            if len(args) < 2:
+                self._error(node, f"{name} 至少需要两个参数")
+            if not self.vector:
+                return f"{name}({', '.join(args)})"
+            func = "np.minimum" if name == "min" else "np.maximum"
+            result = args[0]
+            for arg in args[1:]:
+                result = f"{func}({result}, {arg})"
+            return result
+        if isinstance(node, ast.Subscript):
+            if not isinstance(node.value, ast.Name) or node.value.id not in SERIES:
+                self._error(node, "只能对行情序列取下标")
+            return self._ref(node.value.id, self._offset(node.slice))
+        if isinstance(node, ast.Name):
+            if node.id in self.params:
+                return repr(float(self.params[node.id]))
+            if node.id in SERIES:
+                return self._ref(node.id, 0)
+            self._error(node, "未知的名称")
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return repr(float(node.value))
+        self._error(node, "不支持的表达式")
+
+
+_NAMESPACE = {"np": np, "abs": abs, "min": min, "max": max, "__builtins__": {}}
+
+
+class Rule:
+    """
+    一条形态规则
+
+    参数:
+        name: 规则名称（英文标识）
+        expression: 规则表达式
+        desc: 中文描述
+        params: 表达式中可使用的具名常量
+    """
+
+    def __init__(self, name: str, expression: str, desc: str = "", params: Optional[Mapping[str, float]] = None):
+        self.name = name
+        self.expression = expression
+        self.desc = desc or name
+        self.params = dict(params or {})
+        compiler = _Compiler(expression, self.params)
+        self.vector_source = compiler.compile(vector=True)
+        self.scalar_source = compiler.compile(vector=False)
+        self.refs = frozenset(compiler.refs)
+        # 需要回看的K线数量
+        self.lookback = max((offset for _, offset in self.refs), default=0)
+        self._vector = eval(compile(f"lambda v: {self.vector_source}", f"<rule {name}>", "eval"), _NAMESPACE)
+        self._scalar = eval(compile(f"lambda v: {self.scalar_source}", f"<rule {name}>", "eval"), _NAMESPACE)
+
+    def __repr__(self):
+        return f"Rule({self.name!r}, {self.expression!r})"
+
+    def __reduce__(self):
+        # 编译结果不能序列化，传给子进程时按表达式重新编译
+        return Rule, (self.name, self.expression, self.desc, self.params)
+
+    def evaluate_vector(self, series: Mapping[str, np.ndarray]) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = np.asarray(self._vector(series), dtype=bool)
+        if self.lookback:
+            result[:self.lookback] = False
+        return result
+
+    def evaluate_scalar(self, values: Mapping[str, float]) -> bool:
+        try:
+            return bool(self._scalar(values))
+        except ZeroDivisionError:
+            # 与向量化版本一致：除零得到 inf/nan，此处按比较为 False 处理
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return bool(self._vector({k: np.float64(x) for k, x in values.items()}))
+
+    def evaluate_bar(self, candle) -> bool:
+        """对单根K线求值，只适用于不回看的规则"""
+        if self.lookback:
+            raise ValueError(f"规则 {self.name} 需要回看 {self.lookback} 根K线，请使用 RuleStream")
+        features = bar_features(candle)
+        return self.evaluate_scalar({ref_key(field, 0): features[field] for field, _ in self.refs})
+
+
+def bar_features(candle) -> Dict[str, float]:
+    """计算单根K线的基础列与派生列，运算与 series_features 逐元素一致"""
+    o, h, l, c = float(candle.open), float(candle.high), float(candle.low), float(candle.close)
+    return {
+        "open": o, "high": h, "low": l, "close": c,
+        "volume": float(getattr(candle, "volume", 0.0) or 0.0),
+        "body": abs(c - o),
+        "upper_shadow": h - max(o, c),
+        "lower_shadow": min(o, c) - l,
+        "range": h - l,
+    }
+
+
+class _SeriesCache(dict):
+    """按需计算并缓存派生列与位移后的数组，所有规则共享"""
+
+    def __init__(self, data: Mapping[str, np.ndarray]):
+        super().__init__()
+        self.data = data
+        self.length = len(data["close"])
+
+    def _base(self, field: str) -> np.ndarray:
+        key = ref_key(field, 0)
+        if key in self:
+            return self[key]
+        data = self.data
+        if field in BASE_SERIES:
+            value = np.asarray(data[field] if field in data else np.zeros(self.length), dtype=np.float64)
+        elif field == "body":
+            value = np.abs(self._base("close") - self._base("open"))
+        elif field == "upper_shadow":
+            value = self._base("high") - np.maximum(self._base("open"), self._base("close"))
+        elif field == "lower_shadow":
+            value = np.minimum(self._base("open"), self._base("close")) - self._base("low")
+        else:
+            value = self._base("high") - self._base("low")
+        self[key] = value
+        return value
+
+    def __missing__(self, key: str) -> np.ndarray:
+        field, _, offset = key.partition("@")
+        offset = int(offset)
+        base = self._base(field)
+        if offset == 0:
+            return base
+        shifted = np.full(self.length, np.nan)
+        if offset < self.length:
+            shifted[offset:] = base[:-offset]
+        self[key] = shifted
+        return shifted
+
+
+class RuleSet:
+    """
+    一组规则
+
+    批量扫描时所有规则共享同一份派生列与位移数组；实时求值时共享同一个环形缓冲区
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules: List[Rule] = list(rules)
+        names = [r.name for r in self.rules]
+        if len(names) != len(set(names)):
+            raise ValueError("规则名称不能重复")
+        self.lookback = max((r.lookback for r in self.rules), default=0)
+        self.refs = frozenset().union(*(r.refs for r in self.rules)) if self.rules else frozenset()
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def get(self, name: str) -> Optional[Rule]:
+        for rule in self.rules:
+            if rule.name == name:
+                return rule
+        return None
+
+    def scan(self, data: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        对整段历史批量求值
+
+        参数:
+            data: 包含 open/high/low/close（可选 volume）的 NumPy 数组字典
+
+        返回:
+            {规则名: 布尔数组}，回看不足的位置为 False
+        """
+        cache = _SeriesCache(data)
+        return {rule.name: rule.evaluate_vector(cache) for rule in self.rules}
+
+    def stream(self) -> "RuleStream":
+        return RuleStream(self)
+
+
+class RuleStream:
+    """
+    规则的实时求值器
+
+    环形缓冲区保存最近 lookback + 1 根K线的基础列与派生列，每根K线只计算一次派生列，
+    再由所有规则共享
+    """
+
+    def __init__(self, rule_set: RuleSet):
+        self.rule_set = rule_set
+        self.buffer = deque(maxlen=rule_set.lookback + 1)
+        self._refs = sorted(rule_set.refs, key=lambda r: r[1])
+
+    def reset(self):
+        self.buffer.clear()
+
+    def update(self, candle) -> Dict[str, bool]:
+        """
+        输入一根新K线，返回 {规则名: 是否命中}
+        """
+        buffer = self.buffer
+        buffer.append(bar_features(candle))
+        available = len(buffer)
+        values = {ref_key(field, offset): buffer[-1 - offset][field]
+                  for field, offset in self._refs if offset < available}
+        return {
+            rule.name: rule.lookback < available and rule.evaluate_scalar(values)
+            for rule in self.rule_set.rules
+        }
@@ -0,0 +1,127 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from config import SYMBOL, PROFILER_ENABLED, PROFILER_INTERVAL
+from metrics import STARTUP_PHASE_SECONDS
+from utils import lazy_property
+
+logger = logging.getLogger(__name__)
+
+
+class Runtime:
+    """
+    运行时子系统容器
+
+    所有子系统（数据库、邮件、行情后端、形态检测器等）在首次访问时才创建，
+    导入本模块和创建 Web 应用都不会产生网络连接；start() 并行初始化彼此独立的子系统
+    """
+
+    def __init__(self, **overrides):
+        """
+        参数:
+            overrides: 预先构造好的子系统，按属性名覆盖默认实现（如基准测试中注入 SQLite 替身）
+        """
+        self.symbol = SYMBOL
+        self.timings: Dict[str, float] = {}
+        self.__dict__.update(overrides)
+
+    @lazy_property
+    def candlestick_data_manager(self):
+        from db import CandlestickDataManager
+        return CandlestickDataManager()
+
+    @lazy_property
+    def email_notifier(self):
+        from notifications import EmailNotifier
+        return EmailNotifier()
+
+    @lazy_property
+    def backend(self):
+        from backends import create_backend
+        return create_backend()
+
+    @lazy_property
+    def profiler(self):
+        from metrics import SamplingProfiler
+        profiler = SamplingProfiler(interval=PROFILER_INTERVAL)
+        if PROFILER_ENABLED:
+            profiler.start()
+        return profiler
+
+    @lazy_property
+    def patterns(self):
+        from patterns import HammerPatternDetector
+        return [
+            HammerPatternDetector(),
+            # DojiPatternDetector(),
+            # InvertedHammerPatternDetector()
+        ]
+
+    @lazy_property
+    def watchlist(self):
+        from scanner import load_watchlist
+        return load_watchlist()
+
+    @lazy_property
+    def scanner(self):
+        from scanner import Scanner
+        return Scanner(self.candlestick_data_manager, self.watchlist)
+
+    @lazy_property
+    def scan_results(self):
+        from scanner import ScanResultStore
+        return ScanResultStore()
+
+    def warm_up_cache(self):
+        """查询最近一天的K线，预热数据库连接与缓冲池"""
+        end = datetime.now()
+        start = end - timedelta(days=1)
+        self.candlestick_data_manager.get_candlestick_data(
+            self.symbol, startTime=start.strftime('%Y-%m-%d %H:%M:%S'), endTime=end.strftime('%Y-%m-%d %H:%M:%S'))
+
+    def record_phase(self, phase: str, seconds: float):
+        self.timings[phase] = seconds
+        STARTUP_PHASE_SECONDS.labels(phase).set(seconds)
+
+    def _timed(self, phase: str, func: Callable):
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            self.record_phase(phase, time.perf_counter() - start)
+
+    def start(self, phases: Optional[Dict[str, Callable]] = None, required=("quote_ctx", "trade_ctx")):
+        """
+        并行初始化子系统，并记录各阶段耗时
+
+        参数:
+            phases: 阶段名到初始化函数的映射，默认初始化行情/交易上下文、登录SMTP、预热缓存、恢复本地缓冲
+            required: 失败时需要中止启动的阶段，其余阶段失败只记录日志
+        """
+        if phases is None:
+            phases = {
+                "quote_ctx": lambda: self.backend.quote_ctx,
+                "trade_ctx": lambda: self.backend.trade_ctx,
+                "smtp": lambda: self.email_notifier.connect(),
+                "cache_warmup": self.warm_up_cache,
+                "spool": lambda: self.candlestick_data_manager.writer,
+                "profiler": lambda: self.profiler,
+            }
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(phases), thread_name_prefix="startup") as executor:
+            futures = {phase: executor.submit(self._timed, phase, func) for phase, func in phases.items()}
+            errors = {}
+            for phase, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[phase] = e
+                    logger.error(f"启动阶段 {phase} 失败: {e}")
+        self.record_phase("startup_total", time.perf_counter() - start)
+        logger.info("启动耗时: %s", ", ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in self.timings.items()))
+        for phase in required:
+            if phase in errors:
+                raise errors[phase]
@@ -0,0 +1,81 @@
+import logging
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class Supervisor:
+    """
+    多进程守护
+
+    按给定命令启动子进程，子进程异常退出时按退避时间重启，收到 SIGTERM/SIGINT 时依次终止所有子进程
+    """
+
+    def __init__(self, commands: Dict[str, List[str]], max_backoff: float = 30.0):
+        """
+        参数:
+            commands: 进程名到命令行参数的映射
+            max_backoff: 重启退避的最大等待时间（秒）
+        """
+        self.commands = commands
+        self.max_backoff = max_backoff
+        self.processes: Dict[str, subprocess.Popen] = {}
+        self.backoff: Dict[str, float] = {name: 1.0 for name in commands}
+        self.started_at: Dict[str, float] = {}
+        self._stopping = False
+
+    def _spawn(self, name: str):
+        self.processes[name] = subprocess.Popen(self.commands[name])
+        self.started_at[name] = time.monotonic()
+        logger.info("已启动进程 %s (pid=%d): %s", name, self.processes[name].pid, " ".join(self.commands[name]))
+
+    def _handle_signal(self, signum, frame):
+        self._stopping = True
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        for name in self.commands:
+            self._spawn(name)
+        restart_at: Dict[str, float] = {}
+        while not self._stopping:
+            time.sleep(0.5)
+            now = time.monotonic()
+            for name, process in self.processes.items():
+                if name in restart_at:
+                    if now >= restart_at[name]:
+                        del restart_at[name]
+                        self._spawn(name)
+                    continue
+                code = process.poll()
+                if code is None:
+                    continue
+                # 稳定运行一段时间后再退出的进程，重新从最短退避开始
+                if now - self.started_at[name] > 60:
+                    self.backoff[name] = 1.0
+                delay = self.backoff[name]
+                self.backoff[name] = min(delay * 2, self.max_backoff)
+                restart_at[name] = now + delay
+                logger.error("进程 %s 退出（code=%s），%.0f 秒后重启", name, code, delay)
+        self.stop()
+
+    def stop(self):
+        for process in self.processes.values():
+            if process.poll() is None:
+                process.terminate()
+        deadline = time.monotonic() + 10
+        for name, process in self.processes.items():
+            try:
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                logger.warning("进程 %s 未能在超时时间内退出，强制结束", name)
+                process.kill()
+        logger.info("所有子进程已退出")
+
+
+def python_command(*args) -> List[str]:
+    return [sys.executable, *args]
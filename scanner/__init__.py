@@ -0,0 +1,3 @@
+from .evaluate import IndicatorFilter, ScanSpec, parse_filters, scan_symbol
+from .cache import BarCache
+from .service import Scanner, ScannerService, ScanResultStore, load_watchlist, period_seconds, rank
@@ -0,0 +1,90 @@
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable
+
+import numpy as np
+
+from config import PERIOD, SCANNER_LOOKBACK_BARS, SCANNER_LOOKBACK_DAYS, SCANNER_EMPTY_RETRY
+
+logger = logging.getLogger(__name__)
+
+
+class BarCache:
+    """
+    多股票K线缓存
+
+    首次加载时一次查询取回所有股票最近 lookback_days 天的K线；之后按各股票已缓存的最新时间分组，
+    每组只查询该时间之后的新K线（通常所有股票同一时间收盘，只有一组），每个股票最多保留 max_bars 根。
+    停牌股票单独成组，不会拉长其他股票的查询范围；没有数据的股票每 empty_retry 秒才重新查询一次
+    """
+
+    def __init__(self, candlestick_data_manager, period: str = PERIOD,
+                 max_bars: int = SCANNER_LOOKBACK_BARS, lookback_days: int = SCANNER_LOOKBACK_DAYS,
+                 empty_retry: float = SCANNER_EMPTY_RETRY):
+        self.candlestick_data_manager = candlestick_data_manager
+        self.period = period
+        self.max_bars = max_bars
+        self.lookback_days = lookback_days
+        self.empty_retry = empty_retry
+        self._bars: Dict[str, Dict[str, np.ndarray]] = {}
+        self._loaded = set()
+        # 没有数据的股票最近一次查询的时刻（time.monotonic）
+        self._empty_checked: Dict[str, float] = {}
+
+    def __len__(self):
+        return len(self._bars)
+
+    def clear(self):
+        self._bars.clear()
+        self._loaded.clear()
+        self._empty_checked.clear()
+
+    def get(self, symbol: str) -> Dict[str, np.ndarray]:
+        return self._bars.get(symbol)
+
+    def _merge(self, symbol: str, new: Dict[str, np.ndarray]):
+        old = self._bars.get(symbol)
+        if old is not None:
+            # 同一时间的K线只保留已缓存的一根
+            keep = new["timestamp"] > old["timestamp"][-1]
+            new = {key: np.concatenate((old[key], series[keep])) for key, series in new.items()}
+        self._bars[symbol] = {key: series[-self.max_bars:] for key, series in new.items()}
+
+    def refresh(self, symbols: Iterable[str], now: datetime = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        增量加载新K线，返回 {股票代码: K线数组}（没有数据的股票不包含在内）
+        """
+        symbols = list(dict.fromkeys(symbols))
+        floor = (now or datetime.now()) - timedelta(days=self.lookback_days)
+        checked_at = time.monotonic()
+
+        # 按查询起点分组：首次加载与到期重试的空股票从回看窗口起点查询，其余从各自缓存的最新时间查询
+        groups = defaultdict(list)
+        cold = 0
+        for symbol in symbols:
+            if symbol in self._bars:
+                groups[self._bars[symbol]["timestamp"][-1]].append(symbol)
+            elif symbol not in self._loaded:
+                groups[None].append(symbol)
+                cold += 1
+            elif checked_at - self._empty_checked.get(symbol, 0.0) >= self.empty_retry:
+                groups[None].append(symbol)
+
+        manager = self.candlestick_data_manager
+        for latest, group in groups.items():
+            since = floor if latest is None else datetime.fromtimestamp(latest)
+            for symbol, bars in manager.get_candlestick_bars(group, self.period, since=since).items():
+                self._merge(symbol, bars)
+            if latest is None:
+                self._loaded.update(group)
+                for symbol in group:
+                    if symbol in self._bars:
+                        self._empty_checked.pop(symbol, None)
+                    else:
+                        self._empty_checked[symbol] = checked_at
+        if cold:
+            logger.info("扫描器首次加载 %d 个股票的K线", cold)
+
+        return {s: self._bars[s] for s in symbols if s in self._bars}
@@ -0,0 +1,142 @@
+"""
+单个股票的扫描计算
+
+在进程池的子进程中执行，只依赖 NumPy、indicators 与 patterns，不访问数据库
+"""
+import math
+import operator
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from indicators import ATR, EMA, RSI, SMA, Indicator, IndicatorSet
+from patterns import RuleSet, builtin_rules
+
+_OPERATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne,
+}
+_FILTER = re.compile(r"^\s*(.+?)\s*(<=|>=|==|!=|<|>)\s*(-?[\d.]+(?:e-?\d+)?)\s*$")
+
+
+@dataclass(frozen=True)
+class IndicatorFilter:
+    """指标过滤条件，如 rsi(14,close) < 30；指标为 NaN（预热期）时视为不满足"""
+    key: str
+    op: str
+    value: float
+
+    def passes(self, values: Dict[str, float]) -> bool:
+        current = values.get(self.key)
+        if current is None or math.isnan(current):
+            return False
+        return _OPERATORS[self.op](current, self.value)
+
+    def __str__(self):
+        return f"{self.key}{self.op}{self.value:g}"
+
+
+def parse_filters(text: str) -> List[IndicatorFilter]:
+    """
+    解析分号分隔的过滤条件
+
+    示例: "rsi(14,close)<30;volume_ratio>=1.5"
+    """
+    filters = []
+    for part in filter(None, (p.strip() for p in (text or "").split(";"))):
+        match = _FILTER.match(part)
+        if match is None:
+            raise ValueError(f"无法解析的过滤条件: {part}")
+        key, op, value = match.groups()
+        filters.append(IndicatorFilter(key, op, float(value)))
+    return filters
+
+
+def default_indicators() -> List[Indicator]:
+    return [RSI(14), ATR(14), EMA(20), SMA(20, source="volume")]
+
+
+@dataclass
+class ScanSpec:
+    """
+    扫描内容：形态规则、指标与过滤条件
+
+    通过进程池 initializer 发送给每个子进程一次，规则在子进程中重新编译
+    """
+    rules: RuleSet = field(default_factory=builtin_rules)
+    indicators: List[Indicator] = field(default_factory=default_indicators)
+    filters: List[IndicatorFilter] = field(default_factory=list)
+    # 计算成交量放大倍数所用的均量指标
+    volume_average: str = "sma(20,volume)"
+
+    def __post_init__(self):
+        self.indicator_set = IndicatorSet(self.indicators)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("indicator_set", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__post_init__()
+
+
+def _finite(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+def scan_symbol(symbol: str, bars: Dict[str, np.ndarray], spec: ScanSpec) -> Optional[dict]:
+    """
+    计算一个股票最新一根K线的形态与指标
+
+    返回:
+        扫描结果行，不满足过滤条件或没有数据时返回 None
+    """
+    close = bars["close"]
+    if len(close) == 0:
+        return None
+
+    values = {key: float(series[-1]) for key, series in spec.indicator_set.batch(bars).items()}
+    average_volume = values.get(spec.volume_average, math.nan)
+    values["volume_ratio"] = float(bars["volume"][-1]) / average_volume if average_volume > 0 else math.nan
+    values["change_pct"] = (float(close[-1]) / float(close[-2]) - 1) * 100 if len(close) > 1 and close[-2] else math.nan
+    if not all(f.passes(values) for f in spec.filters):
+        return None
+
+    # 形态只看最新一根K线，截取规则需要的最短窗口即可
+    window = spec.rules.lookback + 1
+    matched = spec.rules.scan({key: series[-window:] for key, series in bars.items()})
+    patterns = [rule for rule in spec.rules if matched[rule.name][-1]]
+
+    return {
+        "symbol": symbol,
+        "time": datetime.fromtimestamp(bars["timestamp"][-1]).strftime("%Y-%m-%d %H:%M:%S") if "timestamp" in bars else None,
+        "close": float(close[-1]),
+        "patterns": [rule.name for rule in patterns],
+        "pattern_descs": [rule.desc for rule in patterns],
+        "score": len(patterns),
+        "indicators": {key: _finite(value) for key, value in values.items()},
+    }
+
+
+# 子进程中的扫描内容，由 init_worker 设置
+_worker_spec: Optional[ScanSpec] = None
+
+
+def init_worker(spec: ScanSpec):
+    global _worker_spec
+    _worker_spec = spec
+
+
+def scan_chunk(items: List[Tuple[str, Dict[str, np.ndarray]]]) -> List[dict]:
+    """子进程入口：扫描一批股票"""
+    rows = []
+    for symbol, bars in items:
+        row = scan_symbol(symbol, bars, _worker_spec)
+        if row is not None:
+            rows.append(row)
+    return rows
@@ -0,0 +1,222 @@
+import json
+import logging
+import math
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from config import PERIOD, WATCHLIST, WATCHLIST_FILE, SCANNER_WORKERS, SCANNER_DELAY, SCANNER_FILTERS
+from config import SCANNER_RESULT_PATH
+from metrics import SCANNER_DURATION, SCANNER_SYMBOLS, SCANNER_OVERRUNS
+from .cache import BarCache
+from .evaluate import ScanSpec, init_worker, parse_filters, scan_chunk
+
+logger = logging.getLogger(__name__)
+
+LOAD_DURATION = SCANNER_DURATION.labels("load")
+EVALUATE_DURATION = SCANNER_DURATION.labels("evaluate")
+TOTAL_DURATION = SCANNER_DURATION.labels("total")
+
+
+def period_seconds(period: str = PERIOD) -> int:
+    """Period.Min_2 -> 120"""
+    match = re.search(r"Min_(\d+)", period)
+    if match:
+        return int(match.group(1)) * 60
+    if period.endswith("Day"):
+        return 24 * 3600
+    if period.endswith("Week"):
+        return 7 * 24 * 3600
+    raise ValueError(f"不支持的K线周期: {period}")
+
+
+def load_watchlist(path: str = WATCHLIST_FILE) -> List[str]:
+    """读取股票列表文件，未配置文件时使用 WATCHLIST"""
+    if not path:
+        return list(WATCHLIST)
+    with open(path, encoding="utf-8") as f:
+        symbols = [line.split("#", 1)[0].strip() for line in f]
+    return list(dict.fromkeys(s for s in symbols if s))
+
+
+def rank(rows: List[dict]) -> List[dict]:
+    """按命中形态数量、成交量放大倍数降序排名"""
+    def key(row):
+        ratio = row["indicators"].get("volume_ratio")
+        return -row["score"], -(ratio if ratio is not None else -math.inf), row["symbol"]
+    rows = sorted(rows, key=key)
+    for i, row in enumerate(rows, 1):
+        row["rank"] = i
+    return rows
+
+
+class Scanner:
+    """
+    多股票形态扫描
+
+    K线由 BarCache 批量增量加载，计算按股票分批交给进程池；
+    workers 为 1 或股票数量较少时在当前进程内计算
+    """
+
+    def __init__(self, candlestick_data_manager, watchlist: List[str], spec: ScanSpec = None,
+                 workers: int = SCANNER_WORKERS, period: str = PERIOD):
+        self.watchlist = list(watchlist)
+        self.spec = spec if spec is not None else ScanSpec(filters=parse_filters(SCANNER_FILTERS))
+        self.workers = workers or os.cpu_count() or 1
+        self.period = period
+        self.cache = BarCache(candlestick_data_manager, period)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn 启动的子进程不继承父进程的线程与连接（行情 SDK、数据库），扫描内容只发送一次
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker, initargs=(self.spec,))
+        return self._pool
+
+    def warm_up(self):
+        """提前启动子进程，避免第一次扫描承担进程启动与导入耗时"""
+        if self.workers > 1:
+            list(self.pool.map(scan_chunk, [[] for _ in range(self.workers)]))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _evaluate(self, items: list) -> List[dict]:
+        if self.workers <= 1 or len(items) < self.workers * 2:
+            init_worker(self.spec)
+            return scan_chunk(items)
+        # 每个子进程分到约 4 批，兼顾序列化开销与负载均衡
+        size = max(math.ceil(len(items) / (self.workers * 4)), 1)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        rows = []
+        for chunk_rows in self.pool.map(scan_chunk, chunks):
+            rows.extend(chunk_rows)
+        return rows
+
+    def scan(self, now: datetime = None) -> dict:
+        """
+        全量扫描一次，返回排名结果
+        """
+        start = time.perf_counter()
+        bars = self.cache.refresh(self.watchlist, now=now)
+        loaded = time.perf_counter()
+        rows = rank(self._evaluate(list(bars.items())))
+        end = time.perf_counter()
+
+        LOAD_DURATION.observe(loaded - start)
+        EVALUATE_DURATION.observe(end - loaded)
+        TOTAL_DURATION.observe(end - start)
+        SCANNER_SYMBOLS.labels("watchlist").set(len(self.watchlist))
+        SCANNER_SYMBOLS.labels("loaded").set(len(bars))
+        SCANNER_SYMBOLS.labels("matched").set(len(rows))
+        if end - start > period_seconds(self.period):
+            SCANNER_OVERRUNS.inc()
+            logger.warning("扫描耗时 %.1fs 超过一个K线周期", end - start)
+
+        return {
+            "time": (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S"),
+            "period": self.period,
+            "symbols": len(self.watchlist),
+            "loaded": len(bars),
+            "filters": [str(f) for f in self.spec.filters],
+            "load_seconds": loaded - start,
+            "evaluate_seconds": end - loaded,
+            "duration_seconds": end - start,
+            "rows": rows,
+        }
+
+
+class ScanResultStore:
+    """
+    最近一次扫描结果
+
+    扫描进程原子地写入 JSON 文件，Web 进程读取；文件未变化时直接返回内存中的结果
+    """
+
+    def __init__(self, path: str = SCANNER_RESULT_PATH):
+        self.path = path
+        self._mtime = None
+        self._result = None
+        self._lock = threading.Lock()
+
+    def save(self, result: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def load(self) -> Optional[dict]:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if mtime != self._mtime:
+                with open(self.path, encoding="utf-8") as f:
+                    self._result = json.load(f)
+                self._mtime = mtime
+            return self._result
+
+
+class ScannerService:
+    """
+    定时扫描服务
+
+    每个K线周期收盘后 delay 秒扫描一次，结果写入 ScanResultStore 并通过 Socket.IO 的 scanner 事件推送
+    """
+
+    def __init__(self, scanner: Scanner, store: ScanResultStore, emit: Callable = None,
+                 delay: float = SCANNER_DELAY):
+        self.scanner = scanner
+        self.store = store
+        self.emit = emit
+        self.delay = delay
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> dict:
+        result = self.scanner.scan()
+        self.store.save(result)
+        if self.emit is not None:
+            self.emit("scanner", result)
+        logger.info("扫描完成：%d 个股票，命中 %d 个，耗时 %.2fs",
+                    result["loaded"], len(result["rows"]), result["duration_seconds"])
+        return result
+
+    def next_run(self, now: float) -> float:
+        """下一个K线周期收盘后 delay 秒的时刻"""
+        period = period_seconds(self.scanner.period)
+        return (math.floor((now - self.delay) / period) + 1) * period + self.delay
+
+    def run_forever(self):
+        self.scanner.warm_up()
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"扫描失败: {e}")
+            self._stop.wait(max(self.next_run(time.time()) - time.time(), 0))
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.run_forever, name="scanner", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.scanner.close()
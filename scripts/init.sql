@@ -12,10 +12,15 @@ CREATE TABLE IF NOT EXISTS `t_quotes` (
     `current_turnover` DECIMAL(20, 3) NOT NULL COMMENT '当前成交额',
     `timestamp` DATETIME NOT NULL COMMENT '最新价格时间',
     `create_time` DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
-    PRIMARY KEY (`id`),
-    KEY `idx_stock_code` (`stock_code`),
-    KEY `idx_timestamp` (`timestamp`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='实时行情表';
+    `row_key` BIGINT NULL COMMENT '写入标识，用于幂等写入',
+    PRIMARY KEY (`id`, `timestamp`),
+    KEY `idx_code_ts` (`stock_code`, `timestamp`),
+    UNIQUE KEY `uk_row_key` (`row_key`, `timestamp`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='实时行情表'
+-- 按天分区；建表后执行 python -m db.migrations 预建当前及未来分区，之后由 python -m db.retention 每天预建并清理过期分区
+PARTITION BY RANGE COLUMNS(`timestamp`) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
 
 
 CREATE TABLE IF NOT EXISTS `t_candlesticks` (
@@ -30,9 +35,14 @@ CREATE TABLE IF NOT EXISTS `t_candlesticks` (
     `volume` BIGINT NOT NULL COMMENT '成交量',
     `turnover` DECIMAL(20, 3) NOT NULL COMMENT '成交额',
     `timestamp` DATETIME NOT NULL COMMENT '最新价格时间',
-    PRIMARY KEY (`id`),
-    KEY `idx_stock_code` (`stock_code`),
-    KEY `idx_timestamp` (`timestamp`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='K线表';
+    `row_key` BIGINT NULL COMMENT '写入标识，用于幂等写入',
+    PRIMARY KEY (`id`, `timestamp`),
+    KEY `idx_code_period_ts` (`stock_code`, `period`, `timestamp`),
+    UNIQUE KEY `uk_row_key` (`row_key`, `timestamp`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='K线表'
+-- 按月分区；建表后执行 python -m db.migrations 预建当前及未来分区，之后由 python -m db.retention 每天预建并清理过期分区
+PARTITION BY RANGE COLUMNS(`timestamp`) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
 
 
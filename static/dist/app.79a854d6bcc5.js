@@ -0,0 +1 @@
+(function(){function App(){const chartContainerRef=React.useRef(null);const resizeObserver=React.useRef();const chart=React.useRef(null);const candleSeries=React.useRef(null);const[isPlaying,setIsPlaying]=React.useState(false);const[playbackIndex,setPlaybackIndex]=React.useState(0);const[autoPlay,setAutoPlay]=React.useState(false);const[startPlaybackTime,setStartPlaybackTime]=React.useState("");const[endPlaybackTime,setEndPlaybackTime]=React.useState("");const[playbackCandlestickData,setPlaybackCandlestickData]=React.useState([]);function getCandlestickData(t){return axios.post("/api/candlestick",{time:t?"realtime":"",startTime:startPlaybackTime,endTime:endPlaybackTime},{timeout:0})}function getPattern(data){return axios.post("/api/pattern",data)}function initData(success){getCandlestickData().then(res=>{const data=res.data.map(item=>{return{...item,time:new Date(item.time).getTime()}});candleSeries.current.setData(data);if(success&&typeof success==="function"){success()}})}function resetPlayback(){setAutoPlay(false);setIsPlaying(false);setPlaybackIndex(0)}const handlePlaybackNext=()=>{if(isPlaying&&playbackIndex<playbackCandlestickData.length){const nextIndex=playbackIndex+1;const nextCandlestick=playbackCandlestickData[nextIndex];candleSeries.current.update(nextCandlestick);setPlaybackIndex(nextIndex);getPattern(nextCandlestick).then(res=>{console.log(res)})}else{setIsPlaying(false)}};const handlePlaybackPrev=()=>{if(isPlaying&&playbackIndex>0){const prevIndex=playbackIndex-1;candleSeries.current.setData(playbackCandlestickData.slice(0,prevIndex));setPlaybackIndex(prevIndex)}};React.useEffect(()=>{const socket=io(window.origin);socket.on("candlestick",data=>{if(!isPlaying&&candleSeries.current){candleSeries.current.update({...data,time:new Date(data.time).getTime()})}});const chartOptions={width:chartContainerRef.current.clientWidth,height:chartContainerRef.current.clientHeight,layout:{background:{type:"solid",color:"#181B23"},textColor:"#D1D4DC",fontFamily:"Arial"},grid:{vertLines:{color:"#2c3b54"},horzLines:{color:"#2c3b54"}},crosshair:{mode:LightweightCharts.CrosshairMode.Normal},localization:{locale:"zh-CN",timeFormatter:timestamp=>{const date=new Date(timestamp);const year=date.getFullYear().toString();const month=(date.getMonth()+1).toString().padStart(2,"0");const day=date.getDate().toString().padStart(2,"0");const hours=date.getHours().toString().padStart(2,"0");const minutes=date.getMinutes().toString().padStart(2,"0");return`${year}-${month}-${day} ${hours}:${minutes}`}}};chart.current=LightweightCharts.createChart(chartContainerRef.current,chartOptions);candleSeries.current=chart.current.addSeries(LightweightCharts.CandlestickSeries,{upColor:"#ef5350",downColor:"#26a69a",borderVisible:false,wickUpColor:"#ef5350",wickDownColor:"#26a69a"});initData();return()=>{socket.disconnect();chart.current.remove()}},[]);React.useEffect(()=>{resizeObserver.current=new ResizeObserver(entries=>{const{width,height}=entries[0].contentRect;chart.current.applyOptions({width,height});setTimeout(()=>{chart.current.timeScale().fitContent()},0)});resizeObserver.current.observe(chartContainerRef.current);return()=>resizeObserver.current.disconnect()},[]);let interval=null;const handlePlayback=auto=>{if(isPlaying||autoPlay){initData();resetPlayback();if(interval){clearInterval(interval)}return}candleSeries.current.setData([]);setIsPlaying(true);setPlaybackIndex(0);if(auto){setAutoPlay(true);getCandlestickData(true).then(res=>{const data=res.data.map(item=>{return{...item,time:new Date(item.time).getTime()}});setPlaybackCandlestickData(data);let i=0;candleSeries.current.update(data[i]);interval=setInterval(()=>{i++;if(i<=data.length-1){const nextCandlestick=data[i];candleSeries.current.update(nextCandlestick)}},10)})}else{getCandlestickData().then(res=>{const data=res.data.map(item=>{return{...item,time:new Date(item.time).getTime()}});setPlaybackCandlestickData(data)})}};const handleBuy=()=>{console.log("\u505A\u591A")};const handleSell=()=>{console.log("\u505A\u7A7A")};const handleClose=()=>{console.log("\u5E73\u4ED3")};return React.createElement("div",{style:{width:"100%",height:"100%",display:"flex",padding:"12px"}},React.createElement("div",{ref:chartContainerRef,style:{width:"0",flex:1,height:"100%"}}),React.createElement("div",{style:{width:"400px",height:"100%",marginLeft:"12px",display:"flex",flexDirection:"column",gap:"12px"}},React.createElement("div",{className:"card"},React.createElement("h3",null,"TSLL"),React.createElement("p",{style:{fontSize:"12px",color:"rgba(255,255,255,0.5)"}},new Date().toLocaleString())),React.createElement("div",{className:"card"},React.createElement("h3",null,isPlaying?"K\u7EBF\u56DE\u653E":"\u6B63\u5E38\u6A21\u5F0F"),React.createElement("input",{type:"datetime-local",value:startPlaybackTime,onChange:e=>setStartPlaybackTime(e.target.value.replace("T"," "))}),React.createElement("input",{type:"datetime-local",style:{marginLeft:"4px"},value:endPlaybackTime,onChange:e=>setEndPlaybackTime(e.target.value.replace("T"," "))}),!isPlaying?React.createElement(React.Fragment,null,React.createElement("div",{className:"button",onClick:()=>handlePlayback(false)},"\u624B\u52A8\u56DE\u653E"),React.createElement("div",{className:"button",onClick:()=>handlePlayback(true),style:{marginLeft:"4px"}},"\u81EA\u52A8\u56DE\u653E")):React.createElement("div",{className:"button",onClick:handlePlayback},"\u6B63\u5E38\u6A21\u5F0F"),isPlaying&&!autoPlay?React.createElement(React.Fragment,null,React.createElement("div",{className:"button",style:{marginLeft:"4px"},onClick:handlePlaybackPrev},"\u4E0A\u4E00\u6839"),React.createElement("div",{className:"button",style:{marginLeft:"4px"},onClick:handlePlaybackNext},"\u4E0B\u4E00\u6839")):React.createElement(React.Fragment,null)),!isPlaying&&React.createElement("div",{className:"card"},React.createElement("h3",null,"\u5FEB\u6377\u64CD\u4F5C"),React.createElement("div",{className:"button buy",style:{marginLeft:"4px"},onClick:handleBuy},"\u505A\u591A"),React.createElement("div",{className:"button sell",style:{marginLeft:"4px"},onClick:handleSell},"\u505A\u7A7A"),React.createElement("div",{className:"button close",style:{marginLeft:"4px"},onClick:handleClose},"\u5E73\u4ED3"))))}const root=ReactDOM.createRoot(document.getElementById("root"));root.render(React.createElement(App,null));})();
@@ -2,23 +2,16 @@ import pandas as pd
 
 df = pd.read_csv('kline_data.csv')
 
-def is_uptrend(df, idx, n=3):
-    if idx < n:
-        return False
-    for i in range(idx-n, idx):
-        if df.iloc[i]['close'] <= df.iloc[i]['open']:
-            return False
-    return True
+# 前n根K线是否全部为阳线/阴线，整列一次性计算，避免每根K线都用 df.iloc 回看
+def trend_flags(df, n=3):
+    up = (df['close'] > df['open']).astype(int).rolling(n).sum().shift(1) == n
+    down = (df['close'] < df['open']).astype(int).rolling(n).sum().shift(1) == n
+    return up.tolist(), down.tolist()
 
-def is_downtrend(df, idx, n=3):
-    if idx < n:
-        return False
-    for i in range(idx-n, idx):
-        if df.iloc[i]['close'] >= df.iloc[i]['open']:
-            return False
-    return True
+# 按 df 预先计算的趋势标记，下标与 df 的行号一致
+uptrend, downtrend = trend_flags(df)
 
-def is_hammer_with_trend(row, idx, df):
+def is_hammer_with_trend(row, idx):
     body = abs(row['close'] - row['open'])
     lower_shadow = min(row['open'], row['close']) - row['low']
     upper_shadow = row['high'] - max(row['open'], row['close'])
@@ -27,9 +20,9 @@ def is_hammer_with_trend(row, idx, df):
         lower_shadow > body * 2 and
         upper_shadow < body
     )
-    return is_hammer and is_downtrend(df, idx)
+    return is_hammer and downtrend[idx]
 
-def is_inverted_hammer_with_trend(row, idx, df):
+def is_inverted_hammer_with_trend(row, idx):
     body = abs(row['close'] - row['open'])
     lower_shadow = min(row['open'], row['close']) - row['low']
     upper_shadow = row['high'] - max(row['open'], row['close'])
@@ -38,13 +31,13 @@ def is_inverted_hammer_with_trend(row, idx, df):
         upper_shadow > body * 2 and
         lower_shadow < body
     )
-    return is_inverted_hammer and is_uptrend(df, idx)
+    return is_inverted_hammer and uptrend[idx]
 
 df['is_hammer_with_trend'] = [
-    is_hammer_with_trend(row, idx, df) for idx, row in df.iterrows()
+    is_hammer_with_trend(row, idx) for idx, row in df.iterrows()
 ]
 df['is_inverted_hammer_with_trend'] = [
-    is_inverted_hammer_with_trend(row, idx, df) for idx, row in df.iterrows()
+    is_inverted_hammer_with_trend(row, idx) for idx, row in df.iterrows()
 ]
 print("锤子线:")
 print(df[df['is_hammer_with_trend']])
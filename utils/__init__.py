@@ -1,3 +1,4 @@
 from .logging import setup_logging
 from .dotenv import setup_dotenv
-from .common import is_not_empty
\ No newline at end of file
+from .common import is_not_empty
+from .lazy import lazy_property
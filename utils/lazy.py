@@ -0,0 +1,29 @@
+import threading
+
+
+class lazy_property:
+    """
+    线程安全的惰性属性
+
+    首次访问时才执行被装饰的方法并缓存结果，多个线程同时首次访问时只会执行一次
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        if self.name in cache:
+            return cache[self.name]
+        with self._lock:
+            if self.name not in cache:
+                cache[self.name] = self.func(instance)
+        return cache[self.name]
@@ -0,0 +1,59 @@
+import mimetypes
+import os
+import re
+
+from flask import Blueprint, abort, request, send_file
+from werkzeug.security import safe_join
+
+from .build_assets import DIST_DIR
+
+assets = Blueprint('assets', __name__)
+
+# 构建产物文件名中的内容哈希，内容变化时文件名随之变化，因此可以永久缓存
+_HASHED = re.compile(r'\.[0-9a-f]{12}\.\w+$')
+
+# 按优先级排列的预压缩格式
+_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+def send_asset(filename: str):
+    """
+    返回 static/dist 下的文件
+
+    - 客户端支持时优先返回预压缩的 .br / .gz
+    - 带内容哈希的文件设置一年的 immutable 缓存，其他文件（index.html）每次协商缓存
+    """
+    path = safe_join(DIST_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    encoding = None
+    for name, suffix in _ENCODINGS:
+        if request.accept_encodings[name] and os.path.isfile(path + suffix):
+            encoding, path = name, path + suffix
+            break
+
+    hashed = _HASHED.search(filename) is not None
+    response = send_file(path, mimetype=mimetype, conditional=True,
+                         max_age=IMMUTABLE_MAX_AGE if hashed else None)
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    if hashed:
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+
+@assets.route('/')
+def index():
+    return send_asset('index.html')
+
+
+@assets.route('/assets/<path:filename>')
+def asset(filename):
+    return send_asset(filename)
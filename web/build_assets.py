@@ -0,0 +1,203 @@
+"""
+前端生产构建
+
+将 frontend/ 下的 JSX 预编译为浏览器可直接执行的脚本，与 React 生产版等第三方库分别打包，
+输出带内容哈希的文件名与预压缩文件（.gz / .br）到 static/dist/，浏览器端不再需要 Babel。
+
+用法:
+    python -m web.build_assets
+
+需要 node（仅构建时，用于运行 frontend/vendor/babel.min.js）；安装了 brotli 时额外生成 .br
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+try:
+    import brotli
+except ImportError:  # 可选依赖，缺失时只生成 .gz
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRONTEND_DIR = os.path.join(ROOT_DIR, 'frontend')
+VENDOR_DIR = os.path.join(FRONTEND_DIR, 'vendor')
+DIST_DIR = os.path.join(ROOT_DIR, 'static', 'dist')
+
+# 第三方库按加载顺序合并为 vendor.js，全部使用生产版
+VENDOR_SCRIPTS = (
+    'react.production.min.js',
+    'react-dom.production.min.js',
+    'lightweight-charts.standalone.production.js',
+    'axios.min.js',
+    'socket.io.min.js',
+)
+
+# 需要预压缩的文件类型
+COMPRESSIBLE = ('.js', '.css', '.html', '.json')
+
+# 编译目标：交易终端使用的现代浏览器
+BABEL_TARGETS = {'chrome': '90', 'edge': '90', 'firefox': '90', 'safari': '14'}
+
+_BABEL_SCRIPT = """
+const Babel = require(process.argv[1]);
+const options = JSON.parse(process.argv[2]);
+let source = '';
+process.stdin.setEncoding('utf8');
+process.stdin.on('data', (chunk) => { source += chunk; });
+process.stdin.on('end', () => {
+  process.stdout.write(Babel.transform(source, options).code);
+});
+"""
+
+_SOURCE_MAP = re.compile(r'^//# sourceMappingURL=.*$', re.MULTILINE)
+
+
+def compile_jsx(source: str, filename: str) -> str:
+    """
+    使用本地 Babel 将 JSX 编译为压缩后的脚本
+    """
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError("构建前端需要 node，请先安装 Node.js")
+    options = {
+        'filename': filename,
+        'presets': [['env', {'targets': BABEL_TARGETS, 'modules': False}], ['react', {'runtime': 'classic'}]],
+        'comments': False,
+        'compact': True,
+        'minified': True,
+    }
+    result = subprocess.run(
+        [node, '-e', _BABEL_SCRIPT, os.path.join(VENDOR_DIR, 'babel.min.js'), json.dumps(options)],
+        input=source, capture_output=True, text=True, encoding='utf-8',
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"编译 {filename} 失败:\n{result.stderr}")
+    # 包一层函数作用域，避免顶层变量污染全局
+    return f"(function(){{{result.stdout}}})();\n"
+
+
+def minify_css(source: str) -> str:
+    """去掉注释与多余空白"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.DOTALL)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};:,>])\s*', r'\1', source)
+    return source.replace(';}', '}').strip() + '\n'
+
+
+def bundle_vendor() -> str:
+    parts = []
+    for name in VENDOR_SCRIPTS:
+        with open(os.path.join(VENDOR_DIR, name), encoding='utf-8') as f:
+            # 不发布 source map，去掉引用以免浏览器请求 404
+            parts.append(_SOURCE_MAP.sub('', f.read()).rstrip())
+    return ';\n'.join(parts) + ';\n'
+
+
+def hashed_name(name: str, content: bytes) -> str:
+    """app.js -> app.<内容哈希>.js"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def write_asset(path: str, content: bytes):
+    """写入文件及其预压缩版本（仅在压缩后更小时保留）"""
+    with open(path, 'wb') as f:
+        f.write(content)
+    if not path.endswith(COMPRESSIBLE):
+        return
+    # mtime=0 保证相同内容生成相同的 .gz
+    variants = [('.gz', gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(content, quality=11)))
+    for suffix, compressed in variants:
+        if len(compressed) < len(content):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+
+
+def build(dist_dir: str = DIST_DIR) -> dict:
+    """
+    构建前端并写入 dist_dir
+
+    返回:
+        manifest {逻辑文件名: 带哈希的文件名}
+    """
+    with open(os.path.join(FRONTEND_DIR, 'src', 'app.jsx'), encoding='utf-8') as f:
+        app_js = compile_jsx(f.read(), 'app.jsx')
+    with open(os.path.join(FRONTEND_DIR, 'src', 'app.css'), encoding='utf-8') as f:
+        app_css = minify_css(f.read())
+
+    assets = {
+        'vendor.js': bundle_vendor().encode('utf-8'),
+        'app.js': app_js.encode('utf-8'),
+        'app.css': app_css.encode('utf-8'),
+    }
+    manifest = {name: hashed_name(name, content) for name, content in assets.items()}
+
+    # 只替换之前构建生成的目录（含 manifest.json），避免 --out 写错时删除其他目录
+    dist_dir = os.path.abspath(dist_dir)
+    if os.path.isdir(dist_dir) and os.listdir(dist_dir) \
+            and not os.path.isfile(os.path.join(dist_dir, 'manifest.json')):
+        raise ValueError(f"{dist_dir} 不是前端构建目录（没有 manifest.json），拒绝覆盖")
+
+    # 先写入同级临时目录，完成后再替换，保证目录中只有当前版本且构建失败不影响旧版本
+    parent = os.path.dirname(dist_dir)
+    os.makedirs(parent, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix='.build-', dir=parent)
+    try:
+        for name, content in assets.items():
+            write_asset(os.path.join(build_dir, manifest[name]), content)
+
+        # index.html 不带哈希，由服务端以 no-cache 返回，引用带哈希的资源
+        with open(os.path.join(FRONTEND_DIR, 'index.html'), encoding='utf-8') as f:
+            index = f.read()
+        for name, hashed in manifest.items():
+            index = index.replace('{{ %s }}' % name, f'/assets/{hashed}')
+        write_asset(os.path.join(build_dir, 'index.html'), index.encode('utf-8'))
+
+        with open(os.path.join(build_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            f.write('\n')
+        os.chmod(build_dir, 0o755)
+
+        if os.path.isdir(dist_dir):
+            old_dir = tempfile.mkdtemp(prefix='.old-', dir=parent)
+            os.replace(dist_dir, os.path.join(old_dir, 'dist'))
+            os.replace(build_dir, dist_dir)
+            shutil.rmtree(old_dir)
+        else:
+            os.replace(build_dir, dist_dir)
+    finally:
+        if os.path.isdir(build_dir):
+            shutil.rmtree(build_dir)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="构建前端生产包")
+    parser.add_argument('--out', default=DIST_DIR, help="输出目录")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    try:
+        manifest = build(args.out)
+    except ValueError as e:
+        parser.error(str(e))
+    for name, hashed in manifest.items():
+        size = os.path.getsize(os.path.join(args.out, hashed))
+        logger.info(f"{name} -> {hashed} ({size / 1024:.1f} KB)")
+    if brotli is None:
+        logger.warning("未安装 brotli，只生成了 .gz 预压缩文件")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import os
+
+from flask import Flask
+from flask_socketio import SocketIO
+
+from runtime import Runtime
+from .assets import assets
+from .routes import api
+
+# 项目根目录，静态文件位于 static/
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_app(runtime: Runtime = None, async_mode: str = None, message_queue: str = None):
+    """
+    创建 Flask 应用与 Socket.IO 服务
+
+    只注册路由，不建立任何外部连接；子系统由 runtime 在首次使用时创建
+
+    参数:
+        runtime: 运行时子系统容器，默认新建
+        async_mode: Socket.IO 异步模型（threading / gevent / eventlet），默认自动选择
+        message_queue: 消息队列地址，多进程部署时所有进程通过它共享推送
+
+    返回:
+        (app, socketio)
+    """
+    runtime = runtime if runtime is not None else Runtime()
+    app = Flask(__name__, static_folder=os.path.join(ROOT_DIR, 'static'), static_url_path='/static')
+    app.extensions['runtime'] = runtime
+    app.register_blueprint(assets)
+    app.register_blueprint(api)
+    socketio = SocketIO(app, async_mode=async_mode, message_queue=message_queue or None)
+    return app, socketio
@@ -0,0 +1,125 @@
+import hmac
+import time
+from functools import wraps
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from config import PROFILER_TOKEN
+from metrics import REGISTRY, HTTP_REQUEST_DURATION, HTTP_REQUESTS
+from patterns import CandleData
+
+api = Blueprint('api', __name__)
+
+
+def get_runtime():
+    return current_app.extensions['runtime']
+
+
+def instrumented(endpoint: str):
+    """
+    记录接口耗时与状态的装饰器
+    """
+    duration = HTTP_REQUEST_DURATION.labels(endpoint)
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            status = 500
+            try:
+                response = func(*args, **kwargs)
+                status = getattr(response, 'status_code', 200)
+                return response
+            finally:
+                duration.observe(time.perf_counter() - start)
+                HTTP_REQUESTS.labels(endpoint, status).inc()
+        return wrapper
+    return decorator
+
+
+@api.route('/api/candlestick', methods=["POST"])
+@instrumented('/api/candlestick')
+def candlestick():
+    parmas = request.json
+    time = parmas['time']
+    startTime = parmas['startTime']
+    endTime = parmas['endTime']
+    runtime = get_runtime()
+    if time == "realtime":
+        return jsonify(runtime.candlestick_data_manager.get_candlestick_data(runtime.symbol, realtime=True, startTime=startTime, endTime=endTime))
+    else:
+        return jsonify(runtime.candlestick_data_manager.get_candlestick_data(runtime.symbol, realtime=False, startTime=startTime, endTime=endTime))
+
+
+@api.route('/api/pattern', methods=["POST"])
+@instrumented('/api/pattern')
+def pattern():
+    parmas = request.json
+    for pattern in get_runtime().patterns:
+        pattern_res = pattern.detect(CandleData(open=parmas['open'], high=parmas['high'], low=parmas['low'], close=parmas['close']))
+        if pattern_res.is_detected:
+            return jsonify({
+               "pattern_name":pattern_res.pattern_name,
+               "pattern_desc":pattern_res.pattern_desc,
+               "is_detected":pattern_res.is_detected
+            })
+    return jsonify({
+        "is_detected": False
+    })
+
+
+@api.route('/api/scanner')
+@instrumented('/api/scanner')
+def scanner():
+    """
+    最近一次扫描的排名结果，?limit=N 只返回前 N 名，?pattern=名称 只返回命中该形态的股票
+    """
+    result = get_runtime().scan_results.load()
+    if result is None:
+        response = jsonify({"rows": [], "message": "暂无扫描结果"})
+        response.status_code = 404
+        return response
+    rows = result["rows"]
+    pattern = request.args.get('pattern')
+    if pattern:
+        rows = [row for row in rows if pattern in row["patterns"]]
+    limit = request.args.get('limit', type=int)
+    if limit:
+        rows = rows[:limit]
+    return jsonify({**result, "rows": rows})
+
+
+@api.route('/metrics')
+def metrics():
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+
+def profiler_allowed() -> bool:
+    """
+    配置了 PROFILER_TOKEN 时校验请求头 X-Profiler-Token；
+    否则只允许本机直接访问，经反向代理转发（带 X-Forwarded-For）的请求一律拒绝
+    """
+    if PROFILER_TOKEN:
+        return hmac.compare_digest(request.headers.get('X-Profiler-Token', ''), PROFILER_TOKEN)
+    return request.remote_addr in ('127.0.0.1', '::1') and 'X-Forwarded-For' not in request.headers
+
+
+@api.route('/api/profiler', methods=["GET", "POST"])
+def profiler_toggle():
+    """
+    采样分析器开关
+
+    GET 返回折叠栈格式的采样结果，POST {"enabled": true/false, "reset": bool} 开启或关闭
+    """
+    if not profiler_allowed():
+        return jsonify({"error": "forbidden"}), 403
+    profiler = get_runtime().profiler
+    if request.method == "GET":
+        return Response(profiler.collapsed(), mimetype='text/plain; charset=utf-8')
+    parmas = request.json or {}
+    if parmas.get('reset'):
+        profiler.reset()
+    if parmas.get('enabled'):
+        profiler.start()
+    elif 'enabled' in parmas:
+        profiler.stop()
+    return jsonify(profiler.status())